@@ -0,0 +1,383 @@
+"""Benchmarks of the lookup, coercion and construction paths.
+
+Run all benchmarks and store the results as JSON::
+
+    python benchmarks/benchmark.py --output before.json
+
+Compare a later run with stored results::
+
+    python benchmarks/benchmark.py --compare before.json
+
+The exit status is 1 if a benchmark got slower than ``--threshold``.
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import timeit
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from conf2levels import (  # noqa: E402
+    CompiledSpec,
+    ConfigReader,
+    DictionaryReader,
+    EnvironReader,
+    IniReader,
+    InstrumentedReaderSelector,
+    ReaderSelector,
+    __version__,
+    auto_type,
+)
+from conf2levels.types import Spec  # noqa: E402
+
+Benchmark = Callable[[], Callable[[], Any]]
+"""A function which prepares a benchmark and returns the function to time."""
+
+BENCHMARKS: List[Tuple[str, Benchmark]] = []
+
+CLEANUPS: List[Callable[[], None]] = []
+"""Undo the side effects of the benchmark that is prepared or run, see
+:py:func:`run`."""
+
+
+def benchmark(name: str) -> Callable[[Benchmark], Benchmark]:
+    def register(function: Benchmark) -> Benchmark:
+        BENCHMARKS.append((name, function))
+        return function
+
+    return register
+
+
+def make_spec(keys: int, keys_per_section: int = 10) -> Spec:
+    spec: Spec = {}
+    for index in range(keys):
+        section = "section_{}".format(index // keys_per_section)
+        spec.setdefault(section, {})["key_{}".format(index)] = {
+            "description": "Key number {}".format(index),
+            "default": index,
+        }
+    return spec
+
+
+def temporary_directory() -> str:
+    """Create a directory which is removed after the benchmark."""
+    path = tempfile.mkdtemp(prefix="conf2levels-benchmark-")
+    CLEANUPS.append(lambda: shutil.rmtree(path, ignore_errors=True))
+    return path
+
+
+def write_ini(keys: int, keys_per_section: int = 10) -> str:
+    path = os.path.join(temporary_directory(), "config.ini")
+    with open(path, "w") as ini_file:
+        for index in range(keys):
+            if index % keys_per_section == 0:
+                ini_file.write("\n[section_{}]\n".format(index // keys_per_section))
+            ini_file.write("key_{} = value {}\n".format(index, index))
+    return path
+
+
+# ReaderSelector ##############################################################
+
+
+def selector(depth: int) -> ReaderSelector:
+    readers = [DictionaryReader({"other": {"key": "value"}}) for _ in range(depth - 1)]
+    readers.append(DictionaryReader({"email": {"smtp_server": "smtp.example.com"}}))
+    return ReaderSelector(*readers)
+
+
+for _depth in (1, 3, 5):
+
+    @benchmark("selector.get.hit.depth_{}".format(_depth))
+    def _selector_hit(depth: int = _depth) -> Callable[[], Any]:
+        reader = selector(depth)
+        return lambda: reader.get("email", "smtp_server")
+
+    @benchmark("selector.get.miss.depth_{}".format(_depth))
+    def _selector_miss(depth: int = _depth) -> Callable[[], Any]:
+        reader = selector(depth)
+
+        def miss() -> None:
+            try:
+                reader.get("email", "missing")
+            except ValueError:
+                pass
+
+        return miss
+
+
+@benchmark("selector.get.cached.depth_5")
+def _selector_cached() -> Callable[[], Any]:
+    reader = ReaderSelector(*selector(5).readers, cache_size=128)
+    return lambda: reader.get("email", "smtp_server")
+
+
+@benchmark("selector.get.instrumented.depth_5")
+def _selector_instrumented() -> Callable[[], Any]:
+    reader = InstrumentedReaderSelector(*selector(5).readers)
+    return lambda: reader.get("email", "smtp_server")
+
+
+# auto_type ###################################################################
+
+VALUES = [
+    "5667",
+    "True",
+    "smtp.example.com",
+    "smtp.example.com:587",
+    "1.5",
+    "None",
+    "'quoted'",
+    "[1, 2, 3]",
+    "Some text",
+    "",
+]
+
+
+@benchmark("auto_type.mix")
+def _auto_type() -> Callable[[], Any]:
+    def convert() -> None:
+        for value in VALUES:
+            auto_type(value)
+
+    return convert
+
+
+# Interfaces ##################################################################
+
+
+def config_reader() -> ConfigReader:
+    return ConfigReader(
+        spec={"email": {"port": {"default": 25}}},
+        dictionary={"email": {"smtp_server": "smtp.example.com", "port": "587"}},
+    )
+
+
+@benchmark("interface.class")
+def _class_interface() -> Callable[[], Any]:
+    config = config_reader().get_class_interface()
+    return lambda: config.email.smtp_server
+
+
+@benchmark("interface.class.store_values")
+def _class_interface_stored() -> Callable[[], Any]:
+    config = config_reader().get_class_interface(store_values=True)
+    return lambda: config.email.smtp_server
+
+
+@benchmark("interface.typed")
+def _typed_interface() -> Callable[[], Any]:
+    config = config_reader().get_typed_interface()
+    return lambda: config.email.port
+
+
+@benchmark("interface.typed.fill.keys_1000")
+def _typed_interface_fill() -> Callable[[], Any]:
+    conf2levels = ConfigReader(spec=make_spec(1000))
+    conf2levels.get_typed_interface()
+    return conf2levels.get_typed_interface
+
+
+@benchmark("interface.dictionary")
+def _dictionary_interface() -> Callable[[], Any]:
+    config = config_reader().get_dictionary_interface()
+    return lambda: config["email"]["port"]
+
+
+# IniReader ###################################################################
+
+for _keys in (10, 10000):
+
+    @benchmark("ini.construct.keys_{}".format(_keys))
+    def _ini(keys: int = _keys) -> Callable[[], Any]:
+        path = write_ini(keys)
+        return lambda: IniReader(path)
+
+    @benchmark("ini.construct.cached.keys_{}".format(_keys))
+    def _ini_cached(keys: int = _keys) -> Callable[[], Any]:
+        path = write_ini(keys)
+        cache_dir = temporary_directory()
+        IniReader(path, cache_dir=cache_dir)
+        return lambda: IniReader(path, cache_dir=cache_dir)
+
+
+# EnvironReader ###############################################################
+
+
+def large_environ() -> None:
+    """Add 10,000 unrelated and 100 matching variables to the environment.
+    The environment is restored after the benchmark."""
+    environ = dict(os.environ)
+
+    def restore() -> None:
+        os.environ.clear()
+        os.environ.update(environ)
+
+    CLEANUPS.append(restore)
+    for index in range(10000):
+        os.environ["NOISE_{}".format(index)] = "x"
+    for index in range(100):
+        os.environ["BENCH__section__key_{}".format(index)] = str(index)
+
+
+@benchmark("environ.large")
+def _environ() -> Callable[[], Any]:
+    large_environ()
+    reader = EnvironReader("BENCH")
+    return lambda: reader.get("section", "key_50")
+
+
+@benchmark("environ.large.construct")
+def _environ_construct() -> Callable[[], Any]:
+    large_environ()
+    return lambda: EnvironReader("BENCH")
+
+
+# ConfigReader ################################################################
+
+for _keys in (10, 100, 1000, 10000):
+
+    @benchmark("config_reader.construct.spec_{}".format(_keys))
+    def _construct(keys: int = _keys) -> Callable[[], Any]:
+        spec = make_spec(keys)
+        return lambda: ConfigReader(spec=spec)
+
+
+@benchmark("config_reader.construct.compiled_spec_10000")
+def _construct_compiled() -> Callable[[], Any]:
+    spec = CompiledSpec(make_spec(10000))
+    return lambda: ConfigReader(spec=spec)
+
+
+@benchmark("spec.compile.keys_10000")
+def _compile_spec() -> Callable[[], Any]:
+    spec = make_spec(10000)
+    return lambda: CompiledSpec(spec)
+
+
+@benchmark("config_reader.validate.keys_1000")
+def _validate() -> Callable[[], Any]:
+    conf2levels = ConfigReader(spec=make_spec(1000))
+    return lambda: conf2levels.validate()
+
+
+@benchmark("config_reader.construct.snapshot_path.keys_1000")
+def _construct_snapshot() -> Callable[[], Any]:
+    path = write_ini(1000)
+    spec = make_spec(1000)
+    snapshot_path = os.path.join(temporary_directory(), "config.snapshot")
+    ConfigReader(spec=spec, ini=path, snapshot_path=snapshot_path)
+    return lambda: ConfigReader(spec=spec, ini=path, snapshot_path=snapshot_path)
+
+
+@benchmark("config_reader.construct.ini.keys_1000")
+def _construct_ini() -> Callable[[], Any]:
+    path = write_ini(1000)
+    spec = make_spec(1000)
+    return lambda: ConfigReader(spec=spec, ini=path)
+
+
+# Import ######################################################################
+
+
+@benchmark("import.interpreter")
+def _interpreter() -> Callable[[], Any]:
+    """The baseline for ``import.conf2levels``."""
+    return lambda: subprocess.run([sys.executable, "-c", "pass"], check=True)
+
+
+@benchmark("import.conf2levels")
+def _import() -> Callable[[], Any]:
+    return lambda: subprocess.run(
+        [sys.executable, "-c", "import conf2levels"],
+        check=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+
+
+# Runner ######################################################################
+
+
+def measure(function: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return {"ns_per_call": best / number * 1e9, "loops": number}
+
+
+def run(pattern: Optional[str], repeat: int) -> Dict[str, Any]:
+    results: Dict[str, Dict[str, float]] = {}
+    for name, prepare in BENCHMARKS:
+        if pattern and pattern not in name:
+            continue
+        try:
+            results[name] = measure(prepare(), repeat)
+        finally:
+            while CLEANUPS:
+                CLEANUPS.pop()()
+        print(
+            "{:<50} {:>14.1f} ns".format(name, results[name]["ns_per_call"]),
+            file=sys.stderr,
+        )
+    return {
+        "conf2levels": __version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def compare(old: Dict[str, Any], new: Dict[str, Any], threshold: float) -> bool:
+    """Print the ratio new/old for each benchmark.
+
+    :return: True if no benchmark got slower than the threshold.
+    """
+    ok = True
+    for name, result in new["results"].items():
+        if name not in old["results"]:
+            continue
+        ratio = result["ns_per_call"] / old["results"][name]["ns_per_call"]
+        flag = ""
+        if ratio > threshold:
+            flag = "  REGRESSION"
+            ok = False
+        print("{:<50} {:>8.2f}x{}".format(name, ratio, flag))
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--output", help="Write the results as JSON to this file.")
+    parser.add_argument("--compare", help="Compare with the results in this file.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.2,
+        help="The slowdown ratio that counts as a regression (default: 1.2).",
+    )
+    parser.add_argument("--filter", help="Only run benchmarks containing this text.")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    results = run(args.filter, args.repeat)
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    if args.compare:
+        with open(args.compare) as old:
+            if not compare(json.load(old), results, args.threshold):
+                sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
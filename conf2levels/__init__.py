@@ -1,99 +1,225 @@
-import argparse
-import ast
-from importlib import metadata
-from typing import Any, List, Tuple, TypedDict, Union
-
-from typing_extensions import Unpack
-
-from .argparse_reader import ArgparseReader
-from .dictonary_reader import DictionaryReader
-from .environ_reader import EnvironReader
-from .exceptions import ConfigValueError, validate_key
-from .ini_reader import IniReader
-from .reader_base import ReaderBase
+from __future__ import annotations
+
+import importlib
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypedDict,
+    TypeVar,
+    Union,
+)
+
+from .coercion import auto_type
+from .compiled_spec import CompiledSpec, KeyDescriptor
+from .exceptions import ConfigValueError, is_valid_key, validate_key
+from .reader_base import MISSING, Provenance, ReaderBase
+from .reader_selector import ReaderSelector
 from .spec_reader import SpecReader
-from .types import Dictionary, Mapping, Spec
+from .types import Converter, Dictionary, Mapping, Spec
+
+if TYPE_CHECKING:
+    import argparse
+
+    from typing_extensions import Unpack
+
+    from .argparse_reader import ArgparseReader
+    from .async_reader import AsyncReaderBase
+    from .dictonary_reader import DictionaryReader
+    from .environ_reader import EnvironReader
+    from .frozen_reader import FrozenReader
+    from .ini_reader import IniReader, LayeredIniReader
+    from .instrumentation import (
+        InstrumentedReaderSelector,
+        LookupCallback,
+        LookupEvent,
+        ReaderStats,
+        Stats,
+    )
+    from .shared_snapshot import SharedSnapshotReader, share_snapshot, write_snapshot
+    from .snapshot_reader import SnapshotReader
+    from .typed_interface import generate_classes, generate_module
+    from .validation import ValidationError, ValidationReport, Violation
+
+    __version__: str
+
+_LAZY_ATTRIBUTES = {
+    "ArgparseReader": "argparse_reader",
+    "AsyncReaderBase": "async_reader",
+    "DictionaryReader": "dictonary_reader",
+    "EnvironReader": "environ_reader",
+    "FrozenReader": "frozen_reader",
+    "IniReader": "ini_reader",
+    "InstrumentedReaderSelector": "instrumentation",
+    "LayeredIniReader": "ini_reader",
+    "LookupEvent": "instrumentation",
+    "ReaderStats": "instrumentation",
+    "SharedSnapshotReader": "shared_snapshot",
+    "SnapshotReader": "snapshot_reader",
+    "Stats": "instrumentation",
+    "ValidationError": "validation",
+    "ValidationReport": "validation",
+    "Violation": "validation",
+    "generate_classes": "typed_interface",
+    "generate_module": "typed_interface",
+    "share_snapshot": "shared_snapshot",
+    "write_snapshot": "shared_snapshot",
+}
+"""The attributes which are imported from their submodules on first access,
+so ``import conf2levels`` stays cheap for short-lived programs."""
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        from importlib import metadata
+
+        value: Any = metadata.version("conf2levels")
+    elif name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(".{}".format(_LAZY_ATTRIBUTES[name]), __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | {"__version__"})
+
+
+__all__ = [
+    "ArgparseReader",
+    "AsyncReaderBase",
+    "ClassInterface",
+    "CompiledSpec",
+    "ConfigReader",
+    "ConfigValueError",
+    "DictionaryInterface",
+    "DictionaryReader",
+    "EnvironReader",
+    "FrozenReader",
+    "IniReader",
+    "InstrumentedReaderSelector",
+    "KeyDescriptor",
+    "LayeredIniReader",
+    "LookupEvent",
+    "MISSING",
+    "Provenance",
+    "ReaderBase",
+    "ReaderSelector",
+    "ReaderStats",
+    "SharedSnapshotReader",
+    "SnapshotReader",
+    "SpecReader",
+    "Stats",
+    "ValidationError",
+    "ValidationReport",
+    "Violation",
+    "auto_type",
+    "generate_classes",
+    "generate_module",
+    "is_valid_key",
+    "load_readers_by_keyword",
+    "share_snapshot",
+    "validate_key",
+    "write_snapshot",
+]
+
+
+T = TypeVar("T")
 
-__version__: str = metadata.version("conf2levels")
 
+class DictionaryInterfaceKey:
+    __slots__ = ("_reader", "_section", "_values")
 
-class ReaderSelector(ReaderBase):
-    """Select for each get request which reader to use."""
-
-    def __init__(self, *readers: ReaderBase):
-        self.readers = readers
-        """A list of readers."""
-
-    @staticmethod
-    def _validate_key(key: str) -> bool:
-        return validate_key(key)
-
-    def get(self, section: str, key: str) -> Any:
-        """
-        Get a configuration value stored under a section and a key.
-
-        :param section: Name of the section.
-        :param key: Name of the key.
-        """
-        self._validate_key(section)
-        self._validate_key(key)
-        for reader in self.readers:
-            try:
-                return reader.get(section, key)
-            except ConfigValueError:
-                pass
-        raise ValueError(
-            "Configuration value could not be found " "(section “{}” key “{}”).".format(
-                section, key
-            )
-        )
-
-
-def auto_type(value: Any) -> Any:
-    """https://stackoverflow.com/a/7019325"""
-    try:
-        return ast.literal_eval(value)
-    except ValueError:
-        return value
-    # ERROR: test_method_send_email_with_config_reader
-    # (test_command_watcher.TestClassWatch)
-    # AttributeError: 'SyntaxError' object has no attribute 'filename'
-    except SyntaxError:
-        return value
-
+    _values: Optional[Dict[str, Any]]
 
-class DictionaryInterfaceKey:
-    def __init__(self, reader: ReaderBase, section: str):
+    def __init__(self, reader: ReaderBase, section: str, store_values: bool = False):
         self._reader = reader
         self._section = section
+        self._values = {} if store_values else None
 
     def __getitem__(self, name: str) -> Any:
-        return auto_type(self._reader.get(self._section, name))
+        values = self._values
+        if values is not None and name in values:
+            return values[name]
+        value = self._reader.get_typed(self._section, name)
+        if values is not None:
+            values[name] = value
+        return value
 
 
 class DictionaryInterface:
-    def __init__(self, reader: ReaderBase):
+    """Access the configuration values like a nested dictionary:
+    ``config['section']['key']``.
+
+    :param store_values: Store the values on the section objects after
+      the first read. Later changes of the readers aren’t seen then.
+    """
+
+    __slots__ = ("_reader", "_store_values", "_sections")
+
+    _sections: Dict[str, DictionaryInterfaceKey]
+
+    def __init__(self, reader: ReaderBase, store_values: bool = False):
         self._reader = reader
+        self._store_values = store_values
+        self._sections = {}
 
     def __getitem__(self, name: str) -> DictionaryInterfaceKey:
-        return DictionaryInterfaceKey(self._reader, section=name)
+        section = self._sections.get(name)
+        if section is None:
+            section = DictionaryInterfaceKey(
+                self._reader, section=name, store_values=self._store_values
+            )
+            self._sections[name] = section
+        return section
 
 
 class ClassInterfaceKey:
-    def __init__(self, reader: ReaderBase, section: str):
+    __slots__ = ("_reader", "_section", "_store_values", "__dict__")
+
+    def __init__(self, reader: ReaderBase, section: str, store_values: bool = False):
         self._reader = reader
         self._section = section
+        self._store_values = store_values
 
     def __getattr__(self, name: str) -> Any:
-        return auto_type(self._reader.get(self._section, name))
+        value = self._reader.get_typed(self._section, name)
+        if self._store_values:
+            self.__dict__[name] = value
+        return value
 
 
 class ClassInterface:
-    def __init__(self, reader: ReaderBase):
+    """Access the configuration values as attributes: ``config.section.key``.
+
+    The section objects are created on first access and stored as
+    attributes, so later accesses are plain attribute lookups.
+
+    :param store_values: Store the values as attributes of the section
+      objects after the first read. Later changes of the readers aren’t
+      seen then.
+    """
+
+    __slots__ = ("_reader", "_store_values", "__dict__")
+
+    def __init__(self, reader: ReaderBase, store_values: bool = False):
         self._reader = reader
+        self._store_values = store_values
 
     def __getattr__(self, name: str) -> ClassInterfaceKey:
-        return ClassInterfaceKey(self._reader, section=name)
+        section = ClassInterfaceKey(
+            self._reader, section=name, store_values=self._store_values
+        )
+        self.__dict__[name] = section
+        return section
 
 
 class ReadersKwarg(TypedDict, total=False):
@@ -111,23 +237,37 @@ class ReadersKwarg(TypedDict, total=False):
     environ: str
     """The prefix of the environment variables."""
 
-    ini: str
-    """The path of the INI file."""
+    ini: Union[str, List[str], IniReader]
+    """The path of the INI file, a list of paths and glob patterns which are
+    merged by a :py:class:`LayeredIniReader` (later files override earlier
+    ones) or an already configured :py:class:`IniReader`, for example
+    ``IniReader(path, lazy=True)``."""
 
-    spec: Spec
+    readers: Union[ReaderBase, List[ReaderBase]]
+    """Custom readers, for example subclasses of
+    :py:class:`AsyncReaderBase`."""
+
+    spec: Union[Spec, CompiledSpec]
 
 
 def load_readers_by_keyword(**kwargs: Unpack[ReadersKwarg]) -> List[ReaderBase]:
-    """Available readers: `argparse`, `dictionary`, `environ`, `ini`.
+    """Available readers: `argparse`, `dictionary`, `environ`, `ini`,
+    `readers`.
 
     The arguments of this class have to be specified as keyword arguments.
     Each keyword stands for a configuration reader class.
     The order of the keywords is important. The first keyword, more
     specifically the first reader class, overwrites the next ones.
     """
+    from .dictonary_reader import DictionaryReader
+    from .environ_reader import EnvironReader
+    from .ini_reader import IniReader, LayeredIniReader
+
     readers: List[ReaderBase] = []
     for keyword, value in kwargs.items():
         if keyword == "argparse":
+            from .argparse_reader import ArgparseReader
+
             if isinstance(value, tuple) or isinstance(value, list):
                 readers.append(ArgparseReader(args=value[0], mapping=value[1]))
             elif value.__class__.__name__ == "Namespace":
@@ -138,39 +278,369 @@ def load_readers_by_keyword(**kwargs: Unpack[ReadersKwarg]) -> List[ReaderBase]:
             readers.append(EnvironReader(prefix=value))
         elif keyword == "ini" and isinstance(value, str):
             readers.append(IniReader(path=value))
+        elif keyword == "ini" and isinstance(value, (list, tuple)):
+            readers.append(LayeredIniReader(paths=value))
+        elif keyword == "ini" and isinstance(value, IniReader):
+            readers.append(value)
+        elif keyword == "readers":
+            if isinstance(value, ReaderBase):
+                readers.append(value)
+            else:
+                readers.extend(value)
         elif keyword == "spec":
             readers.append(SpecReader(spec=value))
     return readers
 
 
 class ConfigReader:
-    """Available readers: `argparse`, `dictionary`, `environ`, `ini`.
+    """Available readers: `argparse`, `dictionary`, `environ`, `ini`,
+    `readers`.
 
     The arguments of this class have to be specified as keyword arguments.
     Each keyword stands for a configuration reader class.
     The order of the keywords is important. The first keyword, more
     specifically the first reader class, overwrites the next ones.
+
+    :param spec: The specification dictionary or a :py:class:`CompiledSpec`,
+      which can be shared by several configuration readers. A dictionary is
+      compiled at construction time.
+    :param cache_size: Remember up to this number of resolved values. By
+      default no values are cached.
+    :param frozen: Resolve all known values once at construction time and
+      read them from a :py:class:`FrozenReader` snapshot afterwards.
+    :param strict: Validate the section and key names of the specification
+      at construction time (a :py:class:`CompiledSpec` only once, see
+      :py:meth:`CompiledSpec.validate`) and the names of each lookup (only
+      once per name). Without strict mode no names are validated at all.
+    :param instrument: Count the hits and misses of each reader, the lookups
+      of each key and the lookup time, see :py:meth:`stats`. Without
+      instrumentation a plain :py:class:`ReaderSelector` is used, which has
+      no overhead.
+    :param on_lookup: Call this function with a :py:class:`LookupEvent`
+      after lookups. Implies ``instrument``.
+    :param sample_every: Call ``on_lookup`` only for every n-th lookup.
+    :param provenance: Record which reader supplied each resolved value
+      while it is resolved, see :py:meth:`explain`.
+    :param concurrent: Read from an immutable snapshot which is rebuilt and
+      replaced each time a reader reports changes, see
+      :py:class:`SnapshotReader`. Use this mode if other threads change the
+      values while they are read, for example with
+      :py:meth:`DictionaryReader.set` or :py:meth:`IniReader.watch`.
+    :param snapshot_path: Keep a snapshot of the merged and converted
+      values in this file, like ``frozen``. The file is keyed by a
+      fingerprint of all sources (the paths, modification times, sizes and
+      contents of the INI files, the prefixed environment variables, the
+      specification, the dictionary and the argparse values). As long as
+      the fingerprint matches, the values are loaded with a single read and
+      the INI files aren’t parsed; otherwise the snapshot is rebuilt. If a
+      reader can’t compute a fingerprint (custom readers) or the values
+      can’t be marshalled, nothing is stored. ``frozen`` is implied.
+
+    :raises ValueError: If a name of the specification is invalid.
+    :raises ValueError: If ``concurrent`` is combined with ``frozen`` or
+      ``snapshot_path``: a snapshot that is never rebuilt wouldn’t see the
+      changes.
     """
 
     spec: Spec
-    reader: ReaderBase
-
-    def __init__(self, spec: Spec = {}, **kwargs: Unpack[ReadersKwarg]):
-        kwargs["spec"] = spec
+    compiled_spec: CompiledSpec
+    converters: Dict[Tuple[str, str], Converter]
+
+    argparse_mapping: Optional[Mapping] = None
+    """The mapping returned by the last call of :py:meth:`spec_to_argparse`."""
+
+    _typed_class: Optional[type] = None
+
+    reader: Union[
+        ReaderSelector, InstrumentedReaderSelector, FrozenReader, SnapshotReader
+    ]
+
+    def __init__(
+        self,
+        spec: Union[Spec, CompiledSpec] = {},
+        cache_size: Optional[int] = None,
+        frozen: bool = False,
+        strict: bool = True,
+        instrument: bool = False,
+        on_lookup: Optional[LookupCallback] = None,
+        sample_every: int = 1,
+        provenance: bool = False,
+        concurrent: bool = False,
+        snapshot_path: Optional[str] = None,
+        **kwargs: Unpack[ReadersKwarg],
+    ):
+        if concurrent and (frozen or snapshot_path is not None):
+            raise ValueError(
+                "The concurrent mode can’t be combined with “frozen” or "
+                "“snapshot_path”."
+            )
+        if isinstance(spec, CompiledSpec):
+            compiled_spec = spec
+            if strict:
+                compiled_spec.validate()
+        else:
+            compiled_spec = CompiledSpec(spec, strict=strict)
+        kwargs["spec"] = compiled_spec
+
+        if snapshot_path is not None and isinstance(kwargs.get("ini"), (str, list)):
+            # Only parse the INI files if the snapshot is out of date.
+            from .ini_reader import IniReader, LayeredIniReader
+
+            ini = kwargs["ini"]
+            if isinstance(ini, str):
+                kwargs["ini"] = IniReader(ini, lazy=True)
+            else:
+                kwargs["ini"] = LayeredIniReader(ini, lazy=True)
 
         readers = load_readers_by_keyword(**kwargs)
-        self.spec = spec
+        self.spec = compiled_spec.spec
         """The specification dictionary. For more informations look at the
         class arguments of this class."""
 
-        self.reader = ReaderSelector(*readers)
-        """:py:class:`ReaderSelector`"""
+        self.compiled_spec = compiled_spec
+        """The compiled specification, see :py:class:`CompiledSpec`."""
 
-    def get_class_interface(self) -> ClassInterface:
-        return ClassInterface(self.reader)
+        self.converters = compiled_spec.converters
+        """The converters compiled from the ``type`` fields of the
+        specification: ``{('section', 'key'): converter}``"""
 
-    def get_dictionary_interface(self) -> DictionaryInterface:
-        return DictionaryInterface(self.reader)
+        if instrument or on_lookup is not None:
+            from .instrumentation import InstrumentedReaderSelector
+
+            self.reader = InstrumentedReaderSelector(
+                *readers,
+                callback=on_lookup,
+                sample_every=sample_every,
+                cache_size=cache_size,
+                converters=self.converters,
+                strict=strict,
+                provenance=provenance,
+            )
+        else:
+            self.reader = ReaderSelector(
+                *readers,
+                cache_size=cache_size,
+                converters=self.converters,
+                strict=strict,
+                provenance=provenance,
+            )
+        """:py:class:`ReaderSelector`, :py:class:`InstrumentedReaderSelector`,
+        :py:class:`SnapshotReader` or :py:class:`FrozenReader`"""
+
+        if concurrent:
+            from .snapshot_reader import SnapshotReader
+
+            self.reader = SnapshotReader(self.reader, self.converters)
+        if snapshot_path is not None:
+            self.reader = self._load_snapshot(snapshot_path, readers, strict)
+        elif frozen:
+            self.reader = self.freeze()
+
+    def invalidate(
+        self, section: Optional[str] = None, key: Optional[str] = None
+    ) -> None:
+        """Forget cached values, see :py:meth:`ReaderSelector.invalidate`.
+        In the concurrent mode a new snapshot is published."""
+        from .snapshot_reader import SnapshotReader
+
+        if isinstance(self.reader, ReaderSelector):
+            self.reader.invalidate(section, key)
+        elif isinstance(self.reader, SnapshotReader):
+            self.reader._reader.invalidate(section, key)
+            self.reader.publish()
+
+    def stats(self) -> Stats:
+        """Return a snapshot of the lookup counters.
+
+        :raises ValueError: If the reader isn’t instrumented, see the
+          ``instrument`` argument.
+        """
+        from .instrumentation import InstrumentedReaderSelector
+        from .snapshot_reader import SnapshotReader
+
+        reader = self.reader
+        if isinstance(reader, SnapshotReader):
+            reader = reader._reader
+        if not isinstance(reader, InstrumentedReaderSelector):
+            raise ValueError("The configuration reader isn’t instrumented.")
+        return reader.stats()
+
+    def explain(self, section: str, key: str) -> Provenance:
+        """Get a value together with the reader which supplied it and a
+        description of its origin, for example the name of the environment
+        variable or the path of the INI file.
+
+        :raises ValueError: If the value can’t be found.
+        """
+        return self.reader.explain(section, key)
+
+    def freeze(self) -> FrozenReader:
+        """Resolve every value known to the readers (the specification, the
+        dictionary, the INI file, the prefixed environment variables and the
+        argparse mapping) and return an immutable snapshot of them.
+
+        The precedence of the readers is applied while the snapshot is
+        built, so later lookups don’t have to walk the readers again.
+        Values the readers can’t list (for example argparse values without
+        a mapping) are only included if another reader knows their name.
+
+        In the provenance mode the snapshot keeps the origins of the values.
+        """
+        from .frozen_reader import FrozenReader
+        from .snapshot_reader import SnapshotReader
+
+        if isinstance(self.reader, SnapshotReader):
+            return self.reader.snapshot
+        return FrozenReader.from_reader(self.reader, self.converters)
+
+    def _load_snapshot(
+        self, path: str, readers: List[ReaderBase], strict: bool
+    ) -> FrozenReader:
+        from .persistent import fingerprint, load_snapshot, save_snapshot
+
+        key = fingerprint(readers)
+        if key is not None:
+            snapshot = load_snapshot(path, key, self.converters, strict)
+            if snapshot is not None:
+                return snapshot
+        snapshot = self.freeze()
+        if key is not None:
+            save_snapshot(path, key, snapshot)
+        return snapshot
+
+    def get_class_interface(self, store_values: bool = False) -> ClassInterface:
+        """:param store_values: Store the values after the first read, see
+        :py:class:`ClassInterface`."""
+        return ClassInterface(self.reader, store_values=store_values)
+
+    def get_typed_interface(self, cls: Optional[Type[T]] = None) -> T:
+        """Fill the classes generated by :py:func:`generate_classes` or
+        :py:func:`generate_module` once with the converted values. Reading
+        a value afterwards is a plain slot access, so later changes of the
+        readers aren’t seen. Keys without a value are left unset and raise
+        an :py:class:`AttributeError`, see :py:meth:`validate`.
+
+        :param cls: The root class. By default the classes are generated
+          from the specification of this configuration reader.
+
+        :raises ValueError: If ``cls`` isn’t given and a name of the
+          specification isn’t a Python identifier.
+        """
+        if cls is None:
+            if self._typed_class is None:
+                from .typed_interface import generate_classes
+
+                self._typed_class = generate_classes(self.compiled_spec)
+            cls = self._typed_class
+        reader = self.reader
+        convert = reader._convert
+        setattr_ = object.__setattr__
+        interface = object.__new__(cls)
+        for section, section_class in cls.__sections__.items():  # type: ignore
+            values = object.__new__(section_class)
+            for key, value in reader.lookup_many(
+                section, section_class.__slots__
+            ).items():
+                setattr_(values, key, convert(section, key, value))
+            setattr_(interface, section, values)
+        return interface
+
+    def get_dictionary_interface(
+        self, store_values: bool = False
+    ) -> DictionaryInterface:
+        """:param store_values: Store the values after the first read, see
+        :py:class:`DictionaryInterface`."""
+        return DictionaryInterface(self.reader, store_values=store_values)
+
+    def sections(self) -> Iterator[str]:
+        """Yield the names of all sections the readers have values for."""
+        return self.reader.sections()
+
+    def keys(self, section: str) -> Iterator[str]:
+        """Yield the names of all keys of a section the readers have values
+        for."""
+        return self.reader.keys(section)
+
+    def items(self, section: str) -> Iterator[Tuple[str, Any]]:
+        """Yield the ``(key, value)`` pairs of a section with the values
+        converted like the values read through the interfaces."""
+        convert = self.reader._convert
+        for key, value in self.reader.items(section):
+            yield key, convert(section, key, value)
+
+    def get_section(self, section: str) -> Dict[str, Any]:
+        """Get all values of a section the readers can list, converted like
+        the values read through the interfaces. Each reader is asked once.
+
+        :return: A dictionary like this one: ``{'key': value}``
+        """
+        convert = self.reader._convert
+        return {
+            key: convert(section, key, value)
+            for key, value in self.reader.get_section(section).items()
+        }
+
+    def get_many(self, names: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], Any]:
+        """Get several values, converted like the values read through the
+        interfaces. Each reader is asked once per section.
+
+        :param names: ``(section, key)`` pairs.
+
+        :raises ValueError: If values can’t be found.
+
+        :return: A dictionary like this one: ``{('section', 'key'): value}``
+        """
+        convert = self.reader._convert
+        return {
+            name: convert(name[0], name[1], value)
+            for name, value in self.reader.get_many(names).items()
+        }
+
+    async def aget(self, section: str, key: str) -> Any:
+        """Get a value without blocking the event loop, converted like the
+        values read through the interfaces. Asynchronous readers are queried
+        concurrently, see :py:meth:`ReaderSelector.alookup`.
+
+        :raises ValueError: If the value can’t be found.
+        """
+        from .snapshot_reader import SnapshotReader
+
+        reader = self.reader
+        if isinstance(reader, (ReaderSelector, SnapshotReader)):
+            return await reader.aget_typed(section, key)
+        return reader.get_typed(section, key)
+
+    async def prefetch(self, spec: Optional[Spec] = None) -> None:
+        """Resolve all keys of a specification concurrently, each section
+        with one bulk lookup per reader. If the reader has asynchronous
+        readers or a cache, the values are cached, so later synchronous reads
+        (for example through the interfaces) don’t have to wait for the
+        asynchronous readers.
+
+        In the concurrent mode the values missing from the snapshot are
+        resolved.
+
+        :param spec: By default the specification of this configuration
+          reader.
+
+        :raises ValueError: If the reader is frozen: its values are resolved
+          at construction time.
+        """
+        import asyncio
+
+        from .snapshot_reader import SnapshotReader
+
+        reader = self.reader
+        if not isinstance(reader, (ReaderSelector, SnapshotReader)):
+            raise ValueError(
+                "The values of a frozen configuration reader are resolved "
+                "at construction time."
+            )
+        if spec is None:
+            spec = self.spec
+        await asyncio.gather(
+            *(reader.alookup_many(section, keys) for section, keys in spec.items())
+        )
 
     def check_section(self, section: str, not_empty: bool = False) -> bool:
         """Check all keys of a section.
@@ -180,24 +650,120 @@ class ConfigReader:
         :raises ValueError: If `not_empty` is true and value is empty.
         :raises KeyError: By an unspecify section
         """
-        for key, value_spec in self.spec[section].items():
-            value = self.reader.get(section, key)
-            if "not_empty" in value_spec and value_spec["not_empty"] and not value:
+        descriptors = self.compiled_spec.section(section)
+        values = self.reader.get_many(
+            (section, descriptor.key) for descriptor in descriptors
+        )
+        for descriptor in descriptors:
+            if descriptor.not_empty and not values[(section, descriptor.key)]:
                 raise ValueError(
-                    "Spec check: section ”{}” key “{}” is empty.".format(section, key)
+                    "Spec check: section ”{}” key “{}” is empty.".format(
+                        section, descriptor.key
+                    )
                 )
         return True
 
-    def spec_to_argparse(self, parser: argparse.ArgumentParser) -> None:
-        for section, _ in self.spec.items():
+    def validate(self, max_workers: Optional[int] = None) -> ValidationReport:
+        """Check all keys of all sections of the specification and collect
+        every violation instead of stopping at the first one.
+
+        Each section is resolved in bulk. A key is violated if it has no
+        value (``missing``), if it is specified as ``not_empty`` and its
+        value is empty (``empty``) or if its converter rejects the value
+        (``type``).
+
+        :param max_workers: Check the sections concurrently in that many
+          threads, which helps if the readers are slow.
+        """
+        from .validation import ValidationReport
+
+        sections = list(self.compiled_spec.sections())
+        if max_workers and max_workers > 1 and len(sections) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(self._validate_section, sections))
+        else:
+            results = [self._validate_section(section) for section in sections]
+        return ValidationReport(
+            [violation for violations in results for violation in violations]
+        )
+
+    def _validate_section(self, section: str) -> List[Violation]:
+        from .validation import Violation
+
+        violations: List[Violation] = []
+        descriptors = self.compiled_spec.section(section)
+        values = self.reader.lookup_many(
+            section, [descriptor.key for descriptor in descriptors]
+        )
+        for descriptor in descriptors:
+            key = descriptor.key
+            if key not in values:
+                violations.append(
+                    Violation(
+                        section,
+                        key,
+                        "missing",
+                        "Configuration value could not be found "
+                        "(section “{}” key “{}”).".format(section, key),
+                    )
+                )
+                continue
+            value = values[key]
+            if descriptor.not_empty and not value:
+                violations.append(
+                    Violation(
+                        section,
+                        key,
+                        "empty",
+                        "Spec check: section ”{}” key “{}” is empty.".format(
+                            section, key
+                        ),
+                    )
+                )
+            if descriptor.converter is not None:
+                try:
+                    self.reader._convert(section, key, value)
+                except (ValueError, TypeError) as error:
+                    violations.append(
+                        Violation(
+                            section,
+                            key,
+                            "type",
+                            "Invalid value {!r} (section “{}” key “{}”): {}".format(
+                                value, section, key, error
+                            ),
+                        )
+                    )
+        return violations
+
+    def spec_to_argparse(self, parser: argparse.ArgumentParser) -> Mapping:
+        """Add an argument ``--section-key`` for each key of the
+        specification to the parser.
+
+        :return: The mapping of the added arguments:
+          ``{'section.key': 'dest'}``. Pass it together with the parsed
+          arguments to the ``argparse`` keyword, so sections of several words
+          are found without a hand-written mapping. The mapping is also
+          stored in :py:attr:`argparse_mapping`.
+        """
+        mapping: Mapping = {}
+        for section in self.compiled_spec.sections():
             group = parser.add_argument_group(
                 title=section, description="Generated by the config_reader."
             )
-            for key, value in self.spec[section].items():
+            for descriptor in self.compiled_spec.section(section):
+                key = descriptor.key
                 argument = "--{}-{}".format(section, key).replace("_", "-")
-                kwargs = {}
-                if "description" in value:
-                    kwargs["help"] = value["description"]
-                if "default" in value:
-                    kwargs["default"] = value["default"]
-                group.add_argument(argument, **kwargs)
+                kwargs: Dict[str, Any] = {}
+                if descriptor.description is not None:
+                    kwargs["help"] = descriptor.description
+                if descriptor.default is not MISSING:
+                    kwargs["default"] = descriptor.default
+                if descriptor.converter is not None:
+                    kwargs["type"] = descriptor.converter
+                action = group.add_argument(argument, **kwargs)
+                mapping["{}.{}".format(section, key)] = action.dest
+        self.argparse_mapping = mapping
+        return mapping
@@ -1,9 +1,11 @@
-from argparse import Namespace
-from typing import Any
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Set, Tuple
 
-from .reader_base import ReaderBase
+from .reader_base import MISSING, ReaderBase
 from .types import Mapping
 
+if TYPE_CHECKING:
+    from argparse import Namespace
+
 
 class ArgparseReader(ReaderBase):
     """This class tries to read configuration values from a `argparse`
@@ -13,13 +15,96 @@ class ArgparseReader(ReaderBase):
     `section_key`). By multi word section you have to specify a mapping
     (`{'my_section.key': 'my_section_key'}`). Without a mapping all sections
     and keys are convert into lowercase (`Section` = `section`).
+
+    :py:meth:`conf2levels.ConfigReader.spec_to_argparse` returns the exact
+    mapping of the arguments it adds.
+
+    The namespace is read once when the reader is created: each lookup is
+    a dictionary access.
+
+    :param args: The parsed ``argparse`` namespace.
+    :param mapping: A dictionary like this one: ``{'section.key': 'dest'}``
     """
 
     _mapping: Mapping
 
-    def __init__(self, args: Namespace, mapping: Mapping = {}):
+    _dests: Dict[str, Any]
+    """The destinations of the namespace which aren’t ``None``."""
+
+    _table: Dict[Tuple[str, str], Any]
+    """``{('section', 'key'): value}``: the values of the mapping (or
+    :py:data:`MISSING`). Other names are looked up in :py:attr:`_dests`."""
+
+    def __init__(self, args: "Namespace", mapping: Mapping = {}):
         self._args = args
         self._mapping = mapping
+        self._dests = {
+            dest: value for dest, value in vars(args).items() if value is not None
+        }
+        table: Dict[Tuple[str, str], Any] = {}
+        for mapping_key, dest in mapping.items():
+            section, _, key = mapping_key.partition(".")
+            table[(section, key)] = self._dests.get(dest, MISSING)
+        self._table = table
+
+    def _dest(self, section: str, key: str) -> str:
+        mapping_key = "{}.{}".format(section, key)
+        if mapping_key in self._mapping:
+            return self._mapping[mapping_key]
+        return "{}_{}".format(section, key).lower()
+
+    def fingerprint(self) -> Optional[str]:
+        from .persistent import digest
+
+        return digest(sorted(vars(self._args).items()), self._mapping)
+
+    def lookup(self, section: str, key: str) -> Any:
+        table = self._table
+        value = table.get((section, key), table)
+        if value is table:
+            return self._dests.get("{}_{}".format(section, key).lower(), MISSING)
+        return value
+
+    def source(self, section: str, key: str) -> str:
+        return "argparse dest “{}”".format(self._dest(section, key))
+
+    def sections(self) -> Iterator[str]:
+        """Yield the sections of the mapping and the sections of the
+        remaining ``argparse`` destinations, which are split at the first
+        underscore (``section_key``)."""
+        seen: Set[str] = set()
+        for mapping_key in self._mapping:
+            section = mapping_key.partition(".")[0]
+            if section not in seen:
+                seen.add(section)
+                yield section
+        mapped = set(self._mapping.values())
+        for dest in self._dests:
+            if dest in mapped:
+                continue
+            section, _, key = dest.partition("_")
+            if section and key and section not in seen:
+                seen.add(section)
+                yield section
+
+    def keys(self, section: str) -> Iterator[str]:
+        return iter(self.get_section(section))
+
+    def get_section(self, section: str) -> Dict[str, Any]:
+        values: Dict[str, Any] = {}
+        prefix = "{}_".format(section).lower()
+        for dest, value in self._dests.items():
+            if dest.startswith(prefix) and dest != prefix:
+                values[dest[len(prefix) :]] = value
+        for mapping_key, dest in self._mapping.items():
+            mapping_section, _, key = mapping_key.partition(".")
+            if mapping_section != section:
+                continue
+            if dest in self._dests:
+                values[key] = self._dests[dest]
+            else:
+                values.pop(key, None)
+        return values
 
     def get(self, section: str, key: str) -> Any:
         """
@@ -32,17 +117,9 @@ class ArgparseReader(ReaderBase):
 
         :return: The configuration value stored under a section and a key.
         """
-        mapping_key = "{}.{}".format(section, key)
-        if mapping_key in self._mapping:
-            argparse_dest = self._mapping[mapping_key]
-        else:
-            argparse_dest = "{}_{}".format(section, key).lower()
-
-        if hasattr(self._args, argparse_dest):
-            value = getattr(self._args, argparse_dest)
-            if value is not None:
-                return value
-
+        value = self.lookup(section, key)
+        if value is not MISSING:
+            return value
         self._exception(
             "Configuration value could not be found by "
             "Argparse (section “{}” key “{}”).".format(section, key)
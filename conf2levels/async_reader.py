@@ -0,0 +1,78 @@
+import asyncio
+from abc import abstractmethod
+from typing import Any, Dict, Iterable, List
+
+from .reader_base import MISSING, ReaderBase
+
+
+class AsyncReaderBase(ReaderBase):
+    """Base class for readers whose source is slow, for example a file on
+    network storage or a secrets helper.
+
+    Subclasses implement :py:meth:`alookup`. The asynchronous methods of
+    :py:class:`ReaderSelector` (and :py:meth:`ConfigReader.aget`,
+    :py:meth:`ConfigReader.prefetch`) await asynchronous readers
+    concurrently. The synchronous methods run the coroutine in a new event
+    loop and therefore can’t be called from a running event loop.
+    """
+
+    @abstractmethod
+    async def alookup(self, section: str, key: str) -> Any:
+        """
+        Look up a configuration value without raising an exception.
+
+        :param section: Name of the section.
+        :param key: Name of the key.
+
+        :return: The configuration value or :py:data:`MISSING`.
+        """
+        raise NotImplementedError("An async reader must have an `alookup` method.")
+
+    async def alookup_many(self, section: str, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        Look up several configuration values of one section concurrently.
+
+        :param section: Name of the section.
+        :param keys: Names of the keys.
+
+        :return: A dictionary of the keys the reader has values for.
+        """
+        keys = list(keys)
+        results: List[Any] = await asyncio.gather(
+            *(self.alookup(section, key) for key in keys)
+        )
+        return {key: value for key, value in zip(keys, results) if value is not MISSING}
+
+    async def aget(self, section: str, key: str) -> Any:
+        """
+        Get a configuration value stored under a section and a key.
+
+        :param section: Name of the section.
+        :param key: Name of the key.
+
+        :raises ConfigValueError: Configuration value couldn’t be found.
+        """
+        value = await self.alookup(section, key)
+        if value is MISSING:
+            self._exception(
+                "Configuration value could not be found "
+                "(section “{}” key “{}”).".format(section, key)
+            )
+        return value
+
+    def lookup(self, section: str, key: str) -> Any:
+        return asyncio.run(self.alookup(section, key))
+
+    def lookup_many(self, section: str, keys: Iterable[str]) -> Dict[str, Any]:
+        return asyncio.run(self.alookup_many(section, keys))
+
+    def get(self, section: str, key: str) -> Any:
+        """
+        Get a configuration value stored under a section and a key.
+
+        :param section: Name of the section.
+        :param key: Name of the key.
+
+        :raises ConfigValueError: Configuration value couldn’t be found.
+        """
+        return asyncio.run(self.aget(section, key))
@@ -0,0 +1,160 @@
+import re
+from functools import lru_cache
+from typing import Any, Dict, List
+
+from .types import Converter
+
+_UNCHANGED = object()
+"""The string is returned as it is (it isn’t a Python literal)."""
+
+_CONTAINER = object()
+"""The string is a container literal. Containers are mutable and therefore
+evaluated again on each call instead of being memoized."""
+
+_IMMUTABLE_TYPES = (int, float, complex, bool, str, bytes, type(None))
+
+_INT = re.compile(r"[+-]?(?:0|[1-9][0-9]{0,17})")
+
+_FLOAT = re.compile(
+    r"[+-]?(?:[0-9]+\.[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?|[+-]?[0-9]+[eE][+-]?[0-9]+"
+)
+
+_QUOTED = re.compile(r"'[^'\\\n\r\0]*'|\"[^\"\\\n\r\0]*\"")
+
+_NAME = re.compile(r"[A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)*")
+"""Names and dotted names like ``localhost`` or ``smtp.example.com`` aren’t
+literals and are returned unchanged by :py:func:`ast.literal_eval`."""
+
+_CONSTANTS = {"True": True, "False": False, "None": None}
+
+
+def _literal_eval(value: str) -> Any:
+    # Imported on first use: only containers need the parser.
+    import ast
+
+    try:
+        return ast.literal_eval(value)
+    except ValueError:
+        return _UNCHANGED
+    # ERROR: test_method_send_email_with_config_reader
+    # (test_command_watcher.TestClassWatch)
+    # AttributeError: 'SyntaxError' object has no attribute 'filename'
+    except SyntaxError:
+        return _UNCHANGED
+
+
+@lru_cache(maxsize=1024)
+def _parse(value: str) -> Any:
+    """Convert a string into a scalar Python value. The results are memoized.
+
+    :return: The converted value, ``_UNCHANGED`` or ``_CONTAINER``.
+    """
+    if not value:
+        return _UNCHANGED
+    if value in _CONSTANTS:
+        return _CONSTANTS[value]
+    if _INT.fullmatch(value):
+        return int(value)
+    if _FLOAT.fullmatch(value):
+        return float(value)
+    if _NAME.fullmatch(value):
+        return _UNCHANGED
+    if _QUOTED.fullmatch(value) and value.isascii():
+        return value[1:-1]
+    result = _literal_eval(value)
+    if result is _UNCHANGED or isinstance(result, _IMMUTABLE_TYPES):
+        return result
+    return _CONTAINER
+
+
+def auto_type(value: Any) -> Any:
+    """Convert a string into the Python value it represents, like
+    :py:func:`ast.literal_eval` does. Values that aren’t Python literals are
+    returned unchanged.
+
+    Simple values (integers, floats, booleans, ``None``, quoted strings and
+    plain words) are parsed without building a syntax tree, and the results
+    are memoized. Only containers are handed to :py:func:`ast.literal_eval`.
+
+    https://stackoverflow.com/a/7019325
+    """
+    if not isinstance(value, str):
+        return value
+    result = _parse(value)
+    if result is _UNCHANGED:
+        return value
+    if result is _CONTAINER:
+        result = _literal_eval(value)
+        if result is _UNCHANGED:
+            return value
+    return result
+
+
+_BOOLEAN_STATES = {
+    "1": True,
+    "yes": True,
+    "true": True,
+    "on": True,
+    "0": False,
+    "no": False,
+    "false": False,
+    "off": False,
+}
+"""See :py:attr:`configparser.ConfigParser.BOOLEAN_STATES`."""
+
+
+def to_bool(value: Any) -> bool:
+    """Convert values like ``yes``, ``off``, ``1`` or ``True`` into a boolean.
+
+    :raises ValueError: If the value can’t be interpreted as a boolean.
+    """
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return bool(value)
+    if isinstance(value, str) and value.strip().lower() in _BOOLEAN_STATES:
+        return _BOOLEAN_STATES[value.strip().lower()]
+    raise ValueError("Not a boolean: {!r}".format(value))
+
+
+def to_list(value: Any) -> List[Any]:
+    """Convert a list literal (``[1, 2]``) or a comma separated string
+    (``a, b``) into a list.
+
+    :raises ValueError: If the value can’t be interpreted as a list.
+    """
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return list(value)
+    if isinstance(value, str):
+        stripped = value.strip()
+        if stripped[:1] in ("[", "("):
+            result = auto_type(stripped)
+            if isinstance(result, (list, tuple)):
+                return list(result)
+        if not stripped:
+            return []
+        return [item.strip() for item in stripped.split(",")]
+    raise ValueError("Not a list: {!r}".format(value))
+
+
+_CONVERTERS: Dict[Any, Converter] = {bool: to_bool, list: to_list}
+
+
+def compile_converter(type_: Converter) -> Converter:
+    """Turn the ``type`` of a key specification into a converter function.
+    ``None`` values (for example a ``None`` default) are not converted.
+
+    :param type_: ``int``, ``float``, ``bool``, ``str``, ``list`` or any
+      other callable.
+    """
+    function = _CONVERTERS.get(type_, type_)
+    if not callable(function):
+        raise TypeError("The type {!r} is not callable.".format(type_))
+
+    def convert(value: Any) -> Any:
+        if value is None:
+            return None
+        return function(value)
+
+    convert.__name__ = getattr(function, "__name__", "convert")
+    return convert
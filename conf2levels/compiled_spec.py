@@ -0,0 +1,167 @@
+import sys
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from .coercion import compile_converter
+from .exceptions import validate_key
+from .reader_base import MISSING
+from .types import Converter, Spec
+
+
+class KeyDescriptor:
+    """The compiled specification of a single key."""
+
+    __slots__ = ("section", "key", "description", "default", "not_empty", "converter")
+
+    section: str
+
+    key: str
+
+    description: Optional[str]
+
+    default: Any
+    """:py:data:`MISSING` if the key has no default value."""
+
+    not_empty: bool
+
+    converter: Optional[Converter]
+    """Compiled from the ``type`` of the key, see
+    :py:func:`compile_converter`."""
+
+    def __init__(
+        self,
+        section: str,
+        key: str,
+        description: Optional[str],
+        default: Any,
+        not_empty: bool,
+        converter: Optional[Converter],
+    ):
+        self.section = section
+        self.key = key
+        self.description = description
+        self.default = default
+        self.not_empty = not_empty
+        self.converter = converter
+
+    def __repr__(self) -> str:
+        return "KeyDescriptor({!r}, {!r})".format(self.section, self.key)
+
+
+class CompiledSpec:
+    """A specification compiled in a single pass into one
+    :py:class:`KeyDescriptor` per key, which holds the default value, the
+    ``not_empty`` flag and the converter of the key. The
+    :py:class:`SpecReader`, the validation and
+    :py:meth:`ConfigReader.spec_to_argparse` read the descriptors instead
+    of the nested dictionaries of the ``spec``. Keys with the same ``type``
+    share one converter.
+
+    A compiled specification can be passed to several
+    :py:class:`ConfigReader` objects instead of the dictionary, so a large
+    specification is only compiled and validated once. Don’t change the
+    dictionary after it is compiled.
+
+    :param spec: The specification dictionary.
+    :param strict: Validate the section and key names.
+
+    :raises ValueError: If ``strict`` is true and a name is invalid.
+    """
+
+    __slots__ = ("spec", "strict", "converters", "_sections", "_keys")
+
+    spec: Spec
+    """The specification dictionary the structure was compiled from."""
+
+    strict: bool
+    """Whether the section and key names are validated."""
+
+    converters: Dict[Tuple[str, str], Converter]
+    """``{('section', 'key'): converter}``, only the keys with a ``type``."""
+
+    _sections: Dict[str, Tuple[KeyDescriptor, ...]]
+    """The descriptors of each section, in the order of the specification."""
+
+    _keys: Dict[str, Dict[str, KeyDescriptor]]
+    """The same descriptors indexed by key: ``{'section': {'key': descriptor}}``"""
+
+    def __init__(self, spec: Spec, strict: bool = True):
+        intern = sys.intern
+        converters: Dict[Tuple[str, str], Converter] = {}
+        compiled: Dict[Any, Converter] = {}
+        sections: Dict[str, Tuple[KeyDescriptor, ...]] = {}
+        keys: Dict[str, Dict[str, KeyDescriptor]] = {}
+        for section, key_specs in spec.items():
+            if strict:
+                validate_key(section)
+            section = intern(section)
+            index: Dict[str, KeyDescriptor] = {}
+            for key, key_spec in key_specs.items():
+                if strict:
+                    validate_key(key)
+                key = intern(key)
+                converter = None
+                if "type" in key_spec:
+                    type_ = key_spec["type"]
+                    converter = compiled.get(type_)
+                    if converter is None:
+                        converter = compiled[type_] = compile_converter(type_)
+                    converters[(section, key)] = converter
+                index[key] = KeyDescriptor(
+                    section,
+                    key,
+                    key_spec.get("description"),
+                    key_spec.get("default", MISSING),
+                    bool(key_spec.get("not_empty")),
+                    converter,
+                )
+            sections[section] = tuple(index.values())
+            keys[section] = index
+        self.spec = spec
+        self.strict = strict
+        self.converters = converters
+        self._sections = sections
+        self._keys = keys
+
+    def __len__(self) -> int:
+        return sum(len(descriptors) for descriptors in self._sections.values())
+
+    def __contains__(self, name: object) -> bool:
+        if not isinstance(name, tuple) or len(name) != 2:
+            return False
+        return name[1] in self._keys.get(name[0], ())
+
+    def __iter__(self) -> Iterator[KeyDescriptor]:
+        for descriptors in self._sections.values():
+            yield from descriptors
+
+    def validate(self) -> None:
+        """Validate the section and key names of a specification compiled
+        without ``strict``. Afterwards it counts as strict.
+
+        :raises ValueError: If a name is invalid.
+        """
+        if not self.strict:
+            for section, descriptors in self._sections.items():
+                validate_key(section)
+                for descriptor in descriptors:
+                    validate_key(descriptor.key)
+            self.strict = True
+
+    def sections(self) -> Iterator[str]:
+        """Yield the names of the sections."""
+        return iter(self._sections)
+
+    def section(self, section: str) -> Tuple[KeyDescriptor, ...]:
+        """:return: The descriptors of the keys of a section, in the order
+        of the specification.
+
+        :raises KeyError: If the section isn’t specified."""
+        return self._sections[section]
+
+    def get(self, section: str, key: str) -> Optional[KeyDescriptor]:
+        """:return: The descriptor of a key or ``None`` if the key isn’t
+        specified."""
+        keys = self._keys.get(section)
+        if keys is None:
+            return None
+        return keys.get(key)
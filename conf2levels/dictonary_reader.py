@@ -1,14 +1,90 @@
-from typing import Any
+import threading
+from typing import Any, Dict, Iterable, Iterator, Optional, Set, Tuple
 
-from .reader_base import ReaderBase
+from .reader_base import MISSING, ReaderBase
 from .types import Dictionary
 
 
 class DictionaryReader(ReaderBase):
-    """Useful for default values."""
+    """Useful for default values.
+
+    Change the values with :py:meth:`set`, :py:meth:`update` and
+    :py:meth:`delete` if other threads read at the same time. These methods
+    don’t modify the dictionary in place: they build a changed copy and
+    replace the old dictionary in a single assignment, so readers see
+    either all or none of the changes. The dictionary passed to the
+    constructor isn’t used anymore after the first change.
+    """
+
+    _dictionary: Dictionary
 
     def __init__(self, dictionary: Dictionary):
         self._dictionary = dictionary
+        self._write_lock = threading.Lock()
+
+    def set(self, section: str, key: str, value: Any) -> None:
+        """Store a value under a section and a key."""
+        self.update({section: {key: value}})
+
+    def update(self, dictionary: Dictionary) -> None:
+        """Store the values of a two dimensional nested dictionary
+        ``{'section': {'key': 'value'}}``."""
+        names: Set[Tuple[str, str]] = set()
+        with self._write_lock:
+            old = self._dictionary
+            new = dict(old)
+            for section, values in dictionary.items():
+                keys = dict(old.get(section, {}))
+                for key, value in values.items():
+                    if keys.get(key, MISSING) != value:
+                        names.add((section, key))
+                    keys[key] = value
+                new[section] = keys
+            self._dictionary = new
+        self._notify(names)
+
+    def delete(self, section: str, key: str) -> None:
+        """Remove the value stored under a section and a key if there is
+        one."""
+        with self._write_lock:
+            old = self._dictionary
+            if key not in old.get(section, {}):
+                return
+            keys = dict(old[section])
+            del keys[key]
+            new = dict(old)
+            new[section] = keys
+            self._dictionary = new
+        self._notify({(section, key)})
+
+    def fingerprint(self) -> Optional[str]:
+        from .persistent import digest
+
+        return digest(self._dictionary)
+
+    def lookup(self, section: str, key: str) -> Any:
+        keys = self._dictionary.get(section)
+        if keys is None:
+            return MISSING
+        return keys.get(key, MISSING)
+
+    def source(self, section: str, key: str) -> str:
+        return "dictionary (section “{}” key “{}”)".format(section, key)
+
+    def sections(self) -> Iterator[str]:
+        return iter(self._dictionary)
+
+    def keys(self, section: str) -> Iterator[str]:
+        return iter(self._dictionary.get(section, ()))
+
+    def lookup_many(self, section: str, keys: Iterable[str]) -> Dict[str, Any]:
+        values = self._dictionary.get(section)
+        if not values:
+            return {}
+        return {key: values[key] for key in keys if key in values}
+
+    def get_section(self, section: str) -> Dict[str, Any]:
+        return dict(self._dictionary.get(section, {}))
 
     def get(self, section: str, key: str) -> Any:
         """
@@ -21,9 +97,9 @@ class DictionaryReader(ReaderBase):
 
         :return: The configuration value stored under a section and a key.
         """
-        try:
-            return self._dictionary[section][key]
-        except KeyError:
-            self._exception(
-                "In the dictionary is no value at dict[{}][{}]".format(section, key)
-            )
+        value = self.lookup(section, key)
+        if value is not MISSING:
+            return value
+        self._exception(
+            "In the dictionary is no value at dict[{}][{}]".format(section, key)
+        )
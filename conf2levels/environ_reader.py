@@ -1,7 +1,7 @@
 import os
-from typing import Any, Optional
+from typing import Any, Dict, Iterable, Iterator, Optional, Set, Tuple
 
-from .reader_base import ReaderBase
+from .reader_base import MISSING, ReaderBase
 
 
 class EnvironReader(ReaderBase):
@@ -9,10 +9,95 @@ class EnvironReader(ReaderBase):
     of the environment variables have to be in the form `prefix__section__key`.
     Note the two following underscores.
 
+    The environment is scanned once when the reader is created. Call
+    :py:meth:`refresh` to pick up later changes of the environment.
+
     :param prefix: A enviroment prefix"""
 
+    _index: Dict[str, Dict[str, str]]
+    """``{'section': {'key': 'value'}}``"""
+
+    _variables: Dict[str, str]
+    """The matching variables without the prefix: ``{'section__key': 'value'}``"""
+
     def __init__(self, prefix: Optional[str] = None):
         self._prefix = prefix
+        self.refresh()
+
+    def _scan(self) -> Tuple[Dict[str, Dict[str, str]], Dict[str, str]]:
+        prefix = "{}__".format(self._prefix) if self._prefix else ""
+        index: Dict[str, Dict[str, str]] = {}
+        variables: Dict[str, str] = {}
+        for name, value in os.environ.items():
+            if not name.startswith(prefix):
+                continue
+            name = name[len(prefix) :]
+            section, separator, key = name.partition("__")
+            if not separator:
+                continue
+            variables[name] = value
+            if section and key:
+                index.setdefault(section, {})[key] = value
+        return index, variables
+
+    def refresh(self) -> None:
+        """Scan the environment again and notify the subscribers about the
+        changed values."""
+        old = self.__dict__.get("_variables", {})
+        index, variables = self._scan()
+        self._index, self._variables = index, variables
+        names: Set[Tuple[str, str]] = set()
+        for name in old.keys() | variables.keys():
+            if old.get(name) != variables.get(name):
+                # Add every possible split of ambiguous names like `a__b__c`.
+                start = name.find("__")
+                while start != -1:
+                    names.add((name[:start], name[start + 2 :]))
+                    start = name.find("__", start + 1)
+        self._notify(names)
+
+    def changed(self) -> bool:
+        """Check whether the prefixed environment variables changed since the
+        last scan."""
+        return self._scan()[1] != self._variables
+
+    def fingerprint(self) -> Optional[str]:
+        from .persistent import digest
+
+        return digest(self._prefix, sorted(self._variables.items()))
+
+    def _variable_name(self, section: str, key: str) -> str:
+        if self._prefix:
+            return "{}__{}__{}".format(self._prefix, section, key)
+        return "{}__{}".format(section, key)
+
+    def source(self, section: str, key: str) -> str:
+        return "environment variable “{}”".format(self._variable_name(section, key))
+
+    def lookup(self, section: str, key: str) -> Any:
+        keys = self._index.get(section)
+        if keys is not None and key in keys:
+            return keys[key]
+        # The index splits the variable names at the first double underscore.
+        # Sections like `a__b` or `a_` need the unsplit name.
+        if "__" in section or section.endswith("_"):
+            return self._variables.get("{}__{}".format(section, key), MISSING)
+        return MISSING
+
+    def sections(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def keys(self, section: str) -> Iterator[str]:
+        return iter(self._index.get(section, ()))
+
+    def lookup_many(self, section: str, keys: Iterable[str]) -> Dict[str, Any]:
+        values = self._index.get(section)
+        if values is not None and not ("__" in section or section.endswith("_")):
+            return {key: values[key] for key in keys if key in values}
+        return super().lookup_many(section, keys)
+
+    def get_section(self, section: str) -> Dict[str, Any]:
+        return dict(self._index.get(section, {}))
 
     def get(self, section: str, key: str) -> Any:
         """
@@ -25,10 +110,11 @@ class EnvironReader(ReaderBase):
 
         :return: The configuration value stored under a section and a key.
         """
-        if self._prefix:
-            key = "{}__{}__{}".format(self._prefix, section, key)
-        else:
-            key = "{}__{}".format(section, key)
-        if key in os.environ:
-            return os.environ[key]
-        self._exception("Environment variable not found: {}".format(key))
+        value = self.lookup(section, key)
+        if value is not MISSING:
+            return value
+        self._exception(
+            "Environment variable not found: {}".format(
+                self._variable_name(section, key)
+            )
+        )
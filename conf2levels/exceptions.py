@@ -1,7 +1,9 @@
 import re
+import sys
+from typing import Set
 
 
-class ConfigValueError(Exception):
+class ConfigValueError(ValueError):
     """Configuration value can’t be found."""
 
 
@@ -9,9 +11,30 @@ class IniReaderError(Exception):
     """Ini file not valid."""
 
 
+_KEY_PATTERN = re.compile(r"^[a-zA-Z0-9_]+$")
+
+_MAX_VALID_KEYS = 65536
+
+_valid_keys: Set[str] = set()
+"""Interned names which already passed the validation."""
+
+
+def is_valid_key(key: str) -> bool:
+    """:param key: Check the name of a section or a key without raising an
+    exception. Valid names are remembered, so the regular expression runs
+    only once per name."""
+    if key in _valid_keys:
+        return True
+    if _KEY_PATTERN.match(key):
+        if len(_valid_keys) < _MAX_VALID_KEYS:
+            _valid_keys.add(sys.intern(key))
+        return True
+    return False
+
+
 def validate_key(key: str) -> bool:
     """:param key: Validate the name of a section or a key."""
-    if re.match(r"^[a-zA-Z0-9_]+$", key):
+    if key in _valid_keys or is_valid_key(key):
         return True
     raise ValueError(
         "The key “{}” contains invalid characters (allowed: a-zA-Z0-9_).".format(key)
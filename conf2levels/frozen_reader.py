@@ -0,0 +1,250 @@
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from .coercion import _IMMUTABLE_TYPES, auto_type
+from .exceptions import _KEY_PATTERN, validate_key
+from .reader_base import MISSING, ReaderBase
+from .reader_selector import ReaderSelector
+from .types import Converter
+
+
+class FrozenReader(ReaderBase):
+    """An immutable snapshot of already resolved configuration values. Each
+    lookup is a single dictionary access.
+
+    :param table: A dictionary like this one: ``{('section', 'key'): value}``.
+    :param converters: A dictionary like this one:
+      ``{('section', 'key'): converter}``. The value of such a key is
+      converted on its first typed read and the result is reused, unless
+      it is mutable (a list for example). A value
+      the converter rejects raises on each typed read, like in a
+      :py:class:`ReaderSelector`, and doesn’t prevent building the
+      snapshot.
+    :param sources: A dictionary like this one:
+      ``{('section', 'key'): 'description'}``. The origins of the values,
+      returned by :py:meth:`source`.
+    :param typed: Already converted values, for example restored from
+      disk: ``{('section', 'key'): converted_value}``. They are used
+      instead of the values of the converters. Mutable values are left
+      out.
+    :param folded: The values of readers with case insensitive keys (INI
+      files) by their lower case names: ``{('section', 'key'): value}``.
+      A name that isn’t in the table is looked up here with its key in
+      lower case, like :py:meth:`IniReader.lookup` does.
+    :param strict: Validate the names which aren’t found, like a strict
+      :py:class:`ReaderSelector`.
+    """
+
+    _table: "MappingProxyType[Tuple[str, str], Any]"
+
+    _converters: Dict[Tuple[str, str], Converter]
+
+    _typed: Dict[Tuple[str, str], Any]
+    """The already converted immutable values."""
+
+    _sources: Dict[Tuple[str, str], str]
+
+    _folded: Dict[Tuple[str, str], Any]
+
+    strict: bool
+
+    _sections: Dict[str, Dict[str, Any]]
+    """The same values grouped by section: ``{'section': {'key': value}}``"""
+
+    def __init__(
+        self,
+        table: Dict[Tuple[str, str], Any],
+        converters: Optional[Dict[Tuple[str, str], Converter]] = None,
+        sources: Optional[Dict[Tuple[str, str], str]] = None,
+        typed: Optional[Dict[Tuple[str, str], Any]] = None,
+        folded: Optional[Dict[Tuple[str, str], Any]] = None,
+        strict: bool = False,
+    ):
+        self._table = MappingProxyType(dict(table))
+        self._sources = dict(sources) if sources else {}
+        sections: Dict[str, Dict[str, Any]] = {}
+        for (section, key), value in self._table.items():
+            sections.setdefault(section, {})[key] = value
+        self._sections = sections
+        self._converters = dict(converters) if converters else {}
+        self._typed = (
+            {
+                name: value
+                for name, value in typed.items()
+                if isinstance(value, _IMMUTABLE_TYPES)
+            }
+            if typed
+            else {}
+        )
+        self._folded = dict(folded) if folded else {}
+        self.strict = strict
+
+    @classmethod
+    def from_reader(
+        cls,
+        reader: ReaderBase,
+        converters: Optional[Dict[Tuple[str, str], Converter]] = None,
+    ) -> "FrozenReader":
+        """Resolve every value the reader can list and build a snapshot of
+        them. The precedence of a :py:class:`ReaderSelector` is applied
+        while the snapshot is built. In the provenance mode of the selector
+        the snapshot keeps the origins of the values.
+
+        :param reader: Usually a :py:class:`ReaderSelector`. The snapshot
+          is strict if the selector is and then leaves out the invalid
+          names the readers list.
+        :param converters: See the class arguments.
+        """
+        table: Dict[Tuple[str, str], Any] = {}
+        folded: Dict[Tuple[str, str], Any] = {}
+        strict = isinstance(reader, ReaderSelector) and reader.strict
+        match = _KEY_PATTERN.match
+
+        def names(source: ReaderBase) -> Iterator[Tuple[str, str]]:
+            # A strict snapshot leaves out invalid names. They aren’t
+            # registered by is_valid_key(): most of them are never looked up.
+            for section, key in source._names():
+                if not strict or (match(section) and match(key)):
+                    yield section, key
+
+        if isinstance(reader, ReaderSelector):
+            # The reader with the highest precedence wins.
+            for source in reversed(reader.readers):
+                if source._case_insensitive_keys:
+                    for section, key in names(source):
+                        value = source.lookup(section, key)
+                        if value is not MISSING:
+                            folded[(section, key)] = value
+        if isinstance(reader, ReaderSelector) and reader._sources is not None:
+            sources: Dict[Tuple[str, str], str] = {}
+            for section, key in names(reader):
+                value, origin = reader._resolve_source(section, key)
+                if origin is not None:
+                    table[(section, key)] = value
+                    sources[(section, key)] = origin.source(section, key)
+            return cls(table, converters, sources, folded=folded, strict=strict)
+
+        resolve = (
+            reader._resolve if isinstance(reader, ReaderSelector) else reader.lookup
+        )
+        for section, key in names(reader):
+            value = resolve(section, key)
+            if value is not MISSING:
+                table[(section, key)] = value
+        return cls(table, converters, folded=folded, strict=strict)
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._table
+
+    def sections(self) -> Iterator[str]:
+        return iter(self._sections)
+
+    def keys(self, section: str) -> Iterator[str]:
+        return iter(self._sections.get(section, ()))
+
+    def _names(self) -> Iterator[Tuple[str, str]]:
+        return iter(self._table)
+
+    def source(self, section: str, key: str) -> str:
+        description = self._sources.get((section, key))
+        if description is not None:
+            return description
+        return super().source(section, key)
+
+    def _miss(self, section: str, key: str) -> Any:
+        """Look up a name which isn’t in the table."""
+        if self.strict:
+            validate_key(section)
+            validate_key(key)
+        if self._folded:
+            return self._folded.get((section, key.lower()), MISSING)
+        return MISSING
+
+    def lookup(self, section: str, key: str) -> Any:
+        value = self._table.get((section, key), MISSING)
+        if value is MISSING:
+            return self._miss(section, key)
+        return value
+
+    def lookup_many(self, section: str, keys: Iterable[str]) -> Dict[str, Any]:
+        values = self._sections.get(section, {})
+        found: Dict[str, Any] = {}
+        for key in keys:
+            value = values.get(key, MISSING)
+            if value is MISSING:
+                value = self._miss(section, key)
+            if value is not MISSING:
+                found[key] = value
+        return found
+
+    def get_section(self, section: str) -> Dict[str, Any]:
+        return dict(self._sections.get(section, {}))
+
+    def get(self, section: str, key: str) -> Any:
+        """
+        Get a configuration value stored under a section and a key.
+
+        :param section: Name of the section.
+        :param key: Name of the key.
+
+        :raises ConfigValueError: Configuration value couldn’t be found.
+
+        :return: The configuration value stored under a section and a key.
+        """
+        value = self._table.get((section, key), MISSING)
+        if value is MISSING:
+            value = self._miss(section, key)
+        if value is not MISSING:
+            return value
+        self._exception(
+            "Configuration value could not be found (section “{}” key “{}”).".format(
+                section, key
+            )
+        )
+
+    def _convert(self, section: str, key: str, value: Any) -> Any:
+        name = (section, key)
+        typed = self._typed.get(name, MISSING)
+        if typed is not MISSING:
+            return typed
+        converter = self._converters.get(name)
+        if converter is None:
+            return auto_type(value)
+        typed = converter(value)
+        if self._table.get(name, MISSING) is value and isinstance(
+            typed, _IMMUTABLE_TYPES
+        ):
+            self._typed[name] = typed
+        return typed
+
+    def _convert_all(self) -> Dict[Tuple[str, str], Any]:
+        """Convert the values of all keys with a converter.
+
+        :return: The converted values. Values the converters reject and
+          mutable values are left out.
+        """
+        for name, converter in self._converters.items():
+            if name in self._table and name not in self._typed:
+                try:
+                    typed = converter(self._table[name])
+                except (ValueError, TypeError):
+                    continue
+                if isinstance(typed, _IMMUTABLE_TYPES):
+                    self._typed[name] = typed
+        return dict(self._typed)
+
+    def get_typed(self, section: str, key: str) -> Any:
+        """
+        Get a configuration value converted by the converter of the key or
+        by :py:func:`auto_type`.
+
+        :param section: Name of the section.
+        :param key: Name of the key.
+        """
+        value = self._typed.get((section, key), MISSING)
+        if value is not MISSING:
+            return value
+        return self._convert(section, key, self.get(section, key))
@@ -1,24 +1,250 @@
+import glob
+import hashlib
+import marshal
 import os
-from configparser import ConfigParser
-from typing import Any
+import tempfile
+import threading
+from configparser import ConfigParser, InterpolationError
+from configparser import Error as ConfigParserError
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from .exceptions import IniReaderError
-from .reader_base import ReaderBase
+from .reader_base import MISSING, ReaderBase
+
+Table = Dict[str, Dict[str, str]]
+"""The parsed INI file: ``{'section': {'key': 'value'}}``"""
+
+_CACHE_FORMAT = 2
 
 
 class IniReader(ReaderBase):
     """Read configuration files from text files in the INI format.
 
+    The file is parsed by :py:class:`configparser.ConfigParser` into a
+    plain ``{'section': {'key': 'value'}}`` table. Keys are case
+    insensitive, values of the ``DEFAULT`` section are inherited by all
+    sections and interpolations are resolved at parse time. Values with
+    invalid interpolations are kept raw.
+
     :param path: The path of the INI file.
+    :param lazy: Only check the path at construction time and parse the
+      file on the first lookup.
+    :param cache_dir: Store the parsed table in this directory. Later
+      instances reuse it without running ``ConfigParser`` as long as the
+      modification time and the size of the INI file are unchanged.
+
+    The file can be reloaded with :py:meth:`reload` or polled in the
+    background with :py:meth:`watch`. A reloaded table replaces the old one
+    in a single assignment, so lookups see either the old or the new file.
     """
 
-    def __init__(self, path: str):
-        self._config = ConfigParser()
+    _case_insensitive_keys = True
+
+    _table: Optional[Table]
+
+    _signature: Optional[Tuple[Tuple[str, int, int], ...]]
+    """The path, the modification time and the size of each parsed file."""
+
+    _stop_watching: Optional[threading.Event]
+
+    def __init__(self, path: str, lazy: bool = False, cache_dir: Optional[str] = None):
         if not path or not os.path.exists(path):
             raise IniReaderError(
                 "Ini configuration path “{}” couldn’t be opened.".format(path)
             )
-        self._config.read_file(open(path))
+        self._path = path
+        self._initialize(lazy, cache_dir)
+
+    def _initialize(self, lazy: bool, cache_dir: Optional[str]) -> None:
+        self._cache_dir = cache_dir
+        self._table = None
+        self._signature = None
+        self._stop_watching = None
+        if not lazy:
+            self._load()
+
+    def _files(self) -> List[str]:
+        """The paths of the files to parse in the order of their increasing
+        precedence."""
+        return [self._path]
+
+    def _stat(self) -> Tuple[Tuple[str, int, int], ...]:
+        signature = []
+        for path in self._files():
+            stat = os.stat(path)
+            signature.append((path, stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def _get_table(self) -> Table:
+        table = self._table
+        if table is None:
+            table = self._load()
+        return table
+
+    def _load(self) -> Table:
+        signature = self._stat()
+        table = None
+        if self._cache_dir:
+            table = self._read_cache(signature)
+        if table is None:
+            table = self._parse()
+            if self._cache_dir:
+                self._write_cache(signature, table)
+        self._table = table
+        self._signature = signature
+        return table
+
+    def fingerprint(self) -> Optional[str]:
+        """Hash the paths, modification times, sizes and contents of the
+        files without parsing them."""
+        from .persistent import digest
+
+        contents = []
+        for path, mtime, size in self._stat():
+            with open(path, "rb") as ini_file:
+                contents.append(
+                    (path, mtime, size, hashlib.sha1(ini_file.read()).hexdigest())
+                )
+        return digest(contents)
+
+    def reload(self) -> bool:
+        """Parse the file again if its modification time or size changed and
+        notify the subscribers about the changed values.
+
+        :return: True if a new table was loaded.
+        """
+        old = self._table
+        if old is None:
+            return False
+        if self._stat() == self._signature:
+            return False
+        new = self._load()
+        if self._stat() != self._signature:
+            # A file was written while it was parsed. The next reload
+            # parses the complete file.
+            self._signature = None
+        self._notify(_changed_names(old, new))
+        return True
+
+    def watch(self, interval: float = 1.0) -> threading.Thread:
+        """Poll the file in a background thread and reload it when it
+        changes. A file which can’t be read or parsed is skipped and the
+        old values are kept.
+
+        :param interval: Seconds between two checks.
+        """
+        self.unwatch()
+        stop = threading.Event()
+        self._stop_watching = stop
+
+        def poll() -> None:
+            while not stop.wait(interval):
+                try:
+                    self.reload()
+                except (OSError, ConfigParserError):
+                    pass
+
+        thread = threading.Thread(
+            target=poll, name="IniReader.watch({})".format(self._path), daemon=True
+        )
+        thread.start()
+        return thread
+
+    def unwatch(self) -> None:
+        """Stop the background thread started by :py:meth:`watch`."""
+        if self._stop_watching is not None:
+            self._stop_watching.set()
+            self._stop_watching = None
+
+    def _parse(self) -> Table:
+        config = ConfigParser()
+        for path in self._files():
+            with open(path) as ini_file:
+                config.read_file(ini_file)
+        table: Table = {}
+        for section in [config.default_section] + config.sections():
+            keys: Dict[str, str] = {}
+            for key in config[section]:
+                try:
+                    keys[key] = config.get(section, key)
+                except InterpolationError:
+                    keys[key] = config.get(section, key, raw=True)
+            if keys or section != config.default_section:
+                table[section] = keys
+        return table
+
+    def _cache_key(self) -> str:
+        return os.path.abspath(self._path)
+
+    def _cache_path(self) -> str:
+        assert self._cache_dir
+        digest = hashlib.sha1(self._cache_key().encode()).hexdigest()
+        return os.path.join(self._cache_dir, "{}.ini-cache".format(digest))
+
+    def _cache_header(self, signature: Tuple[Any, ...]) -> Tuple[Any, ...]:
+        return (_CACHE_FORMAT, marshal.version, self._cache_key(), signature)
+
+    def _read_cache(self, signature: Tuple[Any, ...]) -> Optional[Table]:
+        try:
+            with open(self._cache_path(), "rb") as cache_file:
+                header, table = marshal.loads(cache_file.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if header != self._cache_header(signature) or not isinstance(table, dict):
+            return None
+        return table
+
+    def _write_cache(self, signature: Tuple[Any, ...], table: Table) -> None:
+        assert self._cache_dir
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            descriptor, tmp_path = tempfile.mkstemp(dir=self._cache_dir)
+        except OSError:
+            return
+        try:
+            with os.fdopen(descriptor, "wb") as cache_file:
+                marshal.dump((self._cache_header(signature), table), cache_file)
+            os.replace(tmp_path, self._cache_path())
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    def lookup(self, section: str, key: str) -> Any:
+        keys = self._get_table().get(section)
+        if keys is None:
+            return MISSING
+        value = keys.get(key, MISSING)
+        if value is MISSING:
+            value = keys.get(key.lower(), MISSING)
+        return value
+
+    def source(self, section: str, key: str) -> str:
+        return "INI file “{}” section “{}” key “{}”".format(self._path, section, key)
+
+    def sections(self) -> Iterator[str]:
+        for section in self._get_table():
+            if section != "DEFAULT":
+                yield section
+
+    def keys(self, section: str) -> Iterator[str]:
+        return iter(self._get_table().get(section, ()))
+
+    def lookup_many(self, section: str, keys: Iterable[str]) -> Dict[str, Any]:
+        values = self._get_table().get(section)
+        if values is None:
+            return {}
+        found: Dict[str, Any] = {}
+        for key in keys:
+            if key in values:
+                found[key] = values[key]
+            elif key.lower() in values:
+                found[key] = values[key.lower()]
+        return found
+
+    def get_section(self, section: str) -> Dict[str, Any]:
+        return dict(self._get_table().get(section, {}))
 
     def get(self, section: str, key: str) -> Any:
         """
@@ -31,10 +257,91 @@ class IniReader(ReaderBase):
 
         :return: The configuration value stored under a section and a key.
         """
-        try:
-            return self._config[section][key]
-        except KeyError:
-            self._exception(
-                "Configuration value could not be found "
-                "(section “{}” key “{}”).".format(section, key)
+        value = self.lookup(section, key)
+        if value is not MISSING:
+            return value
+        self._exception(
+            "Configuration value could not be found (section “{}” key “{}”).".format(
+                section, key
+            )
+        )
+
+
+def _changed_names(old: Table, new: Table) -> Set[Tuple[str, str]]:
+    """Compare two tables and return the ``(section, key)`` pairs whose
+    values were added, changed or removed."""
+    names: Set[Tuple[str, str]] = set()
+    for section in old.keys() | new.keys():
+        old_keys = old.get(section, {})
+        new_keys = new.get(section, {})
+        for key in old_keys.keys() | new_keys.keys():
+            if old_keys.get(key, MISSING) != new_keys.get(key, MISSING):
+                names.add((section, key))
+    return names
+
+
+class LayeredIniReader(IniReader):
+    """Read several INI files as one: later files override the values of
+    earlier files, like :py:meth:`configparser.ConfigParser.read` does. The
+    files are parsed into a single table, so a lookup costs the same as
+    with one file.
+
+    :param paths: Paths or glob patterns (``/etc/app.d/*.ini``) in the
+      order of their increasing precedence. The files matched by a pattern
+      are read in alphabetical order. Patterns are expanded again on each
+      :py:meth:`reload`, so added and removed files are noticed.
+    :param lazy: See :py:class:`IniReader`.
+    :param cache_dir: See :py:class:`IniReader`. The cached table is reused
+      as long as no file of the set changed.
+
+    :raises IniReaderError: If a path without glob characters doesn’t exist
+      or no file matches at all.
+    """
+
+    _patterns: List[str]
+
+    def __init__(
+        self, paths: Iterable[str], lazy: bool = False, cache_dir: Optional[str] = None
+    ):
+        self._patterns = list(paths)
+        for pattern in self._patterns:
+            if not _is_pattern(pattern) and not os.path.exists(pattern):
+                raise IniReaderError(
+                    "Ini configuration path “{}” couldn’t be opened.".format(pattern)
+                )
+        if not self._files():
+            raise IniReaderError(
+                "No ini configuration file found: {}".format(", ".join(self._patterns))
             )
+        self._path = ", ".join(self._patterns)
+        self._initialize(lazy, cache_dir)
+
+    def _files(self) -> List[str]:
+        files: List[str] = []
+        for pattern in self._patterns:
+            if _is_pattern(pattern):
+                files.extend(sorted(glob.glob(pattern)))
+            else:
+                files.append(pattern)
+        return files
+
+    def _cache_key(self) -> str:
+        return "\0".join(os.path.abspath(pattern) for pattern in self._patterns)
+
+    def source(self, section: str, key: str) -> str:
+        """Name the file with the highest precedence which sets the value.
+        The files are parsed again, so this is meant for debugging only."""
+        for path in reversed(self._files()):
+            config = ConfigParser(interpolation=None)
+            try:
+                with open(path) as ini_file:
+                    config.read_file(ini_file)
+            except (OSError, ConfigParserError):
+                continue
+            if config.has_option(section, key):
+                return "INI file “{}” section “{}” key “{}”".format(path, section, key)
+        return super().source(section, key)
+
+
+def _is_pattern(path: str) -> bool:
+    return any(character in path for character in "*?[")
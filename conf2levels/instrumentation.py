@@ -0,0 +1,178 @@
+from collections import Counter
+from time import perf_counter_ns
+from typing import Any, Callable, List, NamedTuple, Optional, Tuple
+
+from .exceptions import validate_key
+from .reader_base import MISSING, ReaderBase
+from .reader_selector import ReaderSelector
+
+
+class LookupEvent(NamedTuple):
+    """A single lookup passed to the callback of an
+    :py:class:`InstrumentedReaderSelector`."""
+
+    section: str
+
+    key: str
+
+    reader: Optional[ReaderBase]
+    """The reader which supplied the value, ``None`` if the value came from
+    the cache or wasn’t found."""
+
+    cached: bool
+
+    duration_ns: int
+
+
+LookupCallback = Callable[[LookupEvent], None]
+
+
+class ReaderStats(NamedTuple):
+    reader: ReaderBase
+
+    hits: int
+    """How often the reader supplied a value."""
+
+    misses: int
+    """How often the reader was asked and didn’t have the value."""
+
+    time_ns: int
+    """The time spent in the lookups of the reader."""
+
+
+class Stats(NamedTuple):
+    """A snapshot of the counters of an :py:class:`InstrumentedReaderSelector`."""
+
+    lookups: int
+
+    cache_hits: int
+
+    not_found: int
+
+    time_ns: int
+    """The time spent in all lookups, including the cache."""
+
+    readers: List[ReaderStats]
+    """In the order of precedence of the readers."""
+
+    keys: "Counter[Tuple[str, str]]"
+    """The number of lookups per ``(section, key)``. Use
+    :py:meth:`collections.Counter.most_common` to find the hot keys."""
+
+
+class InstrumentedReaderSelector(ReaderSelector):
+    """A :py:class:`ReaderSelector` which counts the hits and misses of each
+    reader, the lookups of each key and the time spent in the lookups.
+
+    The subclass is selected at construction time (``ConfigReader(instrument=True)``),
+    so a plain :py:class:`ReaderSelector` has no instrumentation overhead at
+    all. Bulk reads (:py:meth:`lookup_many`, :py:meth:`get_section`) aren’t
+    counted. The counters aren’t locked and may be slightly off if lookups
+    run in several threads at the same time.
+
+    :param callback: Called with a :py:class:`LookupEvent` after a lookup,
+      for example to export the lookups to a metrics system.
+    :param sample_every: Call the callback only for every n-th lookup.
+    """
+
+    _callback: Optional[LookupCallback]
+
+    _sample_every: int
+
+    def __init__(
+        self,
+        *readers: ReaderBase,
+        callback: Optional[LookupCallback] = None,
+        sample_every: int = 1,
+        **kwargs: Any,
+    ):
+        super().__init__(*readers, **kwargs)
+        self._callback = callback
+        self._sample_every = max(1, sample_every)
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        """Set all counters to zero."""
+        self._lookups = 0
+        self._cache_hits = 0
+        self._not_found = 0
+        self._time_ns = 0
+        self._hits = [0] * len(self.readers)
+        self._misses = [0] * len(self.readers)
+        self._reader_time_ns = [0] * len(self.readers)
+        self._keys: "Counter[Tuple[str, str]]" = Counter()
+
+    def stats(self) -> Stats:
+        """Return a snapshot of the counters."""
+        return Stats(
+            lookups=self._lookups,
+            cache_hits=self._cache_hits,
+            not_found=self._not_found,
+            time_ns=self._time_ns,
+            readers=[
+                ReaderStats(reader, hits, misses, time_ns)
+                for reader, hits, misses, time_ns in zip(
+                    self.readers, self._hits, self._misses, self._reader_time_ns
+                )
+            ],
+            keys=Counter(self._keys),
+        )
+
+    def lookup(self, section: str, key: str) -> Any:
+        start = perf_counter_ns()
+        reader: Optional[ReaderBase] = None
+        cached = False
+        cache = self._cache
+        value = MISSING
+        if cache is not None:
+            value = cache.get((section, key), MISSING)
+            if value is not MISSING:
+                cached = True
+                try:
+                    cache.move_to_end((section, key))
+                except KeyError:
+                    pass
+        if not cached:
+            if self.strict:
+                validate_key(section)
+                validate_key(key)
+            generation = self._generation
+            value, reader = self._resolve_counted(section, key)
+            if self._sources is not None and reader is not None:
+                self._sources[(section, key)] = reader
+            if cache is not None and value is not MISSING:
+                self._remember(cache, section, key, value, generation)
+        duration = perf_counter_ns() - start
+
+        self._lookups += 1
+        self._time_ns += duration
+        self._keys[(section, key)] += 1
+        if cached:
+            self._cache_hits += 1
+        elif value is MISSING:
+            self._not_found += 1
+        callback = self._callback
+        if callback is not None and self._lookups % self._sample_every == 0:
+            callback(LookupEvent(section, key, reader, cached, duration))
+        return value
+
+    def _resolve(self, section: str, key: str) -> Any:
+        return self._resolve_counted(section, key)[0]
+
+    def _resolve_source(
+        self, section: str, key: str
+    ) -> Tuple[Any, Optional[ReaderBase]]:
+        return self._resolve_counted(section, key)
+
+    def _resolve_counted(
+        self, section: str, key: str
+    ) -> Tuple[Any, Optional[ReaderBase]]:
+        for index, reader in enumerate(self.readers):
+            start = perf_counter_ns()
+            value = reader.lookup(section, key)
+            self._reader_time_ns[index] += perf_counter_ns() - start
+            if value is not MISSING:
+                self._hits[index] += 1
+                return value, reader
+            self._misses[index] += 1
+        return MISSING, None
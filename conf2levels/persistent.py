@@ -0,0 +1,141 @@
+import hashlib
+import json
+import marshal
+import os
+import tempfile
+from types import CodeType, FunctionType
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .frozen_reader import FrozenReader
+from .reader_base import ReaderBase
+from .types import Converter
+
+_FORMAT = 3
+
+_coercion: Optional[str] = None
+
+
+def _code_digest(code: CodeType) -> str:
+    return hashlib.sha1(marshal.dumps(code)).hexdigest()
+
+
+def _name(value: Any) -> str:
+    if callable(value) and hasattr(value, "__qualname__"):
+        name = "{}.{}".format(getattr(value, "__module__", ""), value.__qualname__)
+        code = getattr(value, "__code__", None)
+        if isinstance(code, CodeType):
+            name += ":" + _code_digest(code)
+        return name
+    return repr(value)
+
+
+def _coercion_digest() -> str:
+    """Hash the code of the coercion rules, so the converted values of a
+    snapshot aren’t reused after an upgrade changed them. (Reading the
+    version of the installed package through :py:mod:`importlib.metadata`
+    takes longer than loading a snapshot.)"""
+    global _coercion
+    if _coercion is None:
+        from . import coercion
+
+        codes = []
+        for name, value in sorted(vars(coercion).items()):
+            function = getattr(value, "__wrapped__", value)
+            if (
+                isinstance(function, FunctionType)
+                and function.__module__ == coercion.__name__
+            ):
+                codes.append((name, _code_digest(function.__code__)))
+        _coercion = digest(codes)
+    return _coercion
+
+
+def stable_repr(value: Any) -> str:
+    """Represent a value the same way in each process. Functions and classes
+    (for example the ``type`` of a key specification) are represented by
+    their qualified names instead of their memory addresses. Functions are
+    also represented by a hash of their code, so a snapshot is rebuilt if
+    the body of a converter changes."""
+    return json.dumps(value, default=_name, skipkeys=True)
+
+
+def digest(*values: Any) -> str:
+    """Hash values with :py:func:`stable_repr`."""
+    return hashlib.sha1(stable_repr(values).encode()).hexdigest()
+
+
+def fingerprint(readers: Iterable[ReaderBase]) -> Optional[str]:
+    """Combine the fingerprints of all readers.
+
+    :return: ``None`` if a reader can’t compute a fingerprint.
+    """
+    parts: List[Tuple[str, str]] = []
+    for reader in readers:
+        part = reader.fingerprint()
+        if part is None:
+            return None
+        parts.append((type(reader).__qualname__, part))
+    return digest(_FORMAT, marshal.version, _coercion_digest(), parts)
+
+
+def load_snapshot(
+    path: str,
+    fingerprint: str,
+    converters: Optional[Dict[Tuple[str, str], Converter]] = None,
+    strict: bool = False,
+) -> Optional[FrozenReader]:
+    """Load a snapshot written by :py:func:`save_snapshot`.
+
+    :param converters: Convert the values which weren’t stored converted
+      (the values their converters rejected).
+    :param strict: See :py:class:`FrozenReader`.
+
+    :return: ``None`` if the file can’t be read or was written for other
+      sources.
+    """
+    try:
+        with open(path, "rb") as snapshot_file:
+            header, table, typed, sources, folded = marshal.loads(snapshot_file.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if header != (_FORMAT, fingerprint):
+        return None
+    return FrozenReader(
+        table, converters, sources=sources, typed=typed, folded=folded, strict=strict
+    )
+
+
+def save_snapshot(path: str, fingerprint: str, snapshot: FrozenReader) -> bool:
+    """Write the raw and the converted values of a snapshot into a file.
+    The file is replaced atomically.
+
+    :return: False if the values can’t be marshalled (for example objects
+      returned by custom converters) or the file can’t be written.
+    """
+    try:
+        data = marshal.dumps(
+            (
+                (_FORMAT, fingerprint),
+                dict(snapshot._table),
+                snapshot._convert_all(),
+                snapshot._sources,
+                snapshot._folded,
+            )
+        )
+    except ValueError:
+        return False
+    try:
+        descriptor, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".")
+    except OSError:
+        return False
+    try:
+        with os.fdopen(descriptor, "wb") as snapshot_file:
+            snapshot_file.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        return False
+    return True
@@ -1,16 +1,268 @@
+import weakref
 from abc import ABCMeta, abstractmethod
-from typing import Any
+from types import MethodType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
+from .coercion import auto_type
 from .exceptions import ConfigValueError
 
 
+class _Missing:
+    """The type of the :py:data:`MISSING` sentinel."""
+
+    def __repr__(self) -> str:
+        return "MISSING"
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __reduce__(self) -> str:
+        return "MISSING"
+
+
+MISSING: Any = _Missing()
+"""Returned by :py:meth:`ReaderBase.lookup` if a reader has no value stored
+under a section and a key."""
+
+
+ChangeCallback = Callable[[Set[Tuple[str, str]]], None]
+"""Called with the ``(section, key)`` pairs whose values changed."""
+
+
+class Provenance(NamedTuple):
+    """Where a configuration value came from, see
+    :py:meth:`ReaderBase.explain`."""
+
+    section: str
+
+    key: str
+
+    value: Any
+    """The raw value."""
+
+    reader: "ReaderBase"
+    """The reader which supplied the value."""
+
+    source: str
+    """A description like ``environment variable “PREFIX__section__key”``."""
+
+
 class ReaderBase(object, metaclass=ABCMeta):
     """Base class for all readers"""
 
+    _listeners: List[Union[ChangeCallback, "weakref.WeakMethod[ChangeCallback]"]]
+
+    _case_insensitive_keys = False
+    """Whether the keys are stored in lower case and :py:meth:`lookup` finds
+    them in any case, see :py:class:`FrozenReader`."""
+
     def _exception(self, msg: str) -> None:
         """:raises: ConfigValueError"""
         raise ConfigValueError(msg)
 
+    def subscribe(self, callback: ChangeCallback) -> None:
+        """Register a function which is called with the names of the changed
+        values each time the source of the reader is reloaded.
+
+        Bound methods are referenced weakly, so a subscribed object (for
+        example a :py:class:`ReaderSelector` sharing this reader with
+        others) can be garbage collected. Other functions are referenced
+        strongly."""
+        listener: Union[ChangeCallback, "weakref.WeakMethod[ChangeCallback]"]
+        if isinstance(callback, MethodType):
+            listener = weakref.WeakMethod(callback)
+        else:
+            listener = callback
+        # Copy on write: _notify may iterate over the list in another thread.
+        self._listeners = self._live_listeners() + [listener]
+
+    def _live_listeners(
+        self,
+    ) -> List[Union[ChangeCallback, "weakref.WeakMethod[ChangeCallback]"]]:
+        return [
+            listener
+            for listener in self.__dict__.get("_listeners", ())
+            if not isinstance(listener, weakref.WeakMethod) or listener() is not None
+        ]
+
+    def _notify(self, names: Set[Tuple[str, str]]) -> None:
+        if not names:
+            return
+        dead = False
+        for listener in self.__dict__.get("_listeners", ()):
+            if isinstance(listener, weakref.WeakMethod):
+                callback = listener()
+                if callback is None:
+                    dead = True
+                    continue
+            else:
+                callback = listener
+            callback(names)
+        if dead:
+            self._listeners = self._live_listeners()
+
+    def sections(self) -> Iterator[str]:
+        """Yield the names of the sections the reader has values for.
+        Readers that can’t list their values yield nothing."""
+        return iter(())
+
+    def keys(self, section: str) -> Iterator[str]:
+        """Yield the names of the keys of a section the reader has values
+        for. Readers that can’t list their values yield nothing.
+
+        :param section: Name of the section.
+        """
+        return iter(())
+
+    def items(self, section: str) -> Iterator[Tuple[str, Any]]:
+        """Yield the ``(key, value)`` pairs of a section.
+
+        :param section: Name of the section.
+        """
+        return iter(self.get_section(section).items())
+
+    def _names(self) -> Iterator[Tuple[str, str]]:
+        """Yield the ``(section, key)`` pairs the reader has values for."""
+        for section in self.sections():
+            for key in self.keys(section):
+                yield section, key
+
+    def lookup(self, section: str, key: str) -> Any:
+        """
+        Look up a configuration value without raising an exception.
+
+        The default implementation falls back to :py:meth:`get`; the
+        built-in readers implement it directly, so a miss costs no
+        exception and no formatted message.
+
+        :param section: Name of the section.
+        :param key: Name of the key.
+
+        :return: The configuration value or :py:data:`MISSING`.
+        """
+        try:
+            return self.get(section, key)
+        except ConfigValueError:
+            return MISSING
+
+    def lookup_many(self, section: str, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        Look up several configuration values of one section.
+
+        :param section: Name of the section.
+        :param keys: Names of the keys.
+
+        :return: A dictionary of the keys the reader has values for.
+        """
+        values: Dict[str, Any] = {}
+        for key in keys:
+            value = self.lookup(section, key)
+            if value is not MISSING:
+                values[key] = value
+        return values
+
+    def get_section(self, section: str) -> Dict[str, Any]:
+        """
+        Get all configuration values of a section the reader can list.
+
+        :param section: Name of the section.
+
+        :return: A dictionary like this one: ``{'key': 'value'}``
+        """
+        return self.lookup_many(section, self.keys(section))
+
+    def get_many(self, names: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], Any]:
+        """
+        Get several configuration values. The keys are looked up section
+        by section with :py:meth:`lookup_many`.
+
+        :param names: ``(section, key)`` pairs.
+
+        :raises ValueError: If values can’t be found.
+
+        :return: A dictionary like this one: ``{('section', 'key'): 'value'}``
+        """
+        sections: Dict[str, List[str]] = {}
+        for section, key in names:
+            sections.setdefault(section, []).append(key)
+        values: Dict[Tuple[str, str], Any] = {}
+        missing: List[Tuple[str, str]] = []
+        for section, keys in sections.items():
+            found = self.lookup_many(section, keys)
+            for key in keys:
+                if key in found:
+                    values[(section, key)] = found[key]
+                else:
+                    missing.append((section, key))
+        if missing:
+            raise ValueError(
+                "Configuration value could not be found {}.".format(
+                    ", ".join(
+                        "(section “{}” key “{}”)".format(section, key)
+                        for section, key in missing
+                    )
+                )
+            )
+        return values
+
+    def source(self, section: str, key: str) -> str:
+        """Describe where the reader reads the value of a section and a key
+        from, for example the name of an environment variable.
+
+        :param section: Name of the section.
+        :param key: Name of the key.
+        """
+        return "{} (section “{}” key “{}”)".format(
+            self.__class__.__name__, section, key
+        )
+
+    def fingerprint(self) -> Optional[str]:
+        """Hash everything the values of the reader depend on, so a
+        persisted snapshot of the values can be reused as long as the
+        fingerprint doesn’t change.
+
+        :return: ``None`` if the reader can’t compute a fingerprint.
+        """
+        return None
+
+    def explain(self, section: str, key: str) -> Provenance:
+        """
+        Get a configuration value together with its origin.
+
+        :param section: Name of the section.
+        :param key: Name of the key.
+
+        :raises ValueError: Configuration value couldn’t be found.
+        """
+        return Provenance(
+            section, key, self.get(section, key), self, self.source(section, key)
+        )
+
     @abstractmethod
     def get(self, section: str, key: str) -> Any:
         raise NotImplementedError("A reader class must have a `get` method.")
+
+    def _convert(self, section: str, key: str, value: Any) -> Any:
+        return auto_type(value)
+
+    def get_typed(self, section: str, key: str) -> Any:
+        """
+        Get a configuration value and convert it into a Python value with
+        :py:func:`auto_type`.
+
+        :param section: Name of the section.
+        :param key: Name of the key.
+        """
+        return self._convert(section, key, self.get(section, key))
@@ -0,0 +1,567 @@
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .coercion import _IMMUTABLE_TYPES, auto_type
+from .exceptions import is_valid_key, validate_key
+from .reader_base import MISSING, ChangeCallback, Provenance, ReaderBase
+from .types import Converter
+
+
+class ReaderSelector(ReaderBase):
+    """Select for each get request which reader to use.
+
+    :param readers: The readers in the order of their precedence.
+    :param cache_size: Remember up to this number of resolved values
+      (least recently used values are evicted first). ``None`` or ``0``
+      disables the cache.
+    :param converters: A dictionary like this one:
+      ``{('section', 'key'): converter}``. These values are converted by
+      :py:meth:`get_typed` with the converter instead of :py:func:`auto_type`.
+    :param strict: Validate the names of sections and keys on each lookup.
+      Trusted callers can switch the validation off.
+    :param provenance: Remember which reader supplied each resolved value.
+      The reader is recorded in the same pass that resolves the value, see
+      :py:meth:`explain`.
+
+    The selector subscribes to the changes of its readers only if it has
+    something to invalidate (a cache, converters or the provenance mode)
+    or if it has subscribers itself.
+    """
+
+    cache_size: Optional[int]
+
+    strict: bool
+
+    _cache: Optional["OrderedDict[Tuple[str, str], Any]"]
+
+    _converters: Dict[Tuple[str, str], Converter]
+
+    _converted: Dict[Tuple[str, str], Tuple[Any, Any]]
+    """``{('section', 'key'): (raw_value, converted_value)}``. Mutable
+    converted values (lists for example) aren’t kept: each read gets its
+    own."""
+
+    _sources: Optional[Dict[Tuple[str, str], ReaderBase]]
+    """``{('section', 'key'): reader}`` in the provenance mode."""
+
+    _generation: int
+    """Incremented each time values are forgotten. A value resolved while
+    the generation changed isn’t kept in the cache, because it may be
+    older than the change."""
+
+    _mixed_case: Set[Tuple[str, str]]
+    """The cached names whose keys aren’t lower case, see
+    :py:meth:`_forget`."""
+
+    def __init__(
+        self,
+        *readers: ReaderBase,
+        cache_size: Optional[int] = None,
+        converters: Optional[Dict[Tuple[str, str], Converter]] = None,
+        strict: bool = True,
+        provenance: bool = False,
+    ):
+        self.readers = readers
+        """A list of readers."""
+
+        self.strict = strict
+        self.cache_size = cache_size
+        self._cache = OrderedDict() if cache_size else None
+        self._converters = converters or {}
+        self._converted = {}
+        self._sources = {} if provenance else None
+        self._generation = 0
+        self._mixed_case = set()
+        self._subscribed = False
+        if cache_size or self._converters or provenance:
+            self._subscribe_readers()
+
+    def _subscribe_readers(self) -> None:
+        if not self._subscribed:
+            self._subscribed = True
+            for reader in self.readers:
+                reader.subscribe(self._forget)
+
+    def subscribe(self, callback: ChangeCallback) -> None:
+        super().subscribe(callback)
+        self._subscribe_readers()
+
+    def sections(self) -> Iterator[str]:
+        """Yield the sections of all readers, each section only once."""
+        seen: Set[str] = set()
+        for reader in self.readers:
+            for section in reader.sections():
+                if section not in seen:
+                    seen.add(section)
+                    yield section
+
+    def keys(self, section: str) -> Iterator[str]:
+        """Yield the keys of a section of all readers, each key only once.
+
+        :param section: Name of the section.
+        """
+        seen: Set[str] = set()
+        for reader in self.readers:
+            for key in reader.keys(section):
+                if key not in seen:
+                    seen.add(key)
+                    yield key
+
+    def items(self, section: str) -> Iterator[Tuple[str, Any]]:
+        """Yield the ``(key, value)`` pairs of a section. The values are
+        resolved key by key in the order of precedence of the readers.
+
+        :param section: Name of the section.
+        """
+        if self.strict and not is_valid_key(section):
+            return
+        for key in self.keys(section):
+            if self.strict and not is_valid_key(key):
+                continue
+            value = self._resolve(section, key)
+            if value is not MISSING:
+                yield key, value
+
+    @staticmethod
+    def _validate_key(key: str) -> bool:
+        return validate_key(key)
+
+    def lookup(self, section: str, key: str) -> Any:
+        """
+        Look up a configuration value in the readers in the order of their
+        precedence.
+
+        :param section: Name of the section.
+        :param key: Name of the key.
+
+        :return: The configuration value or :py:data:`MISSING`.
+        """
+        cache = self._cache
+        if cache is not None:
+            value = cache.get((section, key), MISSING)
+            if value is not MISSING:
+                try:
+                    cache.move_to_end((section, key))
+                except KeyError:
+                    pass
+                return value
+
+        if self.strict:
+            validate_key(section)
+            validate_key(key)
+        generation = self._generation
+        sources = self._sources
+        if sources is None:
+            value = self._resolve(section, key)
+        else:
+            value, reader = self._resolve_source(section, key)
+            if reader is not None:
+                sources[(section, key)] = reader
+        if cache is not None and value is not MISSING:
+            self._remember(cache, section, key, value, generation)
+        return value
+
+    def lookup_many(self, section: str, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        Look up several configuration values of one section. Each reader is
+        asked once for all keys it hasn’t been answered yet.
+
+        :param section: Name of the section.
+        :param keys: Names of the keys.
+
+        :return: A dictionary of the keys with values.
+        """
+        values: Dict[str, Any] = {}
+        cache = self._cache
+        generation = self._generation
+        pending: List[str] = []
+        for key in keys:
+            if cache is not None and (section, key) in cache:
+                value = cache.get((section, key), MISSING)
+                if value is not MISSING:
+                    values[key] = value
+                    continue
+            pending.append(key)
+        if self.strict and pending:
+            validate_key(section)
+            for key in pending:
+                validate_key(key)
+        for reader in self.readers:
+            if not pending:
+                break
+            found = reader.lookup_many(section, pending)
+            if found:
+                values.update(found)
+                if self._sources is not None:
+                    for key in found:
+                        self._sources[(section, key)] = reader
+                if cache is not None:
+                    for key, value in found.items():
+                        self._remember(cache, section, key, value, generation)
+                pending = [key for key in pending if key not in found]
+        return values
+
+    def get_section(self, section: str) -> Dict[str, Any]:
+        """
+        Get the merged configuration values of a section. Each reader is
+        asked once and the values of the readers with a higher precedence
+        win.
+
+        :param section: Name of the section.
+
+        :return: A dictionary like this one: ``{'key': 'value'}``
+        """
+        if self.strict:
+            validate_key(section)
+        values: Dict[str, Any] = {}
+        for reader in reversed(self.readers):
+            values.update(reader.get_section(section))
+        return values
+
+    def _resolve(self, section: str, key: str) -> Any:
+        """Walk the readers without validating the names and without
+        consulting the cache."""
+        for reader in self.readers:
+            value = reader.lookup(section, key)
+            if value is not MISSING:
+                return value
+        return MISSING
+
+    def _resolve_source(
+        self, section: str, key: str
+    ) -> Tuple[Any, Optional[ReaderBase]]:
+        """Like :py:meth:`_resolve`, but also return the reader which
+        supplied the value."""
+        for reader in self.readers:
+            value = reader.lookup(section, key)
+            if value is not MISSING:
+                return value, reader
+        return MISSING, None
+
+    def explain(self, section: str, key: str) -> Provenance:
+        """
+        Get a configuration value together with the reader which supplied
+        it. In the provenance mode a value resolved before isn’t looked up
+        again if it is cached.
+
+        :param section: Name of the section.
+        :param key: Name of the key.
+
+        :raises ValueError: Configuration value couldn’t be found.
+        """
+        value: Any = MISSING
+        reader: Optional[ReaderBase] = None
+        if self._sources is not None:
+            value = self.lookup(section, key)
+            reader = self._sources.get((section, key))
+        if reader is None:
+            if self.strict:
+                validate_key(section)
+                validate_key(key)
+            value, reader = self._resolve_source(section, key)
+        if reader is None:
+            raise ValueError(
+                "Configuration value could not be found "
+                "(section “{}” key “{}”).".format(section, key)
+            )
+        return Provenance(section, key, value, reader, reader.source(section, key))
+
+    def source(self, section: str, key: str) -> str:
+        """Describe where the value of a section and a key comes from.
+
+        :raises ValueError: Configuration value couldn’t be found.
+        """
+        return self.explain(section, key).source
+
+    def get(self, section: str, key: str) -> Any:
+        """
+        Get a configuration value stored under a section and a key.
+
+        :param section: Name of the section.
+        :param key: Name of the key.
+        """
+        value = self.lookup(section, key)
+        if value is not MISSING:
+            return value
+        raise ValueError(
+            "Configuration value could not be found (section “{}” key “{}”).".format(
+                section, key
+            )
+        )
+
+    def get_typed(self, section: str, key: str) -> Any:
+        """
+        Get a configuration value converted by the converter of the key or
+        by :py:func:`auto_type`. A converted value is reused as long as the
+        raw value doesn’t change.
+
+        :param section: Name of the section.
+        :param key: Name of the key.
+        """
+        return self._convert(section, key, self.get(section, key))
+
+    def _async_cache(self) -> Optional["OrderedDict[Tuple[str, str], Any]"]:
+        """:return: The cache of the asynchronous lookups. If no
+        ``cache_size`` was specified, an unbounded cache is enabled only if
+        one of the readers is asynchronous: the values of the synchronous
+        readers are cheap to look up again."""
+        cache = self._cache
+        if cache is None:
+            from .async_reader import AsyncReaderBase
+
+            if any(isinstance(reader, AsyncReaderBase) for reader in self.readers):
+                cache = self._cache = OrderedDict()
+                self._subscribe_readers()
+        return cache
+
+    async def alookup(self, section: str, key: str) -> Any:
+        """
+        Look up a configuration value without blocking the event loop.
+
+        The synchronous readers with the highest precedence are asked
+        first. If none of them has the value, the asynchronous readers are
+        queried concurrently and the value of the reader with the highest
+        precedence wins. Lookups of readers with a lower precedence are
+        cancelled as soon as the result is known.
+
+        The resolved values are cached. If no ``cache_size`` was specified,
+        an unbounded cache is enabled by the first asynchronous lookup of a
+        selector with asynchronous readers.
+
+        :param section: Name of the section.
+        :param key: Name of the key.
+
+        :return: The configuration value or :py:data:`MISSING`.
+        """
+        import asyncio
+
+        from .async_reader import AsyncReaderBase
+
+        cache = self._async_cache()
+        generation = self._generation
+        if cache is not None:
+            value = cache.get((section, key), MISSING)
+            if value is not MISSING:
+                return value
+        if self.strict:
+            validate_key(section)
+            validate_key(key)
+
+        readers = self.readers
+        start = 0
+        while start < len(readers) and not isinstance(readers[start], AsyncReaderBase):
+            value = readers[start].lookup(section, key)
+            if value is not MISSING:
+                return self._record(
+                    cache, section, key, value, readers[start], generation
+                )
+            start += 1
+
+        tasks: Dict[int, "asyncio.Future[Any]"] = {}
+        for index in range(start, len(readers)):
+            reader = readers[index]
+            if isinstance(reader, AsyncReaderBase):
+                tasks[index] = asyncio.ensure_future(reader.alookup(section, key))
+        try:
+            for index in range(start, len(readers)):
+                reader = readers[index]
+                if index in tasks:
+                    value = await tasks[index]
+                else:
+                    value = reader.lookup(section, key)
+                if value is not MISSING:
+                    return self._record(cache, section, key, value, reader, generation)
+        finally:
+            for task in tasks.values():
+                task.cancel()
+        return MISSING
+
+    async def alookup_many(self, section: str, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        Look up several configuration values of one section without
+        blocking the event loop. All readers are queried concurrently, each
+        of them once for all keys, and the values of the readers with a
+        higher precedence win. The values are cached like the values of
+        :py:meth:`alookup`.
+
+        :param section: Name of the section.
+        :param keys: Names of the keys.
+
+        :return: A dictionary of the keys with values.
+        """
+        import asyncio
+
+        from .async_reader import AsyncReaderBase
+
+        cache = self._async_cache()
+        generation = self._generation
+        values: Dict[str, Any] = {}
+        pending: List[str] = []
+        for key in keys:
+            value = MISSING if cache is None else cache.get((section, key), MISSING)
+            if value is not MISSING:
+                values[key] = value
+            else:
+                pending.append(key)
+        if not pending:
+            return values
+        if self.strict:
+            validate_key(section)
+            for key in pending:
+                validate_key(key)
+
+        async def ask(reader: ReaderBase) -> Dict[str, Any]:
+            if isinstance(reader, AsyncReaderBase):
+                return await reader.alookup_many(section, pending)
+            return reader.lookup_many(section, pending)
+
+        results: List[Dict[str, Any]] = await asyncio.gather(
+            *(ask(reader) for reader in self.readers)
+        )
+        for reader, found in zip(self.readers, results):
+            for key, value in found.items():
+                if key not in values:
+                    values[key] = self._record(
+                        cache, section, key, value, reader, generation
+                    )
+        return values
+
+    async def aget(self, section: str, key: str) -> Any:
+        """
+        Get a configuration value without blocking the event loop, see
+        :py:meth:`alookup`.
+
+        :param section: Name of the section.
+        :param key: Name of the key.
+        """
+        value = await self.alookup(section, key)
+        if value is not MISSING:
+            return value
+        raise ValueError(
+            "Configuration value could not be found (section “{}” key “{}”).".format(
+                section, key
+            )
+        )
+
+    async def aget_typed(self, section: str, key: str) -> Any:
+        """
+        Get a configuration value without blocking the event loop and
+        convert it like :py:meth:`get_typed`.
+
+        :param section: Name of the section.
+        :param key: Name of the key.
+        """
+        return self._convert(section, key, await self.aget(section, key))
+
+    def _record(
+        self,
+        cache: Optional["OrderedDict[Tuple[str, str], Any]"],
+        section: str,
+        key: str,
+        value: Any,
+        reader: ReaderBase,
+        generation: int,
+    ) -> Any:
+        if self._sources is not None:
+            self._sources[(section, key)] = reader
+        if cache is not None:
+            self._remember(cache, section, key, value, generation)
+        return value
+
+    def _convert(self, section: str, key: str, value: Any) -> Any:
+        converter = self._converters.get((section, key))
+        if converter is None:
+            return auto_type(value)
+        converted = self._converted.get((section, key))
+        if (
+            converted is not None
+            and type(converted[0]) is type(value)
+            and converted[0] == value
+        ):
+            return converted[1]
+        result = converter(value)
+        if isinstance(result, _IMMUTABLE_TYPES):
+            self._converted[(section, key)] = (value, result)
+        return result
+
+    def _remember(
+        self,
+        cache: "OrderedDict[Tuple[str, str], Any]",
+        section: str,
+        key: str,
+        value: Any,
+        generation: int,
+    ) -> None:
+        """Cache a value resolved while the generation was ``generation``."""
+        name = (section, key)
+        cache[name] = value
+        if key != key.lower():
+            self._mixed_case.add(name)
+        if self._generation != generation:
+            # A reader reported changes while the value was resolved. The
+            # generation is checked after storing: either _forget sees the
+            # stored value or this check sees the new generation.
+            cache.pop(name, None)
+            return
+        if self.cache_size is not None and len(cache) > self.cache_size:
+            try:
+                name, _ = cache.popitem(last=False)
+            except KeyError:
+                return
+            self._mixed_case.discard(name)
+            if self._sources is not None:
+                self._sources.pop(name, None)
+
+    def _forget(self, names: Set[Tuple[str, str]]) -> None:
+        """Invalidate the values a reader reported as changed. The INI reader
+        reports lower case keys, so cached keys which aren’t lower case are
+        compared ignoring their case."""
+        self._generation += 1
+        targets = set(names)
+        for name in list(self._mixed_case):
+            if (name[0], name[1].lower()) in names:
+                targets.add(name)
+                self._mixed_case.discard(name)
+        for store in (self._cache, self._converted, self._sources):
+            if store:
+                for name in targets:
+                    store.pop(name, None)
+        self._notify(names)
+
+    def invalidate(
+        self, section: Optional[str] = None, key: Optional[str] = None
+    ) -> None:
+        """Forget cached values.
+
+        :param section: Forget only the values of this section. If no section
+          is specified, the whole cache is cleared.
+        :param key: Forget only the value stored under this key (requires
+          a section).
+        """
+        self._generation += 1
+        for name in list(self._mixed_case):
+            if section is None or (
+                name[0] == section and (key is None or name[1] == key)
+            ):
+                self._mixed_case.discard(name)
+        for store in (self._converted, self._sources):
+            if store is None:
+                continue
+            if section is None:
+                store.clear()
+            elif key is not None:
+                store.pop((section, key), None)
+            else:
+                for name in [n for n in list(store) if n[0] == section]:
+                    store.pop(name, None)
+
+        cache = self._cache
+        if cache is None:
+            return
+        if section is None:
+            cache.clear()
+        elif key is not None:
+            cache.pop((section, key), None)
+        else:
+            for cache_key in [k for k in list(cache) if k[0] == section]:
+                cache.pop(cache_key, None)
@@ -0,0 +1,210 @@
+import marshal
+import mmap
+import os
+import struct
+import tempfile
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from .frozen_reader import FrozenReader
+from .reader_base import MISSING, ReaderBase
+
+_MAGIC = b"C2LS"
+
+_FORMAT = 1
+
+_HEADER = struct.Struct("<4sII")
+"""The magic bytes, the format version and the length of the index."""
+
+Index = Dict[str, Dict[str, Tuple[int, int]]]
+"""``{'section': {'key': (offset, length)}}``"""
+
+
+def encode_snapshot(snapshot: FrozenReader) -> bytes:
+    """Serialize the raw values of a snapshot. Each value is marshalled
+    separately, so it can be decoded without decoding the others.
+
+    :raises ValueError: If a value isn’t a string, a number, ``None`` or a
+      container of them.
+    """
+    index: Index = {}
+    values = bytearray()
+    for section, key in snapshot._names():
+        value = marshal.dumps(snapshot.lookup(section, key))
+        index.setdefault(section, {})[key] = (len(values), len(value))
+        values += value
+    encoded_index = marshal.dumps(index)
+    return (
+        _HEADER.pack(_MAGIC, _FORMAT, len(encoded_index))
+        + encoded_index
+        + bytes(values)
+    )
+
+
+def write_snapshot(snapshot: FrozenReader, path: str) -> None:
+    """Write a snapshot into a file which can be memory-mapped by
+    :py:class:`SharedSnapshotReader`. The file is replaced atomically.
+
+    :param snapshot: For example the result of :py:meth:`ConfigReader.freeze`.
+    """
+    data = encode_snapshot(snapshot)
+    descriptor, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".")
+    try:
+        with os.fdopen(descriptor, "wb") as snapshot_file:
+            snapshot_file.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def share_snapshot(
+    snapshot: FrozenReader, name: Optional[str] = None
+) -> shared_memory.SharedMemory:
+    """Copy a snapshot into a new shared memory block.
+
+    The creating process owns the block: keep the returned object alive
+    while workers use it and call ``close()`` and ``unlink()`` at shutdown.
+
+    :param snapshot: For example the result of :py:meth:`ConfigReader.freeze`.
+    :param name: The name of the block. By default a unique name is chosen,
+      see the ``name`` attribute of the result.
+    """
+    data = encode_snapshot(snapshot)
+    block = shared_memory.SharedMemory(name=name, create=True, size=len(data))
+    block.buf[: len(data)] = data
+    return block
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # type: ignore
+    except TypeError:
+        # Before Python 3.13 attached blocks are registered with the
+        # resource tracker, which would unlink them when the worker exits.
+        block = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(block._name, "shared_memory")  # type: ignore
+        return block
+
+
+class SharedSnapshotReader(ReaderBase):
+    """Read a snapshot written by :py:func:`write_snapshot` (a
+    memory-mapped file) or by :py:func:`share_snapshot` (a shared memory
+    block). The processes share the memory pages of the snapshot. Only the
+    index of the sections and keys is decoded when the reader is created;
+    each value is decoded on its first lookup.
+
+    The master process exports the resolved values once::
+
+        write_snapshot(ConfigReader(spec=spec, ini=path).freeze(), snapshot_path)
+
+    and each worker reads them without parsing or scanning its sources::
+
+        ConfigReader(spec=spec, readers=SharedSnapshotReader(path=snapshot_path))
+
+    :param path: The path of a snapshot file.
+    :param name: The name of a shared memory block.
+
+    :raises ValueError: If the data isn’t a snapshot.
+    """
+
+    _index: Index
+
+    _decoded: Dict[Tuple[str, str], Any]
+
+    def __init__(self, path: Optional[str] = None, name: Optional[str] = None):
+        if (path is None) == (name is None):
+            raise ValueError("Specify either the path or the name of a snapshot.")
+        self._origin = path if path is not None else "shared memory “{}”".format(name)
+        self._mmap: Optional[mmap.mmap] = None
+        self._block: Optional[shared_memory.SharedMemory] = None
+        if path is not None:
+            with open(path, "rb") as snapshot_file:
+                self._mmap = mmap.mmap(
+                    snapshot_file.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            self._buffer = memoryview(self._mmap)
+        else:
+            assert name is not None
+            self._block = _attach(name)
+            self._buffer = self._block.buf
+        try:
+            magic, version, index_length = _HEADER.unpack_from(self._buffer)
+        except struct.error:
+            magic, version, index_length = b"", 0, 0
+        if magic != _MAGIC or version != _FORMAT:
+            self.close()
+            raise ValueError("{} is not a configuration snapshot.".format(self._origin))
+        start = _HEADER.size
+        self._index = marshal.loads(self._buffer[start : start + index_length])
+        self._values = self._buffer[start + index_length :]
+        self._decoded = {}
+
+    def close(self) -> None:
+        """Release the memory of the snapshot. The reader can’t be used
+        afterwards."""
+        for view in ("_values", "_buffer"):
+            if view in self.__dict__:
+                self.__dict__.pop(view).release()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._block is not None:
+            self._block.close()
+            self._block = None
+
+    def __len__(self) -> int:
+        return sum(len(keys) for keys in self._index.values())
+
+    def sections(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def keys(self, section: str) -> Iterator[str]:
+        return iter(self._index.get(section, ()))
+
+    def source(self, section: str, key: str) -> str:
+        return "snapshot {} (section “{}” key “{}”)".format(self._origin, section, key)
+
+    def lookup(self, section: str, key: str) -> Any:
+        value = self._decoded.get((section, key), MISSING)
+        if value is not MISSING:
+            return value
+        location = self._index.get(section, {}).get(key)
+        if location is None:
+            return MISSING
+        offset, length = location
+        value = marshal.loads(self._values[offset : offset + length])
+        self._decoded[(section, key)] = value
+        return value
+
+    def lookup_many(self, section: str, keys: Iterable[str]) -> Dict[str, Any]:
+        known = self._index.get(section)
+        if not known:
+            return {}
+        return {key: self.lookup(section, key) for key in keys if key in known}
+
+    def get_section(self, section: str) -> Dict[str, Any]:
+        return self.lookup_many(section, self.keys(section))
+
+    def get(self, section: str, key: str) -> Any:
+        """
+        Get a configuration value stored under a section and a key.
+
+        :param section: Name of the section.
+        :param key: Name of the key.
+
+        :raises ConfigValueError: Configuration value couldn’t be found.
+
+        :return: The configuration value stored under a section and a key.
+        """
+        value = self.lookup(section, key)
+        if value is not MISSING:
+            return value
+        self._exception(
+            "Configuration value could not be found (section “{}” key “{}”).".format(
+                section, key
+            )
+        )
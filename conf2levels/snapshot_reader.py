@@ -0,0 +1,152 @@
+import threading
+from typing import Any, Dict, Iterable, Iterator, Optional, Set, Tuple
+
+from .frozen_reader import FrozenReader
+from .reader_base import MISSING, Provenance, ReaderBase
+from .reader_selector import ReaderSelector
+from .types import Converter
+
+
+class SnapshotReader(ReaderBase):
+    """Read from an immutable :py:class:`FrozenReader` snapshot of a
+    :py:class:`ReaderSelector` which is replaced each time a reader reports
+    changed values, for example after :py:meth:`IniReader.reload`,
+    :py:meth:`EnvironReader.refresh` or :py:meth:`DictionaryReader.set`.
+
+    Reads take no lock: each read uses the snapshot that is current when
+    it starts, so a read never sees a half applied change. Writers build
+    the new snapshot under a lock and publish it in a single assignment.
+    The converters run on the first typed read of a value, not while the
+    snapshot is built, so a badly typed value is published (and raises on
+    its typed reads) instead of failing the write that changed it.
+
+    Values the readers can’t list (for example argparse values without a
+    mapping) aren’t part of the snapshot and are looked up in the readers.
+
+    :param reader: The readers in the order of their precedence.
+    :param converters: A dictionary like this one:
+      ``{('section', 'key'): converter}``, see :py:class:`FrozenReader`.
+    """
+
+    _snapshot: FrozenReader
+
+    def __init__(
+        self,
+        reader: ReaderSelector,
+        converters: Optional[Dict[Tuple[str, str], Converter]] = None,
+    ):
+        self._reader = reader
+        self._converters = converters
+        self._write_lock = threading.Lock()
+        self.publish()
+        reader.subscribe(self._changed)
+
+    @property
+    def snapshot(self) -> FrozenReader:
+        """The current snapshot."""
+        return self._snapshot
+
+    def publish(self) -> FrozenReader:
+        """Build a new snapshot from the readers and replace the current
+        one."""
+        with self._write_lock:
+            snapshot = FrozenReader.from_reader(self._reader, self._converters)
+            self._snapshot = snapshot
+        return snapshot
+
+    def _changed(self, names: Set[Tuple[str, str]]) -> None:
+        self.publish()
+        self._notify(names)
+
+    def sections(self) -> Iterator[str]:
+        return self._snapshot.sections()
+
+    def keys(self, section: str) -> Iterator[str]:
+        return self._snapshot.keys(section)
+
+    def _names(self) -> Iterator[Tuple[str, str]]:
+        return self._snapshot._names()
+
+    def lookup(self, section: str, key: str) -> Any:
+        value = self._snapshot.lookup(section, key)
+        if value is MISSING:
+            return self._reader.lookup(section, key)
+        return value
+
+    def lookup_many(self, section: str, keys: Iterable[str]) -> Dict[str, Any]:
+        keys = list(keys)
+        values = self._snapshot.lookup_many(section, keys)
+        if len(values) < len(keys):
+            values.update(
+                self._reader.lookup_many(
+                    section, [key for key in keys if key not in values]
+                )
+            )
+        return values
+
+    def get_section(self, section: str) -> Dict[str, Any]:
+        return self._snapshot.get_section(section)
+
+    def get(self, section: str, key: str) -> Any:
+        """
+        Get a configuration value stored under a section and a key.
+
+        :param section: Name of the section.
+        :param key: Name of the key.
+
+        :raises ValueError: Configuration value couldn’t be found.
+        """
+        snapshot = self._snapshot
+        value = snapshot.lookup(section, key)
+        if value is not MISSING:
+            return value
+        return self._reader.get(section, key)
+
+    def _convert(self, section: str, key: str, value: Any) -> Any:
+        return self._reader._convert(section, key, value)
+
+    def get_typed(self, section: str, key: str) -> Any:
+        """
+        Get a configuration value converted by the converter of the key or
+        by :py:func:`auto_type`.
+
+        :param section: Name of the section.
+        :param key: Name of the key.
+        """
+        snapshot = self._snapshot
+        if (section, key) in snapshot:
+            return snapshot.get_typed(section, key)
+        return self._reader.get_typed(section, key)
+
+    async def alookup_many(self, section: str, keys: Iterable[str]) -> Dict[str, Any]:
+        """Like :py:meth:`lookup_many`, but the values missing from the
+        snapshot are looked up with :py:meth:`ReaderSelector.alookup_many`
+        without blocking the event loop."""
+        keys = list(keys)
+        values = self._snapshot.lookup_many(section, keys)
+        if len(values) < len(keys):
+            values.update(
+                await self._reader.alookup_many(
+                    section, [key for key in keys if key not in values]
+                )
+            )
+        return values
+
+    async def aget_typed(self, section: str, key: str) -> Any:
+        """Like :py:meth:`get_typed`, but a value missing from the snapshot
+        is looked up with :py:meth:`ReaderSelector.aget_typed` without
+        blocking the event loop.
+
+        :param section: Name of the section.
+        :param key: Name of the key.
+        """
+        snapshot = self._snapshot
+        if (section, key) in snapshot:
+            return snapshot.get_typed(section, key)
+        return await self._reader.aget_typed(section, key)
+
+    def explain(self, section: str, key: str) -> Provenance:
+        snapshot = self._snapshot
+        if (section, key) in snapshot:
+            return snapshot.explain(section, key)
+        return self._reader.explain(section, key)
@@ -1,16 +1,73 @@
-from typing import Any
+from typing import Any, Dict, Iterable, Iterator, Optional, Union
 
-from .reader_base import ReaderBase
+from .compiled_spec import CompiledSpec, KeyDescriptor
+from .reader_base import MISSING, ReaderBase
 from .types import Spec
 
 
 class SpecReader(ReaderBase):
-    """Read the default values from the `spec` (specification) dictionary."""
+    """Read the default values from the `spec` (specification) dictionary.
 
-    _spec: Spec
+    :param spec: The specification dictionary or a
+      :py:class:`CompiledSpec`. A dictionary is compiled without validating
+      its names.
+    """
 
-    def __init__(self, spec: Spec):
-        self._spec = spec
+    _compiled: CompiledSpec
+
+    _keys: Dict[str, Dict[str, KeyDescriptor]]
+    """``{'section': {'key': descriptor}}``, see :py:class:`CompiledSpec`."""
+
+    def __init__(self, spec: Union[Spec, CompiledSpec]):
+        if not isinstance(spec, CompiledSpec):
+            spec = CompiledSpec(spec, strict=False)
+        self._compiled = spec
+        self._keys = spec._keys
+
+    def fingerprint(self) -> Optional[str]:
+        from .persistent import digest
+
+        return digest(self._compiled.spec)
+
+    def lookup(self, section: str, key: str) -> Any:
+        keys = self._keys.get(section)
+        if keys is None:
+            return MISSING
+        descriptor = keys.get(key)
+        if descriptor is None:
+            return MISSING
+        return descriptor.default
+
+    def source(self, section: str, key: str) -> str:
+        return "spec default (section “{}” key “{}”)".format(section, key)
+
+    def sections(self) -> Iterator[str]:
+        for section, descriptors in self._compiled._sections.items():
+            if any(descriptor.default is not MISSING for descriptor in descriptors):
+                yield section
+
+    def keys(self, section: str) -> Iterator[str]:
+        for descriptor in self._compiled._sections.get(section, ()):
+            if descriptor.default is not MISSING:
+                yield descriptor.key
+
+    def lookup_many(self, section: str, keys: Iterable[str]) -> Dict[str, Any]:
+        descriptors = self._keys.get(section)
+        if not descriptors:
+            return {}
+        values: Dict[str, Any] = {}
+        for key in keys:
+            descriptor = descriptors.get(key)
+            if descriptor is not None and descriptor.default is not MISSING:
+                values[key] = descriptor.default
+        return values
+
+    def get_section(self, section: str) -> Dict[str, Any]:
+        return {
+            descriptor.key: descriptor.default
+            for descriptor in self._compiled._sections.get(section, ())
+            if descriptor.default is not MISSING
+        }
 
     def get(self, section: str, key: str) -> Any:
         """
@@ -23,10 +80,11 @@ class SpecReader(ReaderBase):
 
         :return: The configuration value stored under a section and a key.
         """
-        try:
-            return self._spec[section][key]["default"]
-        except KeyError:
-            self._exception(
-                "Configuration value could not be found "
-                "(section “{}” key “{}”).".format(section, key)
+        value = self.lookup(section, key)
+        if value is not MISSING:
+            return value
+        self._exception(
+            "Configuration value could not be found (section “{}” key “{}”).".format(
+                section, key
             )
+        )
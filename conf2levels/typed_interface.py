@@ -0,0 +1,173 @@
+import json
+import keyword
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+from .compiled_spec import CompiledSpec, KeyDescriptor
+from .types import Spec
+
+_ANNOTATIONS: Dict[Any, Tuple[Any, str]] = {
+    bool: (bool, "bool"),
+    float: (float, "float"),
+    int: (int, "int"),
+    list: (List[Any], "List[Any]"),
+    str: (str, "str"),
+}
+"""The annotations of the ``type`` fields: ``{type: (object, 'source')}``.
+Other converters and keys without a ``type`` are annotated with ``Any``."""
+
+_IMPORTS = ("Any", "Dict", "List", "Optional")
+"""The names imported by the generated modules. The section classes don’t
+use them."""
+
+
+def _check_name(name: str) -> str:
+    if (
+        not name.isidentifier()
+        or keyword.iskeyword(name)
+        or (name.startswith("__") and name.endswith("__"))
+    ):
+        raise ValueError(
+            "The name “{}” can’t be used as an attribute of a typed interface.".format(
+                name
+            )
+        )
+    return name
+
+
+def _class_name(section: str, used: Set[str]) -> str:
+    name = "".join(part[:1].upper() + part[1:] for part in section.split("_"))
+    if not name or name[0].isdigit():
+        name = "Section" + name
+    candidate = name
+    number = 2
+    while candidate in used:
+        candidate = "{}{}".format(name, number)
+        number += 1
+    used.add(candidate)
+    return candidate
+
+
+def _annotation(compiled: CompiledSpec, descriptor: KeyDescriptor) -> Tuple[Any, str]:
+    type_ = compiled.spec[descriptor.section][descriptor.key].get("type")
+    annotation, source = _ANNOTATIONS.get(type_, (Any, "Any"))
+    if annotation is not Any and descriptor.default is None:
+        return Optional[annotation], "Optional[{}]".format(source)
+    return annotation, source
+
+
+def _literal(names: List[str]) -> str:
+    if len(names) == 1:
+        return '("{}",)'.format(names[0])
+    return "({})".format(", ".join('"{}"'.format(name) for name in names))
+
+
+def _compile(spec: Union[Spec, CompiledSpec]) -> CompiledSpec:
+    if isinstance(spec, CompiledSpec):
+        return spec
+    return CompiledSpec(spec)
+
+
+def generate_classes(spec: Union[Spec, CompiledSpec], name: str = "Config") -> type:
+    """Create a class with ``__slots__`` for each section of a
+    specification and a root class whose slots hold the sections. The
+    attributes are annotated with the ``type`` of the keys. Fill the
+    classes with :py:meth:`ConfigReader.get_typed_interface`.
+
+    :param spec: The specification dictionary or a :py:class:`CompiledSpec`.
+    :param name: The name of the root class.
+
+    :raises ValueError: If a section or key name isn’t a Python identifier.
+    """
+    compiled = _compile(spec)
+    used = set(_IMPORTS + (name,))
+    sections: Dict[str, type] = {}
+    for section in compiled.sections():
+        descriptors = compiled.section(section)
+        namespace: Dict[str, Any] = {
+            "__slots__": tuple(
+                _check_name(descriptor.key) for descriptor in descriptors
+            ),
+            "__annotations__": {
+                descriptor.key: _annotation(compiled, descriptor)[0]
+                for descriptor in descriptors
+            },
+        }
+        sections[_check_name(section)] = type(_class_name(section, used), (), namespace)
+    return type(
+        name,
+        (),
+        {
+            "__slots__": tuple(sections),
+            "__annotations__": dict(sections),
+            "__sections__": sections,
+        },
+    )
+
+
+def generate_module(spec: Union[Spec, CompiledSpec], name: str = "Config") -> str:
+    """Generate the source of a Python module which defines the same
+    classes as :py:func:`generate_classes`, so type checkers and editors
+    know the sections, the keys and their types::
+
+        with open("settings_types.py", "w") as module:
+            module.write(generate_module(spec, name="Settings"))
+
+    and later::
+
+        from settings_types import Settings
+
+        settings = config_reader.get_typed_interface(Settings)
+        settings.email.port  # int
+
+    :param spec: The specification dictionary or a :py:class:`CompiledSpec`.
+    :param name: The name of the root class.
+
+    :raises ValueError: If a section or key name isn’t a Python identifier.
+    """
+    compiled = _compile(spec)
+    used = set(_IMPORTS + (name,))
+    lines = [
+        '"""Generated by conf2levels from a specification. Don’t edit."""',
+        "",
+        "from typing import {}".format(", ".join(_IMPORTS)),
+        "",
+    ]
+    sections: List[Tuple[str, str]] = []
+    for section in compiled.sections():
+        descriptors = compiled.section(section)
+        class_name = _class_name(_check_name(section), used)
+        sections.append((section, class_name))
+        lines += ["", "class {}:".format(class_name)]
+        lines.append(
+            "    __slots__ = {}".format(
+                _literal([_check_name(descriptor.key) for descriptor in descriptors])
+            )
+        )
+        for descriptor in descriptors:
+            lines += [
+                "",
+                "    {}: {}".format(
+                    descriptor.key, _annotation(compiled, descriptor)[1]
+                ),
+            ]
+            if descriptor.description:
+                lines.append(
+                    "    {}".format(
+                        json.dumps(str(descriptor.description), ensure_ascii=False)
+                    )
+                )
+        lines.append("")
+    lines += ["", "class {}:".format(name)]
+    lines.append(
+        "    __slots__ = {}".format(_literal([section for section, _ in sections]))
+    )
+    lines += ["", "    __sections__: Dict[str, type] = {"]
+    lines += [
+        '        "{}": {},'.format(section, class_name)
+        for section, class_name in sections
+    ]
+    lines.append("    }")
+    for section, class_name in sections:
+        lines += ["", "    {}: {}".format(section, class_name)]
+    lines.append("")
+    return "\n".join(lines)
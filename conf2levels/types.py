@@ -1,14 +1,22 @@
-from typing import Any, Dict, TypedDict
+from typing import Any, Callable, Dict, TypedDict
 
 Mapping = Dict[str, str]
 """A dictionary like this one: `{'section.key': 'dest'}`.
       `dest` is the property name of the `args` object."""
 
 
+Converter = Callable[[Any], Any]
+"""A function which converts a raw configuration value, for example ``int``."""
+
+
 class KeySpec(TypedDict, total=False):
     description: str
     default: Any
     not_empty: bool
+    type: Converter
+    """``int``, ``float``, ``bool``, ``str``, ``list`` or any other callable
+    which accepts the raw value (and an already converted value) and returns
+    the converted value."""
 
 
 Spec = Dict[str, Dict[str, KeySpec]]
@@ -22,6 +30,7 @@ Spec = Dict[str, Dict[str, KeySpec]]
                 'description': 'Lorem ipsum',
                 'default': 123,
                 'not_empty': True,
+                'type': int,
             }
         }
     }
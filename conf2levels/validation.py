@@ -0,0 +1,57 @@
+from typing import Iterator, List, NamedTuple
+
+
+class Violation(NamedTuple):
+    """A key which doesn’t meet its specification."""
+
+    section: str
+
+    key: str
+
+    kind: str
+    """``missing``, ``empty`` or ``type``"""
+
+    message: str
+
+
+class ValidationError(ValueError):
+    """The configuration doesn’t meet its specification."""
+
+    def __init__(self, report: "ValidationReport"):
+        super().__init__(
+            "The configuration is invalid:\n{}".format(
+                "\n".join(violation.message for violation in report)
+            )
+        )
+        self.report = report
+
+
+class ValidationReport:
+    """All violations found by :py:meth:`conf2levels.ConfigReader.validate`.
+    The report is true if there are no violations."""
+
+    violations: List[Violation]
+
+    def __init__(self, violations: List[Violation]):
+        self.violations = violations
+
+    def __bool__(self) -> bool:
+        return not self.violations
+
+    def __iter__(self) -> Iterator[Violation]:
+        return iter(self.violations)
+
+    def __len__(self) -> int:
+        return len(self.violations)
+
+    def __repr__(self) -> str:
+        return "<ValidationReport violations={}>".format(len(self.violations))
+
+    @property
+    def ok(self) -> bool:
+        return not self.violations
+
+    def raise_for_violations(self) -> None:
+        """:raises ValidationError: If there are violations."""
+        if self.violations:
+            raise ValidationError(self)
@@ -0,0 +1,154 @@
+import threading
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from conf2levels import ConfigReader, DictionaryReader, IniReader, SnapshotReader
+
+THREADS = 8
+
+UPDATES = 200
+
+
+def hammer(read: Callable[[], None], write: Callable[[int], None]) -> None:
+    """Run ``read`` in several threads until ``write`` was called for each
+    update and re-raise the first error of a reading thread."""
+    errors: List[BaseException] = []
+    done = threading.Event()
+    started = threading.Barrier(THREADS + 1)
+
+    def reader() -> None:
+        started.wait()
+        try:
+            while not done.is_set():
+                read()
+                # Give the writer a chance to take the GIL.
+                time.sleep(0)
+            read()
+        except BaseException as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=reader) for _ in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    started.wait()
+    try:
+        for update in range(1, UPDATES + 1):
+            write(update)
+    finally:
+        done.set()
+        for thread in threads:
+            thread.join()
+    if errors:
+        raise errors[0]
+
+
+class TestClassDictionaryReaderConcurrency:
+    def test_updates_are_atomic(self) -> None:
+        dictionary = DictionaryReader({"pair": {"a": 0, "b": 0}})
+
+        def read() -> None:
+            values = dictionary.get_section("pair")
+            assert values["a"] == values["b"]
+
+        hammer(
+            read, lambda update: dictionary.update({"pair": {"a": update, "b": update}})
+        )
+        assert dictionary.get_section("pair") == {"a": UPDATES, "b": UPDATES}
+
+    def test_new_sections(self) -> None:
+        dictionary = DictionaryReader({})
+
+        def read() -> None:
+            for section in list(dictionary.sections()):
+                assert dictionary.get(section, "key") == int(section[1:])
+
+        hammer(read, lambda update: dictionary.set("s{}".format(update), "key", update))
+        assert len(list(dictionary.sections())) == UPDATES
+
+
+class TestClassConfigReaderConcurrency:
+    def setup_method(self) -> None:
+        self.conf2levels = ConfigReader(
+            dictionary={"pair": {"a": "0", "b": "0"}},
+            spec={"pair": {"c": {"default": 0}}},
+            concurrent=True,
+            cache_size=16,
+        )
+        reader = self.conf2levels.reader
+        assert isinstance(reader, SnapshotReader)
+        self.reader = reader
+        dictionary = reader._reader.readers[0]
+        assert isinstance(dictionary, DictionaryReader)
+        self.dictionary = dictionary
+
+    def write(self, update: int) -> None:
+        self.dictionary.update({"pair": {"a": str(update), "b": str(update)}})
+
+    def test_snapshots_are_consistent(self) -> None:
+        def read() -> None:
+            snapshot = self.reader.snapshot
+            assert snapshot.get("pair", "a") == snapshot.get("pair", "b")
+            values = self.conf2levels.get_section("pair")
+            assert values["a"] == values["b"]
+            assert values["c"] == 0
+
+        hammer(read, self.write)
+        assert self.conf2levels.get_section("pair") == {
+            "a": UPDATES,
+            "b": UPDATES,
+            "c": 0,
+        }
+
+    def test_values_never_go_back(self) -> None:
+        def read() -> None:
+            config = self.conf2levels.get_class_interface()
+            last = 0
+            for _ in range(50):
+                value = config.pair.a
+                assert value >= last
+                last = value
+
+        hammer(read, self.write)
+
+    def test_concurrent_writers(self) -> None:
+        def write(update: int) -> None:
+            threads = [
+                threading.Thread(
+                    target=self.dictionary.set,
+                    args=("keys", "key_{}".format(index), update),
+                )
+                for index in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        hammer(lambda: list(self.conf2levels.keys("keys")), write)
+        assert self.conf2levels.get_section("keys") == {
+            "key_{}".format(index): UPDATES for index in range(4)
+        }
+
+
+class TestClassIniReaderConcurrency:
+    def test_reload_while_reading(self, tmp_path: Path) -> None:
+        path = tmp_path / "config.ini"
+        path.write_text("[pair]\na = 0\nb = 0\n")
+        ini = IniReader(str(path))
+        conf2levels = ConfigReader(ini=ini, concurrent=True)
+
+        def read() -> None:
+            values = conf2levels.get_section("pair")
+            assert values["a"] == values["b"]
+
+        def write(update: int) -> None:
+            # The size changes with each update, so reload() sees the change
+            # even if the modification time doesn’t.
+            path.write_text(
+                "[pair]\na = {0}\nb = {0}\n{1}".format(update, "\n" * update)
+            )
+            assert ini.reload()
+
+        hammer(read, write)
+        assert conf2levels.get_section("pair") == {"a": UPDATES, "b": UPDATES}
@@ -1,22 +1,50 @@
 import argparse
+import ast
+import asyncio
+import gc
+import multiprocessing
 import os
+import subprocess
+import sys
 import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 import pytest
 
 from conf2levels import (
+    MISSING,
     ArgparseReader,
+    AsyncReaderBase,
+    CompiledSpec,
     ConfigReader,
     ConfigValueError,
     DictionaryReader,
     EnvironReader,
+    FrozenReader,
     IniReader,
+    InstrumentedReaderSelector,
+    LayeredIniReader,
+    LookupEvent,
     ReaderBase,
     ReaderSelector,
+    SharedSnapshotReader,
+    SnapshotReader,
+    SpecReader,
+    ValidationError,
+    auto_type,
+    generate_classes,
+    generate_module,
+    is_valid_key,
     load_readers_by_keyword,
+    share_snapshot,
     validate_key,
+    write_snapshot,
 )
-from conf2levels.exceptions import IniReaderError
+from conf2levels.coercion import to_bool, to_list
+from conf2levels.exceptions import IniReaderError, _valid_keys
+from conf2levels.types import Spec
 
 FILES_DIR = os.path.join(os.path.dirname(__file__), "files")
 
@@ -38,6 +66,16 @@ ARGPARSER_NAMESPACE = parser.parse_args(
 )
 
 
+class TestFunctionIsValidKey:
+    def test_valid(self) -> None:
+        assert is_valid_key("test_1")
+        assert is_valid_key("test_1")
+
+    def test_invalid(self) -> None:
+        assert not is_valid_key("l o l")
+        assert not is_valid_key("ö")
+
+
 class TestFunctionValidateKey:
     def test_valid(self) -> None:
         assert validate_key("test")
@@ -56,6 +94,22 @@ class TestFunctionValidateKey:
         with pytest.raises(ValueError) as context:
             validate_key("ö")
 
+    def test_readers_dont_register_names(self, tmp_path: Path) -> None:
+        path = tmp_path / "config.ini"
+        path.write_text("[unregistered_section]\nunregistered_key = 1\n")
+        os.environ["CCC__unregistered_env__key"] = "1"
+        try:
+            selector = ReaderSelector(
+                IniReader(str(path)), EnvironReader(prefix="CCC"), strict=False
+            )
+            assert selector.get("unregistered_section", "unregistered_key") == "1"
+            assert selector.get("unregistered_env", "key") == "1"
+        finally:
+            del os.environ["CCC__unregistered_env__key"]
+        assert "unregistered_section" not in _valid_keys
+        assert "unregistered_key" not in _valid_keys
+        assert "unregistered_env" not in _valid_keys
+
 
 # Reader classes ##############################################################
 
@@ -71,6 +125,48 @@ class TestClassReaderBase:
             FalseReader()  # type: ignore
 
 
+class TestClassReaderBaseLookup:
+    class GetOnlyReader(ReaderBase):
+        def get(self, section: str, key: str) -> str:
+            if section == "Classical":
+                return "Mozart"
+            raise ConfigValueError("No value")
+
+    def test_fallback_to_get(self) -> None:
+        reader = self.GetOnlyReader()
+        assert reader.lookup("Classical", "name") == "Mozart"
+        assert reader.lookup("Romantic", "name") is MISSING
+
+    def test_missing_is_falsy(self) -> None:
+        assert not MISSING
+        assert repr(MISSING) == "MISSING"
+
+    def test_builtin_readers(self) -> None:
+        readers = [
+            ArgparseReader(args=ARGPARSER_NAMESPACE),
+            DictionaryReader({"Classical": {"name": "Mozart"}}),
+            EnvironReader(prefix="XXX"),
+            IniReader(INI_FILE),
+            SpecReader({"Classical": {"name": {"default": "Mozart"}}}),
+        ]
+        for reader in readers:
+            assert reader.lookup("Classical", "name") == "Mozart"
+            assert reader.lookup("Modern", "name") is MISSING
+
+    def test_falsy_values_are_not_missing(self) -> None:
+        reader = DictionaryReader({"empty": {"zero": 0, "none": None}})
+        assert reader.lookup("empty", "zero") == 0
+        assert reader.lookup("empty", "none") is None
+
+    def test_reader_selector(self) -> None:
+        reader = ReaderSelector(
+            self.GetOnlyReader(), DictionaryReader({"Romantic": {"name": "Liszt"}})
+        )
+        assert reader.lookup("Classical", "name") == "Mozart"
+        assert reader.lookup("Romantic", "name") == "Liszt"
+        assert reader.lookup("Modern", "name") is MISSING
+
+
 class TestClassArgparseReader:
     def test_method_get_without_mapping(self) -> None:
         argparse = ArgparseReader(args=ARGPARSER_NAMESPACE)
@@ -103,6 +199,21 @@ class TestClassArgparseReader:
         with pytest.raises(ConfigValueError):
             argparse.get("Modern", "name")
 
+    def test_namespace_read_at_construction(self) -> None:
+        args = argparse.Namespace(classical_name="Mozart")
+        reader = ArgparseReader(args=args, mapping={"Classical.name": "composer"})
+        args.classical_name = "Haydn"
+        assert reader.get("classical", "name") == "Mozart"
+        with pytest.raises(ConfigValueError):
+            reader.get("Classical", "name")
+
+    def test_lookup_doesnt_grow_table(self) -> None:
+        reader = ArgparseReader(args=ARGPARSER_NAMESPACE)
+        for number in range(100):
+            assert reader.lookup("Classical", "key_{}".format(number)) is MISSING
+        assert reader.lookup("Classical", "name") == "Mozart"
+        assert reader._table == {}
+
 
 class TestClassDictionaryReader:
     dictionary = {"Classical": {"name": "Mozart"}}
@@ -116,6 +227,24 @@ class TestClassDictionaryReader:
         with pytest.raises(ConfigValueError):
             dictionary.get("Romantic", "name")
 
+    def test_copy_on_write(self) -> None:
+        dictionary = DictionaryReader(dictionary=self.dictionary)
+        changes: List[Set[Tuple[str, str]]] = []
+        dictionary.subscribe(changes.append)
+        dictionary.set("Classical", "name", "Haydn")
+        dictionary.update({"Romantic": {"name": "Schumann"}})
+        assert dictionary.get("Classical", "name") == "Haydn"
+        assert dictionary.get("Romantic", "name") == "Schumann"
+        assert self.dictionary == {"Classical": {"name": "Mozart"}}
+        dictionary.delete("Classical", "name")
+        dictionary.delete("Classical", "name")
+        assert dictionary.lookup("Classical", "name") is MISSING
+        assert changes == [
+            {("Classical", "name")},
+            {("Romantic", "name")},
+            {("Classical", "name")},
+        ]
+
 
 class TestClassEnvironReader:
     def test_method_get(self) -> None:
@@ -132,6 +261,62 @@ class TestClassEnvironReader:
         assert context.value.args[0] == "Environment variable not found: AAA__lol__lol"
 
 
+class TestClassEnvironReaderIndex:
+    def setup_method(self) -> None:
+        os.environ["BBB__bridge__ip"] = "1.2.3.4"
+        os.environ["BBB__my__section__key"] = "double"
+        os.environ["BBB__section___key"] = "underscore"
+
+    def teardown_method(self) -> None:
+        for name in list(os.environ):
+            if name.startswith("BBB__"):
+                del os.environ[name]
+
+    def test_index(self) -> None:
+        environ = EnvironReader(prefix="BBB")
+        assert environ._index["bridge"] == {"ip": "1.2.3.4"}
+
+    def test_ambiguous_names(self) -> None:
+        environ = EnvironReader(prefix="BBB")
+        assert environ.get("my", "section__key") == "double"
+        assert environ.get("my__section", "key") == "double"
+        assert environ.get("section", "_key") == "underscore"
+        assert environ.get("section_", "key") == "underscore"
+
+    def test_refresh(self) -> None:
+        environ = EnvironReader(prefix="BBB")
+        os.environ["BBB__bridge__ip"] = "5.6.7.8"
+        assert environ.get("bridge", "ip") == "1.2.3.4"
+        environ.refresh()
+        assert environ.get("bridge", "ip") == "5.6.7.8"
+
+    def test_changed(self) -> None:
+        environ = EnvironReader(prefix="BBB")
+        assert not environ.changed()
+        os.environ["BBB__bridge__username"] = "test"
+        assert environ.changed()
+        environ.refresh()
+        assert not environ.changed()
+        del os.environ["BBB__bridge__username"]
+        assert environ.changed()
+
+    def test_refresh_notifies(self) -> None:
+        environ = EnvironReader(prefix="BBB")
+        changes: List[Set[Tuple[str, str]]] = []
+        environ.subscribe(changes.append)
+        os.environ["BBB__bridge__ip"] = "5.6.7.8"
+        environ.refresh()
+        assert changes == [{("bridge", "ip")}]
+
+    def test_unrelated_variables(self) -> None:
+        environ = EnvironReader(prefix="BBB")
+        os.environ["CCC__bridge__ip"] = "5.6.7.8"
+        try:
+            assert not environ.changed()
+        finally:
+            del os.environ["CCC__bridge__ip"]
+
+
 class TestClassEnvironWithoutPrefix:
     def test_method_get(self) -> None:
         os.environ["Avantgarde__name"] = "Stockhausen"
@@ -184,6 +369,189 @@ class TestClassIniReader:
             IniReader(path="")
 
 
+class TestClassIniReaderParsing:
+    def test_case_insensitive_keys(self) -> None:
+        ini = IniReader(path=INI_FILE)
+        assert ini.get("Classical", "NAME") == "Mozart"
+
+    def test_default_section_and_interpolation(self, tmp_path: Path) -> None:
+        path = tmp_path / "config.ini"
+        path.write_text(
+            "[DEFAULT]\nhost = example.com\n\n"
+            "[email]\nserver = smtp.%(host)s\npassword = 100%\n"
+        )
+        ini = IniReader(path=str(path))
+        assert ini.get("email", "host") == "example.com"
+        assert ini.get("email", "server") == "smtp.example.com"
+        assert ini.get("email", "password") == "100%"
+        assert ini.get("DEFAULT", "host") == "example.com"
+
+
+class TestClassIniReaderLazy:
+    def test_lazy(self, tmp_path: Path) -> None:
+        path = tmp_path / "config.ini"
+        path.write_text("[Classical]\nname = Mozart\n")
+        ini = IniReader(path=str(path), lazy=True)
+        assert ini._table is None
+        path.write_text("[Classical]\nname = Haydn\n")
+        assert ini.get("Classical", "name") == "Haydn"
+        assert ini._table is not None
+
+    def test_lazy_checks_path(self, tmp_path: Path) -> None:
+        with pytest.raises(IniReaderError):
+            IniReader(path=str(tmp_path / "xxx"), lazy=True)
+
+    def test_config_reader(self) -> None:
+        conf2levels = ConfigReader(ini=IniReader(INI_FILE, lazy=True))
+        config = conf2levels.get_class_interface()
+        assert config.Classical.name == "Mozart"
+
+
+class TestClassIniReaderReload:
+    def setup_method(self) -> None:
+        self.path = Path(tempfile.mkdtemp()) / "config.ini"
+        self.write("[Classical]\nname = Mozart\n\n[Romantic]\nname = Schumann\n")
+
+    def write(self, content: str) -> None:
+        self.path.write_text(content)
+        stat = self.path.stat()
+        # Make sure the modification time changes on coarse file systems.
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def test_unchanged(self) -> None:
+        ini = IniReader(path=str(self.path))
+        assert not ini.reload()
+
+    def test_reload(self) -> None:
+        ini = IniReader(path=str(self.path))
+        changes: List[Set[Tuple[str, str]]] = []
+        ini.subscribe(changes.append)
+        self.write("[Classical]\nname = Haydn\n\n[Romantic]\nname = Schumann\n")
+        assert ini.reload()
+        assert ini.get("Classical", "name") == "Haydn"
+        assert changes == [{("Classical", "name")}]
+
+    def test_lazy_reader_is_not_reloaded(self) -> None:
+        ini = IniReader(path=str(self.path), lazy=True)
+        assert not ini.reload()
+
+    def test_only_changed_keys_are_invalidated(self) -> None:
+        dictionary = {"Baroque": {"name": "Bach"}}
+        reader = ReaderSelector(
+            IniReader(path=str(self.path)), DictionaryReader(dictionary), cache_size=16
+        )
+        assert reader.get("Classical", "Name") == "Mozart"
+        assert reader.get("Baroque", "name") == "Bach"
+        dictionary["Baroque"]["name"] = "Händel"
+        self.write("[Classical]\nname = Haydn\n")
+        reader.readers[0].reload()  # type: ignore
+        assert reader.get("Classical", "Name") == "Haydn"
+        assert reader.get("Baroque", "name") == "Bach"
+
+    def test_watch(self) -> None:
+        ini = IniReader(path=str(self.path))
+        reloaded = threading.Event()
+        ini.subscribe(lambda names: reloaded.set())
+        ini.watch(interval=0.01)
+        try:
+            self.write("[Classical]\nname = Haydn\n")
+            assert reloaded.wait(5)
+            assert ini.get("Classical", "name") == "Haydn"
+        finally:
+            ini.unwatch()
+
+
+class TestClassLayeredIniReader:
+    def setup_method(self) -> None:
+        self.dir = Path(tempfile.mkdtemp())
+        self.base = self.dir / "app.ini"
+        self.base.write_text(
+            "[DEFAULT]\nlevel = base\n[email]\nserver = base\nport = 25\n"
+        )
+        (self.dir / "app.d").mkdir()
+        (self.dir / "app.d" / "10-port.ini").write_text("[email]\nport = 587\n")
+        (self.dir / "app.d" / "20-port.ini").write_text("[email]\nport = 465\n")
+        self.paths = [str(self.base), str(self.dir / "app.d" / "*.ini")]
+
+    def test_precedence(self) -> None:
+        ini = LayeredIniReader(self.paths)
+        assert ini.get("email", "server") == "base"
+        assert ini.get("email", "port") == "465"
+        assert ini.get("email", "level") == "base"
+        assert ini.get_section("email") == {
+            "level": "base",
+            "server": "base",
+            "port": "465",
+        }
+        assert ini.source("email", "port") == (
+            "INI file “{}” section “email” key “port”".format(
+                self.dir / "app.d" / "20-port.ini"
+            )
+        )
+
+    def test_keyword_list(self) -> None:
+        conf2levels = ConfigReader(ini=self.paths)
+        assert isinstance(conf2levels.reader.readers[0], LayeredIniReader)
+        assert conf2levels.get_class_interface().email.port == 465
+
+    def test_missing_path(self) -> None:
+        with pytest.raises(IniReaderError):
+            LayeredIniReader([str(self.base), str(self.dir / "missing.ini")])
+        with pytest.raises(IniReaderError):
+            LayeredIniReader([str(self.dir / "*.conf")])
+
+    def test_reload_new_file(self) -> None:
+        ini = LayeredIniReader(self.paths)
+        changes: List[Set[Tuple[str, str]]] = []
+        ini.subscribe(changes.append)
+        assert not ini.reload()
+        (self.dir / "app.d" / "30-port.ini").write_text("[email]\nport = 2525\n")
+        assert ini.reload()
+        assert ini.get("email", "port") == "2525"
+        assert changes == [{("email", "port")}]
+
+    def test_lazy_and_cache(self) -> None:
+        cache_dir = str(self.dir / "cache")
+        LayeredIniReader(self.paths, cache_dir=cache_dir)
+        ini = LayeredIniReader(self.paths, lazy=True, cache_dir=cache_dir)
+        ini._parse = None  # type: ignore
+        assert ini.get("email", "port") == "465"
+        (self.dir / "app.d" / "10-port.ini").write_text("[email]\nport = 5870\n")
+        ini = LayeredIniReader(self.paths, cache_dir=cache_dir)
+        assert ini.get("email", "port") == "465"
+
+
+class TestClassIniReaderCache:
+    def setup_method(self) -> None:
+        self.tmp = Path(tempfile.mkdtemp())
+        self.path = self.tmp / "config.ini"
+        self.path.write_text("[Classical]\nname = Mozart\n")
+        self.cache_dir = str(self.tmp / "cache")
+
+    def test_cache_is_written(self) -> None:
+        IniReader(path=str(self.path), cache_dir=self.cache_dir)
+        assert len(os.listdir(self.cache_dir)) == 1
+
+    def test_cache_is_used(self) -> None:
+        IniReader(path=str(self.path), cache_dir=self.cache_dir)
+        ini = IniReader(path=str(self.path), lazy=True, cache_dir=self.cache_dir)
+        ini._parse = None  # type: ignore
+        assert ini.get("Classical", "name") == "Mozart"
+
+    def test_changed_file(self) -> None:
+        IniReader(path=str(self.path), cache_dir=self.cache_dir)
+        self.path.write_text("[Classical]\nname = Beethoven\n")
+        ini = IniReader(path=str(self.path), cache_dir=self.cache_dir)
+        assert ini.get("Classical", "name") == "Beethoven"
+
+    def test_corrupt_cache(self) -> None:
+        IniReader(path=str(self.path), cache_dir=self.cache_dir)
+        for name in os.listdir(self.cache_dir):
+            (Path(self.cache_dir) / name).write_bytes(b"xxx")
+        ini = IniReader(path=str(self.path), cache_dir=self.cache_dir)
+        assert ini.get("Classical", "name") == "Mozart"
+
+
 # Common code #################################################################
 
 
@@ -207,6 +575,339 @@ class TestClassReaderSelector:
         )
 
 
+class TestClassReaderSelectorCache:
+    def setup_method(self) -> None:
+        self.dictionary = {
+            "Classical": {"name": "Mozart"},
+            "Romantic": {"name": "Schumann"},
+        }
+        self.reader = ReaderSelector(DictionaryReader(self.dictionary), cache_size=2)
+
+    def test_cache_disabled_by_default(self) -> None:
+        reader = ReaderSelector(DictionaryReader(self.dictionary))
+        assert reader.get("Classical", "name") == "Mozart"
+        self.dictionary["Classical"]["name"] = "Haydn"
+        assert reader.get("Classical", "name") == "Haydn"
+
+    def test_cached_value(self) -> None:
+        assert self.reader.get("Classical", "name") == "Mozart"
+        self.dictionary["Classical"]["name"] = "Haydn"
+        assert self.reader.get("Classical", "name") == "Mozart"
+
+    def test_lru_eviction(self) -> None:
+        self.dictionary["Baroque"] = {"name": "Bach"}
+        self.reader.get("Classical", "name")
+        self.reader.get("Romantic", "name")
+        self.reader.get("Classical", "name")
+        self.reader.get("Baroque", "name")
+        self.dictionary["Classical"]["name"] = "Haydn"
+        self.dictionary["Romantic"]["name"] = "Brahms"
+        assert self.reader.get("Classical", "name") == "Mozart"
+        assert self.reader.get("Romantic", "name") == "Brahms"
+
+    def test_invalidate_all(self) -> None:
+        self.reader.get("Classical", "name")
+        self.reader.get("Romantic", "name")
+        self.dictionary["Classical"]["name"] = "Haydn"
+        self.dictionary["Romantic"]["name"] = "Brahms"
+        self.reader.invalidate()
+        assert self.reader.get("Classical", "name") == "Haydn"
+        assert self.reader.get("Romantic", "name") == "Brahms"
+
+    def test_invalidate_section(self) -> None:
+        self.reader.get("Classical", "name")
+        self.reader.get("Romantic", "name")
+        self.dictionary["Classical"]["name"] = "Haydn"
+        self.dictionary["Romantic"]["name"] = "Brahms"
+        self.reader.invalidate("Classical")
+        assert self.reader.get("Classical", "name") == "Haydn"
+        assert self.reader.get("Romantic", "name") == "Schumann"
+
+    def test_invalidate_key(self) -> None:
+        self.dictionary["Classical"]["age"] = 35
+        self.reader.get("Classical", "name")
+        self.reader.get("Classical", "age")
+        self.dictionary["Classical"]["name"] = "Haydn"
+        self.dictionary["Classical"]["age"] = 77
+        self.reader.invalidate("Classical", "name")
+        assert self.reader.get("Classical", "name") == "Haydn"
+        assert self.reader.get("Classical", "age") == 35
+
+    def test_change_while_resolving(self) -> None:
+        class ChangingReader(DictionaryReader):
+            def lookup(self, section: str, key: str) -> Any:
+                value = super().lookup(section, key)
+                # The value changes after it was read, before it is cached.
+                if value == "old":
+                    self.set(section, key, "new")
+                return value
+
+        reader = ReaderSelector(
+            ChangingReader({"email": {"port": "old"}}), cache_size=8
+        )
+        assert reader.get("email", "port") == "old"
+        assert reader.get("email", "port") == "new"
+        assert reader.lookup_many("email", ["port"]) == {"port": "new"}
+
+    def test_misses_are_not_cached(self) -> None:
+        with pytest.raises(ValueError):
+            self.reader.get("Baroque", "name")
+        self.dictionary["Baroque"] = {"name": "Bach"}
+        assert self.reader.get("Baroque", "name") == "Bach"
+
+
+class TestClassReaderSelectorListeners:
+    def test_shared_reader_does_not_keep_selectors_alive(self) -> None:
+        dictionary = DictionaryReader({"email": {"port": "25"}})
+        for _ in range(100):
+            ReaderSelector(dictionary, cache_size=8)
+        gc.collect()
+        selector = ReaderSelector(dictionary, cache_size=8)
+        assert len(dictionary._listeners) == 1
+        assert selector.get("email", "port") == "25"
+        dictionary.set("email", "port", "587")
+        assert selector.get("email", "port") == "587"
+
+    def test_no_subscription_without_state(self) -> None:
+        dictionary = DictionaryReader({"email": {"port": "25"}})
+        for _ in range(100):
+            ConfigReader(readers=dictionary, frozen=True)
+        assert dictionary.__dict__.get("_listeners", []) == []
+
+    def test_subscription_of_the_selector(self) -> None:
+        dictionary = DictionaryReader({"email": {"port": "25"}})
+        selector = ReaderSelector(dictionary)
+        changes: List[Set[Tuple[str, str]]] = []
+        selector.subscribe(changes.append)
+        dictionary.set("email", "port", "587")
+        assert changes == [{("email", "port")}]
+
+
+class TestClassReaderSelectorStrict:
+    def test_strict(self) -> None:
+        reader = ReaderSelector(DictionaryReader({"my-section": {"key": "value"}}))
+        with pytest.raises(ValueError) as context:
+            reader.get("my-section", "key")
+        assert context.value.args[0] == (
+            "The key “my-section” contains invalid characters (allowed: a-zA-Z0-9_)."
+        )
+
+    def test_lenient(self) -> None:
+        reader = ReaderSelector(
+            DictionaryReader({"my-section": {"key": "value"}}), strict=False
+        )
+        assert reader.get("my-section", "key") == "value"
+
+
+class TestClassBulkReads:
+    def setup_method(self) -> None:
+        os.environ["GGG__email__port"] = "2525"
+        parser = argparse.ArgumentParser()
+        parser.add_argument("--email-server")
+        parser.add_argument("--email-user")
+        parser.add_argument("--my-section-key")
+        self.args = parser.parse_args(["--email-server", "argparse"])
+        self.spec: Spec = {
+            "email": {
+                "server": {"default": "spec"},
+                "port": {"default": 25},
+                "user": {},
+            }
+        }
+        self.dictionary = {"email": {"user": "dictionary", "port": "587"}}
+        self.ini = os.path.join(FILES_DIR, "integration.ini")
+
+    def teardown_method(self) -> None:
+        del os.environ["GGG__email__port"]
+
+    def test_reader_get_section(self) -> None:
+        assert ArgparseReader(self.args).get_section("email") == {"server": "argparse"}
+        assert DictionaryReader(self.dictionary).get_section("email") == {
+            "user": "dictionary",
+            "port": "587",
+        }
+        assert EnvironReader("GGG").get_section("email") == {"port": "2525"}
+        assert IniReader(self.ini).get_section("specific") == {"ini": "ini"}
+        assert SpecReader(self.spec).get_section("email") == {
+            "server": "spec",
+            "port": 25,
+        }
+
+    def test_argparse_mapping(self) -> None:
+        reader = ArgparseReader(
+            self.args,
+            mapping={"email.server": "email_user", "email.x": "my_section_key"},
+        )
+        assert reader.get_section("email") == {}
+
+    def test_reader_lookup_many(self) -> None:
+        for reader in (DictionaryReader(self.dictionary), EnvironReader("GGG")):
+            assert reader.lookup_many("email", ["port", "xxx"]) == {
+                "port": reader.get("email", "port")
+            }
+        assert IniReader(self.ini).lookup_many("specific", ["INI", "xxx"]) == {
+            "INI": "ini"
+        }
+
+    def test_selector_get_section(self) -> None:
+        reader = ReaderSelector(
+            ArgparseReader(self.args),
+            EnvironReader("GGG"),
+            DictionaryReader(self.dictionary),
+            SpecReader(self.spec),
+        )
+        assert reader.get_section("email") == {
+            "server": "argparse",
+            "port": "2525",
+            "user": "dictionary",
+        }
+
+    def test_selector_get_many(self) -> None:
+        calls: List[Tuple[str, List[str]]] = []
+
+        class CountingReader(DictionaryReader):
+            def lookup_many(self, section: str, keys: Iterable[str]) -> Dict[str, Any]:
+                calls.append((section, list(keys)))
+                return super().lookup_many(section, keys)
+
+        reader = ReaderSelector(
+            CountingReader({"email": {"server": "first"}}),
+            CountingReader(self.dictionary),
+        )
+        assert reader.get_many(
+            [("email", "server"), ("email", "user"), ("email", "port")]
+        ) == {
+            ("email", "server"): "first",
+            ("email", "user"): "dictionary",
+            ("email", "port"): "587",
+        }
+        assert calls == [
+            ("email", ["server", "user", "port"]),
+            ("email", ["user", "port"]),
+        ]
+
+    def test_selector_get_many_missing(self) -> None:
+        reader = ReaderSelector(DictionaryReader(self.dictionary))
+        with pytest.raises(ValueError) as context:
+            reader.get_many([("email", "user"), ("email", "a"), ("email", "b")])
+        assert context.value.args[0] == (
+            "Configuration value could not be found (section “email” key “a”), "
+            "(section “email” key “b”)."
+        )
+
+    def test_selector_get_many_cache(self) -> None:
+        reader = ReaderSelector(DictionaryReader(self.dictionary), cache_size=16)
+        reader.get_many([("email", "user")])
+        self.dictionary["email"]["user"] = "changed"
+        assert reader.get_many([("email", "user")]) == {("email", "user"): "dictionary"}
+
+    def test_config_reader(self) -> None:
+        conf2levels = ConfigReader(
+            spec=self.spec, argparse=self.args, dictionary=self.dictionary
+        )
+        assert conf2levels.get_section("email") == {
+            "server": "argparse",
+            "port": 587,
+            "user": "dictionary",
+        }
+        assert conf2levels.get_many([("email", "port")]) == {("email", "port"): 587}
+
+    def test_frozen(self) -> None:
+        conf2levels = ConfigReader(
+            spec=self.spec, dictionary=self.dictionary, frozen=True
+        )
+        assert conf2levels.get_section("email") == {
+            "server": "spec",
+            "port": 587,
+            "user": "dictionary",
+        }
+
+
+class TestClassEnumeration:
+    def setup_method(self) -> None:
+        os.environ["HHH__email__port"] = "2525"
+        os.environ["HHH__nsca__host"] = "localhost"
+        parser = argparse.ArgumentParser()
+        parser.add_argument("--email-server")
+        parser.add_argument("--beep-activated")
+        parser.add_argument("--my-section-key")
+        self.args = parser.parse_args(
+            ["--email-server", "argparse", "--my-section-key", "x"]
+        )
+        self.spec: Spec = {
+            "email": {"server": {"default": "spec"}, "user": {}},
+            "icinga": {"url": {}},
+        }
+        self.dictionary = {"email": {"user": "dictionary"}, "beep": {}}
+
+    def teardown_method(self) -> None:
+        del os.environ["HHH__email__port"]
+        del os.environ["HHH__nsca__host"]
+
+    def test_readers(self) -> None:
+        argparse_reader = ArgparseReader(
+            self.args, mapping={"my_section.key": "my_section_key"}
+        )
+        assert list(argparse_reader.sections()) == ["my_section", "email"]
+        assert list(argparse_reader.keys("email")) == ["server"]
+        assert list(argparse_reader.items("my_section")) == [("key", "x")]
+
+        dictionary = DictionaryReader(self.dictionary)
+        assert list(dictionary.sections()) == ["email", "beep"]
+        assert list(dictionary.keys("email")) == ["user"]
+
+        environ = EnvironReader("HHH")
+        assert sorted(environ.sections()) == ["email", "nsca"]
+        assert list(environ.items("nsca")) == [("host", "localhost")]
+
+        ini = IniReader(INI_FILE)
+        assert list(ini.sections()) == ["Classical", "Romantic"]
+        assert list(ini.keys("Romantic")) == ["name"]
+
+        spec = SpecReader(self.spec)
+        assert list(spec.sections()) == ["email"]
+        assert list(spec.keys("email")) == ["server"]
+
+    def test_reader_base_default(self) -> None:
+        class GetOnlyReader(ReaderBase):
+            def get(self, section: str, key: str) -> Any:
+                raise ConfigValueError()
+
+        reader = GetOnlyReader()
+        assert list(reader.sections()) == []
+        assert list(reader.keys("email")) == []
+        assert list(reader.items("email")) == []
+
+    def test_selector(self) -> None:
+        reader = ReaderSelector(
+            ArgparseReader(self.args),
+            EnvironReader("HHH"),
+            DictionaryReader(self.dictionary),
+            SpecReader(self.spec),
+        )
+        sections = reader.sections()
+        assert isinstance(sections, Iterator)
+        assert list(sections) == ["email", "my", "nsca", "beep"]
+        assert list(reader.keys("email")) == ["server", "port", "user"]
+        assert dict(reader.items("email")) == {
+            "server": "argparse",
+            "port": "2525",
+            "user": "dictionary",
+        }
+
+    def test_config_reader(self) -> None:
+        conf2levels = ConfigReader(
+            spec=self.spec, environ="HHH", dictionary=self.dictionary
+        )
+        assert list(conf2levels.sections()) == ["email", "nsca", "beep"]
+        assert list(conf2levels.keys("nsca")) == ["host"]
+        assert dict(conf2levels.items("email")) == {
+            "port": 2525,
+            "user": "dictionary",
+            "server": "spec",
+        }
+
+
 class TestFunctionLoadReadersByKeyword:
     def test_without_keywords_arguments(self) -> None:
         with pytest.raises(TypeError):
@@ -392,6 +1093,19 @@ class TestClassConfigReader:
         with pytest.raises(ValueError):
             conf2levels.check_section("empty")
 
+    def test_invalid_spec_names(self) -> None:
+        with pytest.raises(ValueError):
+            ConfigReader(spec={"my-section": {"key": {}}})
+        with pytest.raises(ValueError):
+            ConfigReader(spec={"section": {"my key": {}}})
+
+    def test_lenient(self) -> None:
+        conf2levels = ConfigReader(
+            spec={"my-section": {"key": {"default": 1}}}, strict=False
+        )
+        config = conf2levels.get_dictionary_interface()
+        assert config["my-section"]["key"] == 1
+
     def test_spec_defaults(self) -> None:
         dictionary = {
             "no_default": {
@@ -436,6 +1150,1097 @@ class TestClassConfigReader:
         args = parser.parse_args(["--email-smtp-login", "user2"])
         assert args.email_smtp_login == "user2"
 
+    def test_method_spec_to_argparse_mapping(self) -> None:
+        spec = {
+            "smtp_server": {"login_name": {"default": "user1"}},
+            "Email": {"port": {"default": 25}},
+        }
+        conf2levels = ConfigReader(spec=spec)
+        parser = argparse.ArgumentParser()
+        mapping = conf2levels.spec_to_argparse(parser)
+        assert mapping == {
+            "smtp_server.login_name": "smtp_server_login_name",
+            "Email.port": "Email_port",
+        }
+        assert conf2levels.argparse_mapping is mapping
+        args = parser.parse_args(["--smtp-server-login-name", "user2"])
+        conf2levels = ConfigReader(spec=spec, argparse=(args, mapping))
+        config = conf2levels.get_class_interface()
+        assert config.smtp_server.login_name == "user2"
+        assert config.Email.port == 25
+
+    def test_cache_size(self) -> None:
+        dictionary = {"email": {"smtp_server": "smtp.example.com"}}
+        conf2levels = ConfigReader(dictionary=dictionary, cache_size=16)
+        config = conf2levels.get_class_interface()
+        assert config.email.smtp_server == "smtp.example.com"
+        dictionary["email"]["smtp_server"] = "mail.example.com"
+        assert config.email.smtp_server == "smtp.example.com"
+        conf2levels.invalidate("email")
+        assert config.email.smtp_server == "mail.example.com"
+
+
+class TestClassInterfaces:
+    def setup_method(self) -> None:
+        self.dictionary = {"email": {"port": "587"}}
+        self.conf2levels = ConfigReader(dictionary=self.dictionary)
+
+    def test_class_interface_reuses_sections(self) -> None:
+        config = self.conf2levels.get_class_interface()
+        assert config.email is config.email
+        assert config.email.port == 587
+        self.dictionary["email"]["port"] = "25"
+        assert config.email.port == 25
+
+    def test_dictionary_interface_reuses_sections(self) -> None:
+        config = self.conf2levels.get_dictionary_interface()
+        assert config["email"] is config["email"]
+        assert config["email"]["port"] == 587
+        self.dictionary["email"]["port"] = "25"
+        assert config["email"]["port"] == 25
+
+    def test_class_interface_store_values(self) -> None:
+        config = self.conf2levels.get_class_interface(store_values=True)
+        assert config.email.port == 587
+        assert config.email.__dict__ == {"port": 587}
+        self.dictionary["email"]["port"] = "25"
+        assert config.email.port == 587
+
+    def test_dictionary_interface_store_values(self) -> None:
+        config = self.conf2levels.get_dictionary_interface(store_values=True)
+        assert config["email"]["port"] == 587
+        self.dictionary["email"]["port"] = "25"
+        assert config["email"]["port"] == 587
+
+    def test_slots(self) -> None:
+        config = self.conf2levels.get_dictionary_interface()
+        with pytest.raises(AttributeError):
+            config.lol = 1  # type: ignore
+
+
+class TestClassConfigReaderSpecTypes:
+    spec: Spec = {
+        "email": {
+            "smtp_password": {"type": str},
+            "port": {"type": int, "default": "587"},
+            "timeout": {"type": float},
+            "tls": {"type": bool},
+            "recipients": {"type": list},
+            "to_addr_critical": {"type": str, "default": None},
+            "server": {"type": lambda value: value.upper()},
+        }
+    }
+
+    def setup_method(self) -> None:
+        self.dictionary = {
+            "email": {
+                "smtp_password": "1234",
+                "timeout": "2.5",
+                "tls": "yes",
+                "recipients": "a@example.com, b@example.com",
+                "server": "smtp.example.com",
+            }
+        }
+        self.conf2levels = ConfigReader(spec=self.spec, dictionary=self.dictionary)
+        self.config = self.conf2levels.get_class_interface()
+
+    def test_converters(self) -> None:
+        assert self.config.email.smtp_password == "1234"
+        assert self.config.email.port == 587
+        assert self.config.email.timeout == 2.5
+        assert self.config.email.tls is True
+        assert self.config.email.recipients == ["a@example.com", "b@example.com"]
+        assert self.config.email.to_addr_critical is None
+        assert self.config.email.server == "SMTP.EXAMPLE.COM"
+
+    def test_dictionary_interface(self) -> None:
+        config = self.conf2levels.get_dictionary_interface()
+        assert config["email"]["smtp_password"] == "1234"
+        assert config["email"]["port"] == 587
+
+    def test_converted_once(self) -> None:
+        calls: List[str] = []
+
+        def convert(value: str) -> str:
+            calls.append(value)
+            return value.upper()
+
+        conf2levels = ConfigReader(
+            spec={"email": {"server": {"type": convert}}},
+            dictionary=self.dictionary,
+        )
+        config = conf2levels.get_class_interface()
+        assert config.email.server == "SMTP.EXAMPLE.COM"
+        assert config.email.server == "SMTP.EXAMPLE.COM"
+        assert calls == ["smtp.example.com"]
+        self.dictionary["email"]["server"] = "mail.example.com"
+        assert config.email.server == "MAIL.EXAMPLE.COM"
+        assert len(calls) == 2
+
+    def test_frozen(self) -> None:
+        conf2levels = ConfigReader(
+            spec=self.spec, dictionary=self.dictionary, frozen=True
+        )
+        config = conf2levels.get_class_interface()
+        assert config.email.smtp_password == "1234"
+        assert config.email.port == 587
+
+    def test_invalid_value(self) -> None:
+        self.dictionary["email"]["tls"] = "maybe"
+        with pytest.raises(ValueError):
+            self.config.email.tls
+
+    def test_mutable_values_are_not_shared(self, tmp_path: Path) -> None:
+        snapshot_path = str(tmp_path / "config.snapshot")
+        for kwargs in (
+            {},
+            {"frozen": True},
+            {"concurrent": True},
+            {"snapshot_path": snapshot_path},
+            {"snapshot_path": snapshot_path},
+        ):
+            conf2levels = ConfigReader(
+                spec=self.spec,
+                dictionary=self.dictionary,
+                **kwargs,  # type: ignore
+            )
+            config = conf2levels.get_class_interface()
+            config.email.recipients.append("evil@example.com")
+            assert config.email.recipients == ["a@example.com", "b@example.com"]
+            assert conf2levels.reader.get_typed("email", "recipients") == [
+                "a@example.com",
+                "b@example.com",
+            ]
+
+    def test_spec_to_argparse(self) -> None:
+        parser = argparse.ArgumentParser()
+        self.conf2levels.spec_to_argparse(parser)
+        args = parser.parse_args(["--email-timeout", "3", "--email-tls", "off"])
+        assert args.email_timeout == 3.0
+        assert args.email_tls is False
+        assert args.email_port == 587
+
+
+class TestFunctionToBool:
+    def test_true(self) -> None:
+        for value in ("1", "yes", "True", " on ", True, 1):
+            assert to_bool(value) is True
+
+    def test_false(self) -> None:
+        for value in ("0", "no", "False", "off", False, 0):
+            assert to_bool(value) is False
+
+    def test_invalid(self) -> None:
+        with pytest.raises(ValueError):
+            to_bool("maybe")
+
+
+class TestFunctionToList:
+    def test_literal(self) -> None:
+        assert to_list("[1, 2, 3]") == [1, 2, 3]
+        assert to_list("(1, 2)") == [1, 2]
+
+    def test_comma_separated(self) -> None:
+        assert to_list("a, b,c") == ["a", "b", "c"]
+        assert to_list("") == []
+
+    def test_sequences(self) -> None:
+        assert to_list((1, 2)) == [1, 2]
+
+
+class TestClassCompiledSpec:
+    spec: Spec = {
+        "email": {
+            "port": {"description": "The SMTP port", "default": 25, "type": int},
+            "login": {"not_empty": True},
+        },
+        "paths": {"log": {"default": "/var/log"}},
+    }
+
+    def test_tables(self) -> None:
+        compiled = CompiledSpec(self.spec)
+        assert list(compiled.sections()) == ["email", "paths"]
+        assert set(compiled.converters) == {("email", "port")}
+        assert len(compiled) == 3
+        assert ("paths", "log") in compiled
+        assert ("paths", "missing") not in compiled
+
+    def test_descriptors(self) -> None:
+        compiled = CompiledSpec(self.spec)
+        port, login = compiled.section("email")
+        assert port.key == "port"
+        assert port.description == "The SMTP port"
+        assert port.default == 25
+        assert port.converter is not None
+        assert port.converter("587") == 587
+        assert not port.not_empty
+        assert login.default is MISSING
+        assert login.not_empty
+        assert login.converter is None
+        assert compiled.get("paths", "log") == next(iter(compiled.section("paths")))
+        assert compiled.get("paths", "missing") is None
+        assert [descriptor.key for descriptor in compiled] == ["port", "login", "log"]
+        with pytest.raises(KeyError):
+            compiled.section("missing")
+
+    def test_strict(self) -> None:
+        with pytest.raises(ValueError):
+            CompiledSpec({"email": {"smtp-server": {}}})
+        CompiledSpec({"email": {"smtp-server": {}}}, strict=False)
+
+    def test_spec_reader(self) -> None:
+        reader = SpecReader(CompiledSpec(self.spec))
+        assert reader.get("email", "port") == 25
+        assert reader.lookup("email", "login") is MISSING
+        assert reader.lookup("missing", "key") is MISSING
+        assert list(reader.sections()) == ["email", "paths"]
+        assert reader.get_section("paths") == {"log": "/var/log"}
+
+    def test_shared_by_config_readers(self) -> None:
+        compiled = CompiledSpec(self.spec)
+        first = ConfigReader(spec=compiled, dictionary={"email": {"port": "587"}})
+        second = ConfigReader(spec=compiled, dictionary={"email": {"login": "user"}})
+        assert first.compiled_spec is second.compiled_spec
+        assert first.spec is self.spec
+        assert first.get_class_interface().email.port == 587
+        assert second.get_class_interface().email.port == 25
+        assert not first.validate()
+        assert second.validate()
+
+    def test_config_reader_strict(self) -> None:
+        compiled = CompiledSpec({"email": {"smtp-server": {}}}, strict=False)
+        with pytest.raises(ValueError):
+            ConfigReader(spec=compiled)
+        assert not compiled.strict
+        ConfigReader(spec=compiled, strict=False)
+
+    def test_validated_once(self) -> None:
+        compiled = CompiledSpec(self.spec, strict=False)
+        ConfigReader(spec=compiled)
+        assert compiled.strict
+        # A compiled specification which is already strict isn’t walked again.
+        self.spec["email"]["smtp-server"] = {}
+        try:
+            ConfigReader(spec=compiled)
+        finally:
+            del self.spec["email"]["smtp-server"]
+
+    def test_readers_share_descriptors(self) -> None:
+        compiled = CompiledSpec(self.spec)
+        conf2levels = ConfigReader(spec=compiled)
+        spec_reader = conf2levels.reader.readers[-1]
+        assert isinstance(spec_reader, SpecReader)
+        assert spec_reader._compiled is compiled
+        assert compiled.section("email") is compiled.section("email")
+        assert compiled.get("email", "port") is compiled.section("email")[0]
+
+
+class TestClassTypedInterface:
+    spec: Spec = {
+        "email": {
+            "port": {"description": "The SMTP port", "default": 25, "type": int},
+            "tls": {"default": None, "type": bool},
+            "smtp_server": {},
+        },
+        "log_files": {"paths": {"type": list}},
+    }
+
+    def reader(self) -> ConfigReader:
+        return ConfigReader(
+            spec=self.spec,
+            dictionary={
+                "email": {"tls": "yes", "smtp_server": "smtp.example.com"},
+                "log_files": {"paths": "a.log, b.log"},
+            },
+        )
+
+    def assert_filled(self, config: Any) -> None:
+        assert config.email.port == 25
+        assert config.email.tls is True
+        assert config.email.smtp_server == "smtp.example.com"
+        assert config.log_files.paths == ["a.log", "b.log"]
+
+    def test_generate_classes(self) -> None:
+        cls = generate_classes(self.spec, name="Settings")
+        assert cls.__name__ == "Settings"
+        assert cls.__slots__ == ("email", "log_files")
+        email = cls.__sections__["email"]
+        assert email.__name__ == "Email"
+        assert cls.__sections__["log_files"].__name__ == "LogFiles"
+        assert email.__slots__ == ("port", "tls", "smtp_server")
+        assert email.__annotations__ == {
+            "port": int,
+            "tls": Optional[bool],
+            "smtp_server": Any,
+        }
+
+    def test_get_typed_interface(self) -> None:
+        conf2levels = self.reader()
+        config = conf2levels.get_typed_interface()
+        self.assert_filled(config)
+        assert not hasattr(config.email, "__dict__")
+        assert type(conf2levels.get_typed_interface()) is type(config)
+
+    def test_missing_value(self) -> None:
+        config = ConfigReader(spec=self.spec).get_typed_interface()
+        assert config.email.port == 25
+        with pytest.raises(AttributeError):
+            config.email.smtp_server
+
+    def test_generate_module(self) -> None:
+        source = generate_module(self.spec, name="Settings")
+        assert '    __slots__ = ("port", "tls", "smtp_server")\n' in source
+        assert '    __slots__ = ("paths",)\n' in source
+        assert '    port: int\n    "The SMTP port"\n' in source
+        assert "    tls: Optional[bool]\n" in source
+        assert "    log_files: LogFiles\n" in source
+        namespace: Dict[str, Any] = {}
+        exec(compile(source, "settings_types.py", "exec"), namespace)
+        config = self.reader().get_typed_interface(namespace["Settings"])
+        assert isinstance(config, namespace["Settings"])
+        self.assert_filled(config)
+
+    def test_invalid_names(self) -> None:
+        for spec in ({"email": {"class": {}}}, {"1email": {"key": {}}}):
+            with pytest.raises(ValueError):
+                generate_classes(spec)
+            with pytest.raises(ValueError):
+                generate_module(spec)
+
+    def test_reserved_class_names(self, tmp_path: Path) -> None:
+        spec: Spec = {
+            "list": {"key": {"type": list}},
+            "any": {"key": {}},
+            "config": {"key": {"type": int}},
+        }
+        (tmp_path / "reserved_types.py").write_text(generate_module(spec))
+        sys.path.insert(0, str(tmp_path))
+        try:
+            import reserved_types  # type: ignore
+        finally:
+            sys.path.remove(str(tmp_path))
+            sys.modules.pop("reserved_types", None)
+        names = [cls.__name__ for cls in reserved_types.Config.__sections__.values()]
+        assert names == ["List2", "Any2", "Config2"]
+        assert reserved_types.List2.__annotations__["key"] == List[Any]
+        conf2levels = ConfigReader(
+            spec=spec, dictionary={"list": {"key": "a, b"}, "config": {"key": "1"}}
+        )
+        config = conf2levels.get_typed_interface(reserved_types.Config)
+        assert config.list.key == ["a", "b"]
+        assert config.config.key == 1
+        runtime = generate_classes(spec)
+        assert [cls.__name__ for cls in runtime.__sections__.values()] == names
+
+    def test_class_name_collision(self) -> None:
+        cls = generate_classes({"log_files": {}, "LogFiles": {}})
+        names = [section.__name__ for section in cls.__sections__.values()]
+        assert names == ["LogFiles", "LogFiles2"]
+
+
+class TestClassConfigReaderValidate:
+    spec: Spec = {
+        "email": {
+            "server": {"not_empty": True},
+            "port": {"type": int, "default": 25},
+            "password": {"not_empty": True},
+        },
+        "icinga": {
+            "url": {"not_empty": True},
+            "user": {},
+        },
+        "beep": {"activated": {"type": bool, "default": False}},
+    }
+
+    def test_valid(self) -> None:
+        conf2levels = ConfigReader(
+            spec=self.spec,
+            dictionary={
+                "email": {"server": "smtp.example.com", "password": "secret"},
+                "icinga": {"url": "https://example.com", "user": ""},
+            },
+        )
+        report = conf2levels.validate()
+        assert report
+        assert report.ok
+        assert len(report) == 0
+        report.raise_for_violations()
+
+    def test_all_violations(self) -> None:
+        conf2levels = ConfigReader(
+            spec=self.spec,
+            dictionary={
+                "email": {"server": "", "port": "x"},
+                "beep": {"activated": "maybe"},
+            },
+        )
+        report = conf2levels.validate()
+        assert not report
+        assert [(v.section, v.key, v.kind) for v in report] == [
+            ("email", "server", "empty"),
+            ("email", "port", "type"),
+            ("email", "password", "missing"),
+            ("icinga", "url", "missing"),
+            ("icinga", "user", "missing"),
+            ("beep", "activated", "type"),
+        ]
+        with pytest.raises(ValidationError) as context:
+            report.raise_for_violations()
+        assert context.value.report is report
+        assert "(section “icinga” key “url”)" in context.value.args[0]
+
+    def test_concurrent(self) -> None:
+        conf2levels = ConfigReader(spec=self.spec, dictionary={})
+        sequential = conf2levels.validate()
+        concurrent = conf2levels.validate(max_workers=4)
+        assert concurrent.violations == sequential.violations
+
+
+class TestClassConfigReaderFreeze:
+    def setup_method(self) -> None:
+        os.environ["FFF__common__key"] = "environ"
+        os.environ["FFF__specific__environ"] = "environ"
+        self.dictionary = {
+            "common": {"key": "dictionary"},
+            "specific": {"dictionary": "dictionary"},
+        }
+        self.spec: Spec = {
+            "common": {"key": {"default": "spec"}},
+            "specific": {"spec": {"default": "spec"}, "no_default": {}},
+        }
+
+    def teardown_method(self) -> None:
+        del os.environ["FFF__common__key"]
+        del os.environ["FFF__specific__environ"]
+
+    def test_precedence(self) -> None:
+        conf2levels = ConfigReader(
+            spec=self.spec,
+            environ="FFF",
+            dictionary=self.dictionary,
+            ini=os.path.join(FILES_DIR, "integration.ini"),
+        )
+        frozen = conf2levels.freeze()
+        assert isinstance(frozen, FrozenReader)
+        assert frozen.get("common", "key") == "environ"
+        assert frozen.get("specific", "environ") == "environ"
+        assert frozen.get("specific", "dictionary") == "dictionary"
+        assert frozen.get("specific", "ini") == "ini"
+        assert frozen.get("specific", "spec") == "spec"
+        assert ("specific", "no_default") not in frozen
+
+    def test_snapshot_is_immutable(self) -> None:
+        conf2levels = ConfigReader(dictionary=self.dictionary)
+        frozen = conf2levels.freeze()
+        self.dictionary["common"]["key"] = "changed"
+        assert frozen.get("common", "key") == "dictionary"
+        with pytest.raises(TypeError):
+            frozen._table[("common", "key")] = "changed"  # type: ignore
+
+    def test_invalid_value(self) -> None:
+        conf2levels = ConfigReader(
+            spec={"email": {"port": {"type": int}, "timeout": {"type": float}}},
+            dictionary={"email": {"port": "x", "timeout": "2.5"}},
+            frozen=True,
+        )
+        config = conf2levels.get_class_interface()
+        assert config.email.timeout == 2.5
+        with pytest.raises(ValueError):
+            config.email.port
+        report = conf2levels.validate()
+        assert [(v.key, v.kind) for v in report] == [("port", "type")]
+
+    def test_miss(self) -> None:
+        frozen = ConfigReader(dictionary=self.dictionary).freeze()
+        with pytest.raises(ValueError) as context:
+            frozen.get("lol", "lol")
+        assert isinstance(context.value, ConfigValueError)
+        assert (
+            context.value.args[0]
+            == "Configuration value could not be found (section “lol” key "
+            "“lol”)."
+        )
+
+    def test_argparse_mapping(self) -> None:
+        parser = argparse.ArgumentParser()
+        parser.add_argument("--common-key")
+        args = parser.parse_args(["--common-key", "argparse"])
+        frozen = ConfigReader(
+            argparse=(args, {"common.key": "common_key"}),
+            dictionary=self.dictionary,
+        ).freeze()
+        assert frozen.get("common", "key") == "argparse"
+
+    def test_keyword_frozen(self) -> None:
+        conf2levels = ConfigReader(
+            spec=self.spec, dictionary=self.dictionary, frozen=True
+        )
+        assert isinstance(conf2levels.reader, FrozenReader)
+        config = conf2levels.get_class_interface()
+        self.dictionary["common"]["key"] = "changed"
+        assert config.common.key == "dictionary"
+        assert config.specific.spec == "spec"
+
+    def test_case_insensitive_ini_keys(self, tmp_path: Path) -> None:
+        path = tmp_path / "config.ini"
+        path.write_text("[email]\nSMTP_Server = ini\n")
+
+        def results(**kwargs: Any) -> List[Any]:
+            conf2levels = ConfigReader(
+                dictionary={"email": {"smtp_server": "dictionary", "port": "25"}},
+                ini=str(path),
+                **kwargs,
+            )
+            values: List[Any] = []
+            for key in ("SMTP_Server", "smtp_server", "Smtp_Server", "port", "Port"):
+                try:
+                    values.append(conf2levels.reader.get("email", key))
+                except ValueError:
+                    values.append(MISSING)
+            return values
+
+        live = results()
+        assert live == ["ini", "dictionary", "ini", "25", MISSING]
+        assert results(frozen=True) == live
+        snapshot_path = str(tmp_path / "config.snapshot")
+        assert results(snapshot_path=snapshot_path) == live
+        assert results(snapshot_path=snapshot_path) == live
+        config = ConfigReader(ini=str(path), frozen=True).get_class_interface()
+        assert config.email.SMTP_Server == "ini"
+
+    def test_names_not_registered(self, tmp_path: Path) -> None:
+        path = tmp_path / "config.ini"
+        path.write_text("[frozen_section]\nfrozen_key = 1\n")
+        dictionary = DictionaryReader({"frozen_dictionary": {"key": "1"}})
+        conf2levels = ConfigReader(
+            ini=str(path), readers=dictionary, frozen=True, provenance=True
+        )
+        concurrent = ConfigReader(ini=str(path), readers=dictionary, concurrent=True)
+        dictionary.set("frozen_dictionary", "published_key", "2")
+        assert conf2levels.reader.get("frozen_section", "frozen_key") == "1"
+        assert concurrent.reader.get("frozen_dictionary", "published_key") == "2"
+        for name in ("frozen_section", "frozen_dictionary", "published_key"):
+            assert name not in _valid_keys
+
+    def test_strict_names(self) -> None:
+        frozen = ConfigReader(dictionary=self.dictionary, frozen=True).reader
+        with pytest.raises(ValueError) as context:
+            frozen.get("a-b", "key")
+        assert not isinstance(context.value, ConfigValueError)
+        assert "invalid characters" in context.value.args[0]
+        with pytest.raises(ValueError):
+            frozen.lookup("common", "a-b")
+        frozen = ConfigReader(
+            dictionary=self.dictionary, frozen=True, strict=False
+        ).reader
+        with pytest.raises(ConfigValueError):
+            frozen.get("a-b", "key")
+
+
+class TestClassConfigReaderInstrumentation:
+    def setup_method(self) -> None:
+        self.spec: Spec = {"email": {"port": {"default": 25}}}
+        self.dictionary = {"email": {"server": "example.com"}}
+
+    def test_not_instrumented_by_default(self) -> None:
+        conf2levels = ConfigReader(spec=self.spec)
+        assert type(conf2levels.reader) is ReaderSelector
+        with pytest.raises(ValueError):
+            conf2levels.stats()
+
+    def test_reader_hits_and_misses(self) -> None:
+        conf2levels = ConfigReader(
+            spec=self.spec, dictionary=self.dictionary, instrument=True
+        )
+        assert isinstance(conf2levels.reader, InstrumentedReaderSelector)
+        config = conf2levels.get_class_interface()
+        assert config.email.port == 25
+        assert config.email.port == 25
+        assert config.email.server == "example.com"
+        with pytest.raises(ValueError):
+            config.email.missing
+
+        stats = conf2levels.stats()
+        assert stats.lookups == 4
+        assert stats.cache_hits == 0
+        assert stats.not_found == 1
+        assert stats.time_ns > 0
+        dictionary, spec = stats.readers
+        assert isinstance(dictionary.reader, DictionaryReader)
+        assert (dictionary.hits, dictionary.misses) == (1, 3)
+        assert isinstance(spec.reader, SpecReader)
+        assert (spec.hits, spec.misses) == (2, 1)
+        assert stats.keys.most_common(1) == [(("email", "port"), 2)]
+
+    def test_cache_hits(self) -> None:
+        conf2levels = ConfigReader(spec=self.spec, cache_size=8, instrument=True)
+        conf2levels.get_class_interface().email.port
+        conf2levels.get_class_interface().email.port
+        stats = conf2levels.stats()
+        assert stats.lookups == 2
+        assert stats.cache_hits == 1
+        assert stats.readers[0].hits == 1
+
+    def test_snapshot_and_reset(self) -> None:
+        conf2levels = ConfigReader(spec=self.spec, instrument=True)
+        conf2levels.reader.get("email", "port")
+        stats = conf2levels.stats()
+        conf2levels.reader.get("email", "port")
+        assert stats.lookups == 1
+        assert stats.keys[("email", "port")] == 1
+        assert isinstance(conf2levels.reader, InstrumentedReaderSelector)
+        conf2levels.reader.reset_stats()
+        assert conf2levels.stats().lookups == 0
+
+    def test_callback_with_sampling(self) -> None:
+        events: List[LookupEvent] = []
+        conf2levels = ConfigReader(
+            spec=self.spec,
+            dictionary=self.dictionary,
+            on_lookup=events.append,
+            sample_every=2,
+        )
+        for _ in range(4):
+            conf2levels.reader.get("email", "server")
+        assert len(events) == 2
+        event = events[0]
+        assert (event.section, event.key) == ("email", "server")
+        assert isinstance(event.reader, DictionaryReader)
+        assert not event.cached
+        assert event.duration_ns >= 0
+
+
+class TestClassConfigReaderProvenance:
+    def setup_method(self) -> None:
+        os.environ["PPP__common__environ"] = "environ"
+        self.spec: Spec = {"common": {"spec": {"default": "spec"}}}
+        self.ini = os.path.join(FILES_DIR, "integration.ini")
+        parser = argparse.ArgumentParser()
+        parser.add_argument("--common-argparse")
+        self.args = parser.parse_args(["--common-argparse", "argparse"])
+
+    def teardown_method(self) -> None:
+        del os.environ["PPP__common__environ"]
+
+    def config_reader(self, **kwargs: Any) -> ConfigReader:
+        return ConfigReader(
+            spec=self.spec,
+            argparse=self.args,
+            environ="PPP",
+            dictionary={"common": {"dictionary": "dictionary"}},
+            ini=self.ini,
+            **kwargs,
+        )
+
+    def test_sources(self) -> None:
+        conf2levels = self.config_reader()
+        assert (
+            conf2levels.explain("common", "argparse").source
+            == "argparse dest “common_argparse”"
+        )
+        assert (
+            conf2levels.explain("common", "environ").source
+            == "environment variable “PPP__common__environ”"
+        )
+        assert (
+            conf2levels.explain("common", "dictionary").source
+            == "dictionary (section “common” key “dictionary”)"
+        )
+        assert conf2levels.explain(
+            "specific", "ini"
+        ).source == "INI file “{}” section “specific” key “ini”".format(self.ini)
+        provenance = conf2levels.explain("common", "spec")
+        assert provenance.value == "spec"
+        assert isinstance(provenance.reader, SpecReader)
+        assert provenance.source == "spec default (section “common” key “spec”)"
+
+    def test_missing(self) -> None:
+        with pytest.raises(ValueError):
+            self.config_reader(provenance=True).explain("common", "missing")
+
+    def test_recorded_in_the_same_pass(self) -> None:
+        conf2levels = self.config_reader(provenance=True, cache_size=8)
+        assert conf2levels.get_class_interface().common.environ == "environ"
+        calls: List[str] = []
+        for reader in conf2levels.reader.readers:
+            lookup = reader.lookup
+
+            def counted(section: str, key: str, lookup: Any = lookup) -> Any:
+                calls.append(key)
+                return lookup(section, key)
+
+            reader.lookup = counted  # type: ignore
+        provenance = conf2levels.explain("common", "environ")
+        assert isinstance(provenance.reader, EnvironReader)
+        assert calls == []
+
+    def test_invalidate(self) -> None:
+        conf2levels = self.config_reader(provenance=True, cache_size=8)
+        conf2levels.reader.get("common", "environ")
+        assert isinstance(conf2levels.reader, ReaderSelector)
+        assert conf2levels.reader._sources
+        conf2levels.invalidate()
+        assert not conf2levels.reader._sources
+
+    def test_frozen(self) -> None:
+        conf2levels = self.config_reader(provenance=True, frozen=True)
+        assert isinstance(conf2levels.reader, FrozenReader)
+        assert (
+            conf2levels.explain("common", "environ").source
+            == "environment variable “PPP__common__environ”"
+        )
+
+
+class TestClassConfigReaderConcurrent:
+    def test_snapshot_is_replaced(self) -> None:
+        conf2levels = ConfigReader(
+            dictionary={"email": {"port": "25"}}, concurrent=True, cache_size=8
+        )
+        assert isinstance(conf2levels.reader, SnapshotReader)
+        snapshot = conf2levels.reader.snapshot
+        config = conf2levels.get_class_interface()
+        assert config.email.port == 25
+        dictionary = conf2levels.reader._reader.readers[0]
+        assert isinstance(dictionary, DictionaryReader)
+        dictionary.set("email", "port", "587")
+        assert config.email.port == 587
+        assert snapshot.get("email", "port") == "25"
+        assert conf2levels.freeze() is conf2levels.reader.snapshot
+
+    def test_invalid_value(self) -> None:
+        dictionary = DictionaryReader({"email": {"port": "1"}})
+        conf2levels = ConfigReader(
+            spec={"email": {"port": {"type": int}}},
+            readers=dictionary,
+            concurrent=True,
+        )
+        config = conf2levels.get_class_interface()
+        assert config.email.port == 1
+        dictionary.set("email", "port", "x")
+        assert conf2levels.reader.get("email", "port") == "x"
+        with pytest.raises(ValueError):
+            config.email.port
+        dictionary.set("email", "port", "2")
+        assert config.email.port == 2
+
+    def test_unlisted_values(self) -> None:
+        conf2levels = ConfigReader(argparse=ARGPARSER_NAMESPACE, concurrent=True)
+        assert conf2levels.get_class_interface().baroque.name == "Bach"
+        with pytest.raises(ValueError):
+            conf2levels.get_class_interface().baroque.missing
+
+    def test_ini_reload(self, tmp_path: Path) -> None:
+        path = tmp_path / "config.ini"
+        path.write_text("[email]\nport = 25\n")
+        ini = IniReader(str(path))
+        conf2levels = ConfigReader(ini=ini, concurrent=True)
+        path.write_text("[email]\nport = 587\n\n")
+        assert ini.reload()
+        assert conf2levels.get_section("email") == {"port": 587}
+
+
+class AsyncDictionaryReader(AsyncReaderBase):
+    def __init__(
+        self,
+        dictionary: Dict[str, Dict[str, Any]],
+        delay: float = 0.0,
+        running: Optional[Dict[str, int]] = None,
+    ):
+        self.dictionary = dictionary
+        self.delay = delay
+        self.calls: List[str] = []
+        self.running = {"active": 0, "peak": 0} if running is None else running
+        """Counts the lookups in progress; can be shared by several readers."""
+
+    async def alookup(self, section: str, key: str) -> Any:
+        self.calls.append(key)
+        running = self.running
+        running["active"] += 1
+        running["peak"] = max(running["peak"], running["active"])
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            running["active"] -= 1
+        return self.dictionary.get(section, {}).get(key, MISSING)
+
+
+class TestClassAsync:
+    def test_precedence(self) -> None:
+        slow = AsyncDictionaryReader({"s": {"a": "slow", "b": "slow"}}, delay=0.02)
+        fast = AsyncDictionaryReader({"s": {"a": "fast", "c": "fast"}})
+        conf2levels = ConfigReader(
+            dictionary={"s": {"d": "dictionary"}}, readers=[slow, fast]
+        )
+
+        async def main() -> List[Any]:
+            return [await conf2levels.aget("s", key) for key in "abcd"]
+
+        assert asyncio.run(main()) == ["slow", "slow", "fast", "dictionary"]
+
+    def test_readers_are_queried_concurrently(self) -> None:
+        running = {"active": 0, "peak": 0}
+        readers = [
+            AsyncDictionaryReader({}, delay=0.01, running=running) for _ in range(3)
+        ]
+        readers.append(
+            AsyncDictionaryReader({"s": {"k": "5"}}, delay=0.01, running=running)
+        )
+        conf2levels = ConfigReader(readers=readers)
+        assert asyncio.run(conf2levels.aget("s", "k")) == 5
+        assert running == {"active": 0, "peak": 4}
+
+    def test_no_cache_without_async_readers(self) -> None:
+        dictionary = {"s": {"k": "1"}}
+        selector = ReaderSelector(DictionaryReader(dictionary))
+        assert asyncio.run(selector.aget("s", "k")) == "1"
+        assert asyncio.run(selector.alookup_many("s", ["k"])) == {"k": "1"}
+        assert selector._cache is None
+        dictionary["s"]["k"] = "2"
+        assert asyncio.run(selector.aget("s", "k")) == "2"
+
+    def test_async_cache_is_invalidated(self) -> None:
+        dictionary_reader = DictionaryReader({"s": {"k": "1"}})
+        selector = ReaderSelector(dictionary_reader, AsyncDictionaryReader({}))
+        assert asyncio.run(selector.aget("s", "k")) == "1"
+        assert selector._cache is not None
+        dictionary_reader.set("s", "k", "2")
+        assert asyncio.run(selector.aget("s", "k")) == "2"
+
+    def test_synchronous_readers_first(self) -> None:
+        slow = AsyncDictionaryReader({"s": {"k": "slow"}}, delay=1)
+        conf2levels = ConfigReader(dictionary={"s": {"k": "dictionary"}}, readers=slow)
+        assert asyncio.run(conf2levels.aget("s", "k")) == "dictionary"
+        assert slow.calls == []
+
+    def test_missing(self) -> None:
+        conf2levels = ConfigReader(readers=AsyncDictionaryReader({}))
+        with pytest.raises(ValueError):
+            asyncio.run(conf2levels.aget("s", "k"))
+
+    def test_prefetch(self) -> None:
+        reader = AsyncDictionaryReader({"s": {"a": "1", "b": "True"}}, delay=0.01)
+        spec: Spec = {"s": {"a": {"type": int}, "b": {}, "c": {"default": 3}}}
+        conf2levels = ConfigReader(spec=spec, readers=reader)
+
+        async def main() -> Tuple[Any, Any, Any]:
+            await conf2levels.prefetch()
+            config = conf2levels.get_class_interface()
+            # The values come from the cache: a synchronous lookup of the
+            # async reader would fail inside the running event loop.
+            return config.s.a, config.s.b, config.s.c
+
+        assert asyncio.run(main()) == (1, True, 3)
+        assert sorted(reader.calls) == ["a", "b", "c"]
+
+    def test_concurrent_mode(self) -> None:
+        reader = AsyncDictionaryReader({"s": {"a": "1", "b": "True"}})
+        spec: Spec = {"s": {"a": {"type": int}, "b": {}, "c": {"default": 3}}}
+        conf2levels = ConfigReader(spec=spec, readers=reader, concurrent=True)
+        assert isinstance(conf2levels.reader, SnapshotReader)
+
+        async def main() -> Tuple[Any, Any, Any]:
+            assert await conf2levels.aget("s", "a") == 1
+            assert await conf2levels.aget("s", "c") == 3
+            await conf2levels.prefetch()
+            config = conf2levels.get_class_interface()
+            return config.s.a, config.s.b, config.s.c
+
+        assert asyncio.run(main()) == (1, True, 3)
+
+    def test_prefetch_frozen(self) -> None:
+        conf2levels = ConfigReader(dictionary={"s": {"k": "1"}}, frozen=True)
+        with pytest.raises(ValueError):
+            asyncio.run(conf2levels.prefetch())
+        assert asyncio.run(conf2levels.aget("s", "k")) == 1
+
+    def test_synchronous_access(self) -> None:
+        reader = AsyncDictionaryReader({"s": {"k": "value"}})
+        assert reader.get("s", "k") == "value"
+        assert ConfigReader(readers=reader).get_class_interface().s.k == "value"
+
+
+def read_shared_snapshot(name: str, queue: Any) -> None:
+    reader = SharedSnapshotReader(name=name)
+    queue.put(reader.get_section("email"))
+    reader.close()
+
+
+class TestClassSharedSnapshotReader:
+    def setup_method(self) -> None:
+        self.spec: Spec = {
+            "email": {"port": {"default": 25, "type": int}, "user": {}},
+        }
+        self.snapshot = ConfigReader(
+            spec=self.spec,
+            dictionary={"email": {"server": "example.com", "tags": ["a", "b"]}},
+        ).freeze()
+
+    def test_file(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "config.snapshot")
+        write_snapshot(self.snapshot, path)
+        reader = SharedSnapshotReader(path=path)
+        assert len(reader) == 3
+        assert reader.get("email", "server") == "example.com"
+        assert reader.get("email", "port") == 25
+        assert reader.get_section("email") == {
+            "server": "example.com",
+            "tags": ["a", "b"],
+            "port": 25,
+        }
+        assert reader.lookup("email", "user") is MISSING
+        with pytest.raises(ConfigValueError):
+            reader.get("email", "user")
+        assert reader.source("email", "port").startswith("snapshot {}".format(path))
+        reader.close()
+
+    def test_config_reader(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "config.snapshot")
+        write_snapshot(self.snapshot, path)
+        conf2levels = ConfigReader(
+            spec=self.spec,
+            readers=SharedSnapshotReader(path=path),
+        )
+        config = conf2levels.get_class_interface()
+        assert config.email.port == 25
+        assert config.email.server == "example.com"
+        assert conf2levels.validate().violations[0].key == "user"
+
+    def test_shared_memory(self) -> None:
+        block = share_snapshot(self.snapshot)
+        try:
+            context = multiprocessing.get_context("spawn")
+            queue = context.Queue()
+            process = context.Process(
+                target=read_shared_snapshot, args=(block.name, queue)
+            )
+            process.start()
+            values = queue.get(timeout=30)
+            process.join(timeout=30)
+            assert values["port"] == 25
+            assert values["server"] == "example.com"
+            # The block survives the exit of the worker.
+            reader = SharedSnapshotReader(name=block.name)
+            assert reader.get("email", "tags") == ["a", "b"]
+            reader.close()
+        finally:
+            block.close()
+            block.unlink()
+
+    def test_invalid(self, tmp_path: Path) -> None:
+        path = tmp_path / "config.snapshot"
+        path.write_bytes(b"no snapshot")
+        with pytest.raises(ValueError):
+            SharedSnapshotReader(path=str(path))
+        with pytest.raises(ValueError):
+            SharedSnapshotReader()
+
+
+class TestClassConfigReaderSnapshotPath:
+    def setup_method(self) -> None:
+        self.dir = Path(tempfile.mkdtemp())
+        self.ini = self.dir / "config.ini"
+        self.ini.write_text("[email]\nserver = example.com\nport = 587\n")
+        self.path = str(self.dir / "config.snapshot")
+        self.spec: Spec = {
+            "email": {"port": {"type": int}, "tls": {"default": "yes", "type": bool}}
+        }
+        os.environ["SSS__email__user"] = "user"
+
+    def teardown_method(self) -> None:
+        os.environ.pop("SSS__email__user", None)
+
+    def config_reader(self, **kwargs: Any) -> ConfigReader:
+        return ConfigReader(
+            spec=self.spec,
+            environ="SSS",
+            ini=str(self.ini),
+            snapshot_path=self.path,
+            **kwargs,
+        )
+
+    def test_incompatible_modes(self) -> None:
+        with pytest.raises(ValueError):
+            self.config_reader(concurrent=True)
+        with pytest.raises(ValueError):
+            ConfigReader(dictionary={"s": {"k": "v"}}, concurrent=True, frozen=True)
+        conf2levels = self.config_reader(frozen=True)
+        assert isinstance(conf2levels.reader, FrozenReader)
+        assert conf2levels.get_class_interface().email.port == 587
+
+    def test_reuse(self) -> None:
+        first = self.config_reader()
+        assert isinstance(first.reader, FrozenReader)
+        assert os.path.exists(self.path)
+        second = self.config_reader()
+        ini = second.reader
+        assert isinstance(ini, FrozenReader)
+        config = second.get_class_interface()
+        assert config.email.port == 587
+        assert config.email.tls is True
+        assert config.email.user == "user"
+        assert config.email.server == "example.com"
+
+    def test_ini_is_not_parsed(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        self.config_reader()
+
+        def fail(self: IniReader) -> None:
+            raise AssertionError("parsed")
+
+        monkeypatch.setattr(IniReader, "_parse", fail)
+        assert self.config_reader().get_section("email")["port"] == 587
+
+    def test_rebuild_on_converter_change(self) -> None:
+        self.spec["email"]["port"]["type"] = lambda value: int(value) + 1
+        assert self.config_reader().get_class_interface().email.port == 588
+        self.spec["email"]["port"]["type"] = lambda value: int(value) + 2
+        assert self.config_reader().get_class_interface().email.port == 589
+
+    def test_rebuild_on_change(self) -> None:
+        self.config_reader()
+        self.ini.write_text("[email]\nserver = example.com\nport = 465\n")
+        assert self.config_reader().get_class_interface().email.port == 465
+        os.environ["SSS__email__user"] = "other"
+        assert self.config_reader().get_class_interface().email.user == "other"
+        self.spec["email"]["tls"]["default"] = "no"
+        assert self.config_reader().get_class_interface().email.tls is False
+        conf2levels = self.config_reader(dictionary={"email": {"sender": "me"}})
+        assert conf2levels.get_class_interface().email.sender == "me"
+
+    def test_custom_reader_is_not_persisted(self) -> None:
+        class Reader(ReaderBase):
+            def get(self, section: str, key: str) -> Any:
+                raise ConfigValueError("No values")
+
+        conf2levels = self.config_reader(readers=Reader())
+        assert isinstance(conf2levels.reader, FrozenReader)
+        assert not os.path.exists(self.path)
+
+
+class TestClassLazyImport:
+    def test_heavy_modules_are_not_imported(self) -> None:
+        modules = ("argparse", "ast", "asyncio", "importlib.metadata")
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, conf2levels; "
+                "print([m for m in {!r} if m in sys.modules])".format(modules),
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        assert output.strip() == "[]"
+
+    def test_lazy_attributes(self) -> None:
+        import conf2levels
+
+        assert conf2levels.IniReader is IniReader
+        assert isinstance(conf2levels.__version__, str)
+        assert set(conf2levels.__all__) <= set(dir(conf2levels))
+        with pytest.raises(AttributeError):
+            conf2levels.missing
+
 
 class TestTypes:
     def setup_method(self) -> None:
@@ -483,3 +2288,68 @@ class TestTypes:
 
     def test_false_str(self) -> None:
         assert self.config.types.false_str == "false"
+
+
+class TestFunctionAutoType:
+    values = [
+        "5667",
+        "-5",
+        "+5",
+        "0",
+        "007",
+        "1_000",
+        "0x1F",
+        "1.5",
+        "1.",
+        ".5",
+        "1e5",
+        "-1.5E-3",
+        "1+2j",
+        "True",
+        "False",
+        "None",
+        "'quoted'",
+        '"quoted"',
+        "''",
+        "'é'",
+        "'a' 'b'",
+        "b'bytes'",
+        "localhost",
+        "smtp.example.com",
+        "smtp.example.com:587",
+        "Some text",
+        "",
+        " 1",
+        "[1, 2, 3]",
+        "(1, 2, 3)",
+        "{'one': 1}",
+        "{1, 2}",
+        "print('lol')",
+        "print('lol)'",
+    ]
+
+    @staticmethod
+    def literal_eval(value: str) -> Any:
+        try:
+            return ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            return value
+
+    def test_same_as_literal_eval(self) -> None:
+        for value in self.values:
+            expected = self.literal_eval(value)
+            for _ in range(2):
+                result = auto_type(value)
+                assert type(result) is type(expected), value
+                assert result == expected, value
+
+    def test_non_strings(self) -> None:
+        assert auto_type(123) == 123
+        assert auto_type(None) is None
+        value = [1, 2]
+        assert auto_type(value) is value
+
+    def test_containers_are_not_shared(self) -> None:
+        first = auto_type("[1, 2, 3]")
+        first.append(4)
+        assert auto_type("[1, 2, 3]") == [1, 2, 3]